@@ -1,42 +1,124 @@
 """인증 관련 FastAPI 의존성 모듈입니다."""
 
+import time
+from typing import Any
+
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
 from jose import JWTError
-from sqlmodel import Session, select
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
 
-from app.core.db import get_session
+import app.core.db as db
+from app.core.cache import TTLCache
+from app.core.config import get_settings
 from app.core.security import decode_access_token
 from app.models.user import User
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/auth/login")
 
+_settings = get_settings()
 
-def get_current_user(token: str = Depends(oauth2_scheme), session: Session = Depends(get_session)) -> User:
-    """Bearer 토큰을 검증하고 현재 사용자를 조회합니다.
+# 검증을 마친 토큰의 클레임 캐시입니다. (키: 토큰 문자열, 토큰 만료 시각 이후로는 보관하지 않음)
+_token_claims_cache: TTLCache[str, dict[str, Any]] = TTLCache(
+    _settings.AUTH_TOKEN_CACHE_SIZE, _settings.AUTH_TOKEN_CACHE_TTL_SECONDS
+)
+
+# 사용자별 현재 토큰 버전 캐시입니다. (키: user_id, 비밀번호 변경/삭제 시 invalidate_cached_user로 지웁니다)
+_token_version_cache: TTLCache[int, int] = TTLCache(
+    _settings.AUTH_USER_CACHE_SIZE, _settings.AUTH_USER_CACHE_TTL_SECONDS
+)
 
-    초급자용 설명:
-    - Depends를 사용하면 라우트마다 인증 코드를 복붙하지 않고 공통 의존성으로 처리할 수 있습니다.
-    - Authorization 헤더에서 Bearer 토큰을 읽어 JWT를 검증한 뒤 user를 DB에서 불러옵니다.
-    """
 
-    credentials_error = HTTPException(
+def _credentials_error() -> HTTPException:
+    """인증 실패 시 사용할 401 예외를 만듭니다."""
+
+    return HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Invalid authentication credentials",
         headers={"WWW-Authenticate": "Bearer"},
     )
 
+
+def _verified_claims(token: str) -> dict[str, Any]:
+    """JWT 서명/만료를 검증한 클레임을 반환합니다.
+
+    - 같은 토큰이 다시 오면(예: Job 폴링) 서명 검증 없이 캐시된 클레임을 씁니다.
+    - 캐시 유효 시간은 토큰의 exp까지로 제한하므로 만료된 토큰은 다시 검증 단계에서 거절됩니다.
+    """
+
+    claims = _token_claims_cache.get(token)
+    if claims is not None:
+        return claims
+
     try:
-        payload = decode_access_token(token)
-        user_id = payload.get("sub")
-        if user_id is None:
-            raise credentials_error
+        claims = decode_access_token(token)
     except JWTError:
-        raise credentials_error
+        raise _credentials_error()
+    if claims.get("sub") is None:
+        raise _credentials_error()
+
+    expires_at = claims.get("exp")
+    if isinstance(expires_at, (int, float)):
+        _token_claims_cache.set(token, claims, ttl_seconds=expires_at - time.time())
+    return claims
+
+
+def _user_id_from_claims(claims: dict[str, Any]) -> int:
+    """검증된 클레임의 sub에서 사용자 id를 반환합니다."""
+
+    try:
+        return int(claims["sub"])
+    except ValueError:
+        raise _credentials_error()
+
+
+def _check_token_version(claims: dict[str, Any], token_version: int) -> None:
+    """토큰의 ver가 사용자의 현재 token_version과 다르면(비밀번호 변경 등) 401을 발생시킵니다.
+
+    - ver가 없는 예전 토큰은 버전 0으로 취급합니다.
+    """
+
+    if claims.get("ver", 0) != token_version:
+        raise _credentials_error()
+
+
+def invalidate_cached_user(user_id: int) -> None:
+    """비밀번호 변경/계정 삭제처럼 사용자 정보가 바뀌면 호출합니다."""
+
+    _token_version_cache.pop(user_id)
+
+
+def clear_auth_caches() -> None:
+    """토큰 클레임/토큰 버전 캐시를 모두 비웁니다. (테스트, 비밀키 교체 시 사용)"""
+
+    _token_claims_cache.clear()
+    _token_version_cache.clear()
+
+
+async def get_current_user_id(token: str = Depends(oauth2_scheme)) -> int:
+    """검증된 토큰에서 현재 사용자 id만 꺼내는 가벼운 의존성입니다.
+
+    초급자용 설명:
+    - 대부분의 라우트는 user.id만 필요하므로 User 행 전체를 읽지 않습니다.
+    - 토큰 서명/만료는 검증 결과 캐시로, 비밀번호 변경 여부는 사용자별 토큰 버전 캐시로 확인합니다.
+      캐시가 비었을 때만 token_version 컬럼 하나를 조회합니다.
+    - 조회는 요청 세션이 아닌 짧은 전용 세션으로 하고 바로 닫습니다. 요청 세션을 쓰면 롱폴링/SSE/업로드처럼
+      오래 걸리는 요청 동안 트랜잭션(SQLite에서는 읽기 스냅샷)과 커넥션을 붙잡게 됩니다.
+    - 다른 워커에서 비밀번호를 바꾼 경우, 이 워커는 버전 캐시 TTL(AUTH_USER_CACHE_TTL_SECONDS)이
+      지난 뒤부터 이전 토큰을 거절합니다.
+    """
 
-    result = session.exec(select(User).where(User.id == int(user_id)))
-    user = result.first()
-    if not user:
-        raise credentials_error
+    claims = _verified_claims(token)
+    user_id = _user_id_from_claims(claims)
+    token_version = _token_version_cache.get(user_id)
+    if token_version is None:
+        async with AsyncSession(db.get_async_engine()) as session:
+            result = await session.exec(select(User.token_version).where(User.id == user_id))
+            token_version = result.first()
+        if token_version is None:
+            raise _credentials_error()
+        _token_version_cache.set(user_id, token_version)
 
-    return user
+    _check_token_version(claims, token_version)
+    return user_id
@@ -4,15 +4,22 @@ from datetime import timedelta
 
 from fastapi import APIRouter, Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
-from sqlmodel import Session, select
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
 
-from app.api.dependencies.auth import get_current_user
+from app.api.dependencies.auth import get_current_user_id, invalidate_cached_user
 from app.core.config import get_settings
-from app.core.db import get_session
-from app.core.security import create_access_token, get_password_hash, verify_password
+from app.core.db import get_async_session
+from app.core.security import (
+    create_access_token,
+    hash_password_async,
+    password_needs_rehash,
+    verify_password_async,
+)
 from app.models.notification import NotificationSettings
 from app.models.user import User
 from app.schemas.user import UserCreate, UserRead
+from app.services.notification_offsets import sync_offsets_from_settings
 from pydantic import BaseModel, EmailStr
 
 router = APIRouter(prefix="/auth", tags=["auth"])
@@ -42,30 +49,32 @@ class ChangePasswordRequest(BaseModel):
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/auth/login")
 
 
-def _get_user_by_email(session: Session, email: str) -> User | None:
+async def _get_user_by_email(session: AsyncSession, email: str) -> User | None:
     """이메일로 사용자 조회 후 반환합니다."""
 
-    result = session.exec(select(User).where(User.email == email))
+    result = await session.exec(select(User).where(User.email == email))
     return result.first()
 
 
+# 인증 라우트는 비밀번호 해시를 전용 스레드 풀(app.core.security)에서 기다리도록 async로 둡니다.
+# 요청 스레드풀을 점유하지 않으므로 로그인이 몰려도 다른 라우트가 밀리지 않습니다.
 @router.post("/register", response_model=UserRead, status_code=status.HTTP_201_CREATED)
-def register(user_in: UserCreate, session: Session = Depends(get_session)) -> UserRead:
+async def register(user_in: UserCreate, session: AsyncSession = Depends(get_async_session)) -> UserRead:
     """회원가입 엔드포인트.
 
     - 이메일 중복 검사 후 비밀번호를 해시해 저장합니다.
     - 가입 직후 NotificationSettings 기본 레코드를 생성합니다.
     """
 
-    existing = _get_user_by_email(session, user_in.email)
+    existing = await _get_user_by_email(session, user_in.email)
     if existing:
         raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail="Email already registered")
 
-    password_hash = get_password_hash(user_in.password)
+    password_hash = await hash_password_async(user_in.password)
     user = User(email=user_in.email, password_hash=password_hash)
     session.add(user)
-    session.commit()
-    session.refresh(user)
+    await session.commit()
+    await session.refresh(user)
 
     # 가입 시 기본 알림 설정을 함께 생성 (1:1, 중복 방지)
     settings = NotificationSettings(
@@ -76,52 +85,66 @@ def register(user_in: UserCreate, session: Session = Depends(get_session)) -> Us
         refund_days_before="[3]",
     )
     session.add(settings)
-    session.commit()
+    await session.run_sync(sync_offsets_from_settings, settings)
+    await session.commit()
 
     return user
 
 
 @router.post("/login", response_model=TokenResponse)
-def login(
+async def login(
     login_req: LoginRequest,
-    session: Session = Depends(get_session),
+    session: AsyncSession = Depends(get_async_session),
 ) -> TokenResponse:
-    """로그인 엔드포인트 (JSON 바디)."""
+    """로그인 엔드포인트 (JSON 바디).
+
+    - 저장된 해시의 비용(반복 횟수)이 현재 설정과 다르면, 맞는 비밀번호를 받은 김에 새 비용으로 다시 해시합니다.
+    """
 
     # JSON 바디로 받은 이메일/비밀번호를 검증합니다.
-    user = _get_user_by_email(session, login_req.email)
-    if not user or not verify_password(login_req.password, user.password_hash):
+    user = await _get_user_by_email(session, login_req.email)
+    if not user or not await verify_password_async(login_req.password, user.password_hash):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid credentials",
         )
 
+    if password_needs_rehash(user.password_hash):
+        user.password_hash = await hash_password_async(login_req.password)
+        session.add(user)
+        await session.commit()
+
     settings = get_settings()
     access_token_expires = timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
+    # ver: 비밀번호 변경 시 이전 토큰을 무효화하기 위한 사용자별 토큰 버전입니다.
     token = create_access_token(
-        {"sub": str(user.id), "email": user.email},
+        {"sub": str(user.id), "email": user.email, "ver": user.token_version},
         expires_delta=access_token_expires,
     )
     return TokenResponse(access_token=token, token_type="bearer")
 
 
 @router.post("/change-password", status_code=status.HTTP_200_OK)
-def change_password(
+async def change_password(
     payload: ChangePasswordRequest,
-    current_user: User = Depends(get_current_user),
-    session: Session = Depends(get_session),
+    current_user_id: int = Depends(get_current_user_id),
+    session: AsyncSession = Depends(get_async_session),
 ) -> dict[str, str]:
     """비밀번호 변경 엔드포인트.
 
     - 현재 비밀번호를 확인한 뒤 새 비밀번호로 교체합니다.
     - 토큰만 있다고 해서 바로 변경하지 못하도록 현재 비밀번호 검증 단계를 둡니다.
+    - 변경 후에는 기존 토큰이 모두 무효가 되므로 다시 로그인해야 합니다.
     """
 
-    if not verify_password(payload.current_password, current_user.password_hash):
+    user = await session.get(User, current_user_id)
+    if user is None or not await verify_password_async(payload.current_password, user.password_hash):
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Current password is incorrect")
 
-    current_user.password_hash = get_password_hash(payload.new_password)
-    session.add(current_user)
-    session.commit()
-    session.refresh(current_user)
+    user.password_hash = await hash_password_async(payload.new_password)
+    # 토큰 버전을 올려 이 시점 이전에 발급된 토큰을 모두 무효화합니다.
+    user.token_version += 1
+    session.add(user)
+    await session.commit()
+    invalidate_cached_user(user.id)
     return {"detail": "Password changed successfully"}
@@ -3,31 +3,49 @@
 초급자용 설명:
 - 무료 PaaS 환경에서는 외부 cron이 HTTP로 호출하는 방식을 사용합니다.
 - CRON_SECRET 검증을 통과한 요청만 처리합니다.
+- 한 번의 호출은 정해진 수의 사용자만 처리하므로, 응답의 done이 false면 다시 호출합니다.
 """
 
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlmodel import Session
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from sqlmodel.ext.asyncio.session import AsyncSession
 
 from app.api.dependencies.cron import verify_cron_secret
-from app.core.db import get_session
+from app.core.db import get_async_session
+from app.core.time import alert_today
 from app.services.notification_service import run_daily_alerts
 
 router = APIRouter(prefix="/internal/cron", tags=["cron"])
 
+# 한 번의 호출에서 처리할 수 있는 최대 사용자 수입니다.
+MAX_CHUNK_SIZE = 1000
+
 
 @router.post("/daily-alerts")
 # 일일 알림을 계산/발송하는 트리거 엔드포인트입니다.
 async def trigger_daily_alerts(
+    chunk_size: int | None = Query(None, ge=1, le=MAX_CHUNK_SIZE),
+    user_id_min: int | None = Query(None, ge=1),
+    user_id_max: int | None = Query(None, ge=1),
     _: None = Depends(verify_cron_secret),
-    session: Session = Depends(get_session),
+    session: AsyncSession = Depends(get_async_session),
 ) -> dict[str, object]:
     """일일 알림 트리거 엔드포인트입니다.
 
-    - 알림 계산과 전송을 수행한 뒤 요약 결과만 반환합니다.
+    - 알림 대상 사용자를 chunk_size명까지 계산/전송한 뒤 요약 결과만 반환합니다.
+    - done이 false면 같은 요청을 다시 보내 이전 호출이 멈춘 cursor 다음부터 이어서 처리합니다.
+    - user_id_min/user_id_max로 사용자 범위를 나눠 여러 cron에서 병렬로 호출할 수 있습니다.
     - 민감정보/상세 목록은 반환하지 않습니다.
+    - 비동기 세션을 사용하므로 DB 작업 중에도 이벤트 루프(다른 요청 처리)를 막지 않습니다.
+    - 기준 날짜는 내장 스케줄러와 같은 SCHEDULER_TIMEZONE의 오늘입니다.
     """
     try:
-        summary = await run_daily_alerts(session)
+        summary = await run_daily_alerts(
+            session,
+            today=alert_today(),
+            chunk_size=chunk_size,
+            user_id_min=user_id_min,
+            user_id_max=user_id_max,
+        )
     except Exception as exc:  # 복구 가능한 수준에서만 오류를 포장
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -44,4 +62,6 @@ async def trigger_daily_alerts(
         "telegram_sent": summary.telegram_sent,
         "skipped": summary.skipped,
         "errors": summary.errors,
+        "done": summary.done,
+        "cursor": summary.cursor,
     }
@@ -2,30 +2,31 @@
 
 from __future__ import annotations
 
-import os
-import shutil
-import uuid
 from pathlib import Path
 
-from fastapi import APIRouter, BackgroundTasks, Depends, File, HTTPException, UploadFile, status
-from sqlmodel import Session
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Request, status
+from sqlmodel.ext.asyncio.session import AsyncSession
 
-from app.api.dependencies.auth import get_current_user
+import app.core.db as db
+from app.api.dependencies.auth import get_current_user_id
 from app.core.config import get_settings
-from app.core.db import get_session
 from app.extractors.llm import LLMFieldExtractor, build_llm_extractor
 from app.models.document import Document
 from app.models.job import DocumentProcessingJob
-from app.models.user import User
 from app.ocr.base import OCRClient
 from app.ocr.external import build_ocr_client
-from app.schemas.document import DocumentUploadResponse
-from app.services.document_processing import process_document_job
+from app.schemas.document import DocumentBatchUploadResponse, DocumentUploadResponse
+from app.services.document_processing import process_document_job, process_document_jobs
+from app.services.upload_storage import StoredUpload, UploadFormatError, UploadTooLargeError, receive_uploads
 
 router = APIRouter(prefix="/documents", tags=["documents"])
 
 MAX_UPLOAD_BYTES = 10 * 1024 * 1024
 
+# 일괄 업로드 한 번에 받을 수 있는 최대 파일 수와 요청 본문 전체 크기입니다.
+MAX_BATCH_FILES = 500
+MAX_BATCH_UPLOAD_BYTES = 500 * 1024 * 1024
+
 
 # OCR 클라이언트를 의존성으로 제공합니다.
 def get_ocr_client() -> OCRClient:
@@ -48,21 +49,69 @@ def _ensure_upload_dir(path_str: str) -> Path:
     return path
 
 
-def _get_upload_size(upload: UploadFile) -> int:
-    """업로드 파일 크기를 바이트 단위로 확인합니다."""
-    file_obj = upload.file
-    file_obj.seek(0, os.SEEK_END)
-    size = file_obj.tell()
-    file_obj.seek(0)
-    return size
-
-
-@router.post("/upload", response_model=DocumentUploadResponse, status_code=status.HTTP_202_ACCEPTED)
-def upload_document(
+# 요청 본문의 파일 파트를 스트리밍으로 저장하고, 오류를 HTTP 응답으로 바꿉니다.
+async def _receive_files(
+    request: Request,
+    field_name: str,
+    max_files: int,
+    max_body_bytes: int | None = None,
+    too_large_detail: str = "File is too large (max 10MB).",
+) -> list[StoredUpload]:
+    """크기 초과는 413, 형식 오류는 400, 파일이 없으면 422를 반환합니다."""
+    upload_dir = _ensure_upload_dir(get_settings().DOCUMENT_UPLOAD_DIR)
+    try:
+        uploads = await receive_uploads(
+            request,
+            upload_dir,
+            field_name=field_name,
+            max_file_bytes=MAX_UPLOAD_BYTES,
+            max_files=max_files,
+            max_body_bytes=max_body_bytes,
+        )
+    except UploadTooLargeError:
+        raise HTTPException(status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE, detail=too_large_detail)
+    except UploadFormatError as exc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc))
+    if not uploads:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=f"Multipart field '{field_name}' with a file is required.",
+        )
+    return uploads
+
+
+# OpenAPI 문서에 multipart 요청 본문 형식을 표시합니다. (본문을 직접 읽으므로 자동 생성되지 않습니다)
+def _multipart_openapi(field_name: str, multiple: bool) -> dict:
+    """Swagger UI에서 파일 선택 폼이 보이도록 requestBody 스키마를 만듭니다."""
+    file_schema = {"type": "string", "format": "binary"}
+    if multiple:
+        file_schema = {"type": "array", "items": file_schema}
+    return {
+        "requestBody": {
+            "required": True,
+            "content": {
+                "multipart/form-data": {
+                    "schema": {
+                        "type": "object",
+                        "properties": {field_name: file_schema},
+                        "required": [field_name],
+                    }
+                }
+            },
+        }
+    }
+
+
+@router.post(
+    "/upload",
+    response_model=DocumentUploadResponse,
+    status_code=status.HTTP_202_ACCEPTED,
+    openapi_extra=_multipart_openapi("file", multiple=False),
+)
+async def upload_document(
+    request: Request,
     background_tasks: BackgroundTasks,
-    file: UploadFile = File(...),
-    session: Session = Depends(get_session),
-    current_user: User = Depends(get_current_user),
+    current_user_id: int = Depends(get_current_user_id),
     ocr_client: OCRClient = Depends(get_ocr_client),
     llm_extractor: LLMFieldExtractor = Depends(get_llm_extractor),
 ) -> DocumentUploadResponse:
@@ -71,57 +120,119 @@ def upload_document(
     초급자용 설명:
     - 업로드는 202로 즉시 응답하고, 실제 OCR/추출 처리는 백그라운드에서 수행합니다.
     - 무료 PaaS의 요청 타임아웃을 피하기 위해 비동기 처리 구조를 사용합니다.
+    - 본문은 임시 파일 없이 최종 경로로 바로 스트리밍 저장하며, 10MB를 넘는 순간 413으로 중단합니다.
+    - DB 세션은 본문을 다 받은 뒤에 열어, 느린 업로드 동안 커넥션/트랜잭션을 붙잡지 않습니다.
+    - 레코드 저장에 실패하면 방금 저장한 파일을 지웁니다.
     """
-    settings = get_settings()
-    upload_dir = _ensure_upload_dir(settings.DOCUMENT_UPLOAD_DIR)
-    file_size = _get_upload_size(file)
-    if file_size > MAX_UPLOAD_BYTES:
-        file.file.close()
-        raise HTTPException(
-            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
-            detail="File is too large (max 10MB).",
-        )
-    suffix = Path(file.filename or "upload.bin").suffix or ".bin"
-    safe_name = f"{uuid.uuid4().hex}{suffix}"
-    file_path = upload_dir / safe_name
-
-    # 파일을 로컬 디스크에 저장합니다.
-    try:
-        with file_path.open("wb") as buffer:
-            shutil.copyfileobj(file.file, buffer)
-    finally:
-        file.file.close()
-
-    # Document 레코드를 먼저 생성합니다.
-    document = Document(
-        user_id=current_user.id,
-        title=file.filename,
-        image_path=str(file_path),
-        raw_text="",
-    )
-    session.add(document)
-    session.commit()
-    session.refresh(document)
-
-    # Job 레코드를 생성합니다.
-    job = DocumentProcessingJob(
-        user_id=current_user.id,
-        document_id=document.id,
-        status="pending",
-    )
-    session.add(job)
-    session.commit()
-    session.refresh(job)
+    (upload,) = await _receive_files(request, "file", max_files=1)
+    file_path = upload.path
+
+    # Document와 Job 레코드를 한 트랜잭션으로 생성합니다.
+    async with AsyncSession(db.get_async_engine(), expire_on_commit=False) as session:
+        try:
+            document = Document(
+                user_id=current_user_id,
+                title=upload.filename,
+                image_path=str(file_path),
+                content_hash=upload.content_hash,
+                raw_text="",
+            )
+            session.add(document)
+            await session.flush()
+
+            job = DocumentProcessingJob(
+                user_id=current_user_id,
+                document_id=document.id,
+                status="pending",
+            )
+            session.add(job)
+            await session.commit()
+        except Exception:
+            await session.rollback()
+            file_path.unlink(missing_ok=True)
+            raise
 
     # 백그라운드에서 OCR/추출 파이프라인을 실행합니다.
     background_tasks.add_task(
         process_document_job,
         job_id=job.id,
         document_id=document.id,
-        user_id=current_user.id,
+        user_id=current_user_id,
         image_path=str(file_path),
         ocr_client=ocr_client,
         llm_extractor=llm_extractor,
     )
 
     return DocumentUploadResponse(job_id=job.id, document_id=document.id, status=job.status)
+
+
+@router.post(
+    "/upload-batch",
+    response_model=DocumentBatchUploadResponse,
+    status_code=status.HTTP_202_ACCEPTED,
+    openapi_extra=_multipart_openapi("files", multiple=True),
+)
+async def upload_documents_batch(
+    request: Request,
+    background_tasks: BackgroundTasks,
+    current_user_id: int = Depends(get_current_user_id),
+    ocr_client: OCRClient = Depends(get_ocr_client),
+    llm_extractor: LLMFieldExtractor = Depends(get_llm_extractor),
+) -> DocumentBatchUploadResponse:
+    """여러 파일을 한 번에 업로드하고 파일마다 문서 처리 Job을 생성합니다.
+
+    초급자용 설명:
+    - multipart의 files 필드로 최대 MAX_BATCH_FILES개(파일당 10MB)를 받습니다.
+    - 모든 Document/Job을 한 트랜잭션에서 묶음 INSERT로 만들고, 처리도 한 묶음의 백그라운드 작업으로 등록합니다.
+    - 하나라도 제한을 넘거나 저장에 실패하면 이번 요청에서 저장한 파일을 모두 지우고 아무 Job도 만들지 않습니다.
+    - DB 세션은 모든 파일을 다 받은 뒤에 엽니다.
+    """
+    uploads = await _receive_files(
+        request,
+        "files",
+        max_files=MAX_BATCH_FILES,
+        max_body_bytes=MAX_BATCH_UPLOAD_BYTES,
+        too_large_detail="Upload is too large (max 10MB per file, 500MB per request).",
+    )
+
+    documents = [
+        Document(
+            user_id=current_user_id,
+            title=upload.filename,
+            image_path=str(upload.path),
+            content_hash=upload.content_hash,
+            raw_text="",
+        )
+        for upload in uploads
+    ]
+    async with AsyncSession(db.get_async_engine(), expire_on_commit=False) as session:
+        try:
+            # flush 한 번에 여러 행을 INSERT하고(RETURNING으로 id를 받아) Job의 document_id를 채웁니다.
+            session.add_all(documents)
+            await session.flush()
+            jobs = [
+                DocumentProcessingJob(user_id=current_user_id, document_id=document.id, status="pending")
+                for document in documents
+            ]
+            session.add_all(jobs)
+            await session.commit()
+        except Exception:
+            await session.rollback()
+            for upload in uploads:
+                upload.path.unlink(missing_ok=True)
+            raise
+
+    background_tasks.add_task(
+        process_document_jobs,
+        jobs=[(job.id, job.document_id, document.image_path) for job, document in zip(jobs, documents)],
+        user_id=current_user_id,
+        ocr_client=ocr_client,
+        llm_extractor=llm_extractor,
+    )
+
+    return DocumentBatchUploadResponse(
+        items=[
+            DocumentUploadResponse(job_id=job.id, document_id=document.id, status=job.status)
+            for job, document in zip(jobs, documents)
+        ]
+    )
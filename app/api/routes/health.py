@@ -4,8 +4,10 @@ from fastapi import APIRouter, Depends
 from starlette.responses import JSONResponse, Response, StreamingResponse
 from sqlmodel import Session
 
+import app.core.db as db
+from app.api.dependencies.cron import verify_cron_secret
 from app.core.config import get_settings
-from app.core.db import get_session
+from app.core.db import get_session, pool_status
 from app.core.health import check_db_health
 
 router = APIRouter(prefix="/health", tags=["health"])
@@ -17,12 +19,25 @@ def health_check(session: Session = Depends(get_session)) -> dict:
     """서비스가 살아있는지 간단히 확인하는 엔드포인트입니다.
 
     - DB 연결이 살아있는지도 함께 확인합니다.
-    - 인증 없이 호출 가능한 공개 헬스 체크입니다.
+    - 인증 없이 호출 가능한 공개 헬스 체크이므로 상태 값만 반환합니다.
     """
     db_status = "ok" if check_db_health(session) else "error"
     return {"status": "ok", "db": db_status}
 
 
+@router.get("/db-pool", summary="DB 커넥션 풀 사용 현황", dependencies=[Depends(verify_cron_secret)])
+def health_db_pool() -> dict:
+    """API/백그라운드 작업 커넥션 풀 사용률을 반환합니다. (풀 고갈 감시용)
+
+    - 내부 용량 정보이므로 cron과 같은 X-CRON-SECRET 헤더가 있어야 조회할 수 있습니다.
+    """
+    pools = {"api": pool_status(db.engine), "api_async": pool_status(db.get_async_engine().sync_engine)}
+    worker_engine = db.get_worker_engine()
+    if worker_engine is not db.engine:
+        pools["worker"] = pool_status(worker_engine)
+    return {"db_pool": pools}
+
+
 # prod 환경에서는 테스트용 라우트를 등록하지 않습니다.
 if _settings.APP_ENV.lower() != "prod":
     # 텍스트 응답을 반환하는 헬스 체크입니다.
@@ -2,36 +2,180 @@
 
 from __future__ import annotations
 
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlmodel import Session, select
+import asyncio
+import json
+import time
+from typing import AsyncIterator
 
-from app.api.dependencies.auth import get_current_user
-from app.core.db import get_session
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import StreamingResponse
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+import app.core.db as db
+from app.api.dependencies.auth import get_current_user_id
+from app.core.etag import cache_headers, is_not_modified, make_etag, not_modified_response
+from app.core.job_events import job_event_bus
+from app.core.redaction import redact_in_structure
 from app.models.job import DocumentProcessingJob
-from app.models.user import User
 from app.schemas.job import DocumentJobRead
 
 router = APIRouter(prefix="/jobs", tags=["jobs"])
 
+# 더 이상 상태가 바뀌지 않는 Job 상태 목록입니다.
+TERMINAL_STATUSES = {"completed", "failed"}
+
+# 롱폴링 최대 대기 시간(초)입니다.
+MAX_WAIT_SECONDS = 60
+
+# SSE 스트림 최대 유지 시간(초)과 keep-alive 주기(초)입니다.
+SSE_MAX_SECONDS = 300
+SSE_KEEPALIVE_SECONDS = 15
+
+# 다른 프로세스에서 바뀐 상태를 놓치지 않도록 DB를 다시 읽는 주기(초)입니다.
+DB_POLL_FALLBACK_SECONDS = 1.0
+
 
 # 현재 사용자 소유의 Job을 조회하는 헬퍼입니다.
-def _get_job_for_user(session: Session, job_id: int, user_id: int) -> DocumentProcessingJob | None:
+async def _get_job_for_user(session: AsyncSession, job_id: int, user_id: int) -> DocumentProcessingJob | None:
     """user_id 기준으로 Job을 조회합니다."""
     statement = select(DocumentProcessingJob).where(
         DocumentProcessingJob.id == job_id,
         DocumentProcessingJob.user_id == user_id,
     )
-    return session.exec(statement).first()
+    return (await session.exec(statement)).first()
+
+
+# 짧은 세션으로 Job을 읽어 옵니다.
+async def _load_job(job_id: int, user_id: int) -> DocumentProcessingJob | None:
+    """대기 중 커넥션/트랜잭션을 붙잡지 않도록 조회마다 새 비동기 세션을 사용합니다.
+
+    - 롱폴링/SSE가 DB를 다시 읽을 때도 스레드풀을 거치지 않습니다.
+    """
+    async with AsyncSession(db.get_async_engine()) as session:
+        return await _get_job_for_user(session, job_id, user_id)
+
+
+# Job 상태 버전을 나타내는 ETag를 만듭니다.
+def _job_etag(job: DocumentProcessingJob) -> str:
+    """상태/연결 제품/수정 시각이 바뀌면 달라지는 ETag를 반환합니다."""
+    return make_etag("job", job.id, job.status, job.product_id, job.updated_at)
+
+
+# Job 상태가 바뀔 때마다 최신 Job을 돌려주는 비동기 제너레이터입니다.
+async def _watch_job(
+    job: DocumentProcessingJob,
+    user_id: int,
+    known_etag: str | None,
+    timeout: float,
+) -> AsyncIterator[DocumentProcessingJob | None]:
+    """ETag가 known_etag와 달라질 때마다 Job을, 대기 주기마다 변화가 없으면 None을 yield 합니다.
+
+    초급자용 설명:
+    - 같은 프로세스의 변경은 이벤트 버스로 즉시 깨어나고,
+      다른 프로세스의 변경은 DB_POLL_FALLBACK_SECONDS 주기로 DB를 읽어 감지합니다.
+    - Job이 종료 상태가 되거나 timeout이 지나면 끝납니다.
+    """
+    deadline = time.monotonic() + timeout
+    with job_event_bus.subscribe(job.id) as changed:
+        while True:
+            current_etag = _job_etag(job)
+            if current_etag != known_etag:
+                known_etag = current_etag
+                yield job
+            if job.status in TERMINAL_STATUSES:
+                return
+
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return
+            try:
+                await asyncio.wait_for(changed.wait(), timeout=min(DB_POLL_FALLBACK_SECONDS, remaining))
+            except asyncio.TimeoutError:
+                yield None
+            changed.clear()
+
+            refreshed = await _load_job(job.id, user_id)
+            if refreshed is None:
+                return
+            job = refreshed
+
+
+# Job을 SSE 이벤트 문자열로 변환합니다.
+def _format_sse_event(job: DocumentProcessingJob, etag: str) -> str:
+    """응답 미들웨어를 거치지 않으므로 여기서 직접 민감정보를 마스킹합니다."""
+    payload = redact_in_structure(jsonable_encoder(DocumentJobRead.from_orm(job)))
+    data = json.dumps(payload, ensure_ascii=False)
+    return f"id: {etag}\nevent: status\ndata: {data}\n\n"
 
 
 @router.get("/{job_id}", response_model=DocumentJobRead)
-def get_job(
+async def get_job(
     job_id: int,
-    session: Session = Depends(get_session),
-    current_user: User = Depends(get_current_user),
-) -> DocumentProcessingJob:
-    """Job 상태를 반환합니다."""
-    job = _get_job_for_user(session, job_id, current_user.id)
+    request: Request,
+    response: Response,
+    wait: int = Query(0, ge=0, le=MAX_WAIT_SECONDS),
+    current_user_id: int = Depends(get_current_user_id),
+) -> DocumentProcessingJob | Response:
+    """Job 상태를 반환합니다.
+
+    - 폴링 클라이언트가 If-None-Match를 보내면 상태가 바뀌지 않은 경우 304로 응답합니다.
+    - wait=N(초)을 주면 롱폴링으로 동작합니다. If-None-Match와 다른 상태가 되거나
+      (헤더가 없으면 완료/실패 상태가 되거나) N초가 지날 때까지 응답을 보류합니다.
+    """
+    job = await _load_job(job_id, current_user_id)
     if not job:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Job not found")
+
+    if wait:
+        known_etag = request.headers.get("if-none-match")
+        async for changed in _watch_job(job, current_user_id, known_etag, timeout=wait):
+            if changed is not None:
+                job = changed
+                if known_etag is not None or job.status in TERMINAL_STATUSES:
+                    break
+
+    etag = _job_etag(job)
+    if is_not_modified(request, etag, job.updated_at):
+        return not_modified_response(etag, job.updated_at)
+    response.headers.update(cache_headers(etag, job.updated_at))
     return job
+
+
+@router.get("/{job_id}/events")
+async def stream_job_events(
+    job_id: int,
+    request: Request,
+    current_user_id: int = Depends(get_current_user_id),
+) -> StreamingResponse:
+    """Job 상태 변경을 Server-Sent Events로 스트리밍합니다.
+
+    - 연결 직후 현재 상태를 한 번 보내고, 이후 상태가 바뀔 때마다 이벤트를 보냅니다.
+    - 완료/실패 상태가 되면 스트림을 닫습니다.
+    - 재연결 시 Last-Event-ID(직전 ETag)가 같으면 같은 상태를 다시 보내지 않습니다.
+    """
+    job = await _load_job(job_id, current_user_id)
+    if not job:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Job not found")
+
+    last_event_id = request.headers.get("last-event-id")
+
+    async def _events() -> AsyncIterator[str]:
+        idle_since = time.monotonic()
+        async for changed in _watch_job(job, current_user_id, last_event_id, timeout=SSE_MAX_SECONDS):
+            if changed is not None:
+                idle_since = time.monotonic()
+                yield _format_sse_event(changed, _job_etag(changed))
+                continue
+            if await request.is_disconnected():
+                return
+            if time.monotonic() - idle_since >= SSE_KEEPALIVE_SECONDS:
+                idle_since = time.monotonic()
+                yield ": keep-alive\n\n"
+
+    return StreamingResponse(
+        _events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
@@ -6,15 +6,17 @@ from typing import Optional
 
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlmodel import Session, select
+from sqlmodel.ext.asyncio.session import AsyncSession
 
-from app.api.dependencies.auth import get_current_user
-from app.core.db import get_session
+from app.api.dependencies.auth import get_current_user_id
+from app.core.db import get_async_session, get_session
 from app.models.notification import NotificationSettings
-from app.models.user import User
 from app.schemas.notification_settings import (
     NotificationSettingsRead,
     NotificationSettingsUpdate,
 )
+from app.services.alert_schedule import refresh_user_schedule
+from app.services.notification_offsets import sync_offsets_from_settings
 
 router = APIRouter(prefix="/notification-settings", tags=["notification-settings"])
 
@@ -32,25 +34,37 @@ def _list_to_json_str(value) -> str:
     return json.dumps(value) if not isinstance(value, str) else value
 
 
+def _create_default_settings(session: Session, user_id: int) -> NotificationSettings:
+    """기본 알림 설정을 만들고 오프셋/발송 일정까지 같은 트랜잭션에서 저장합니다."""
+
+    settings = NotificationSettings(
+        user_id=user_id,
+        email_enabled=True,
+        telegram_enabled=False,
+        warranty_days_before="[30, 7, 3]",
+        refund_days_before="[3]",
+    )
+    session.add(settings)
+    sync_offsets_from_settings(session, settings)
+    refresh_user_schedule(session, user_id)
+    session.commit()
+    session.refresh(settings)
+    return settings
+
+
 @router.get("", response_model=NotificationSettingsRead)
-def read_settings(
-    session: Session = Depends(get_session),
-    current_user: User = Depends(get_current_user),
+async def read_settings(
+    session: AsyncSession = Depends(get_async_session),
+    current_user_id: int = Depends(get_current_user_id),
 ) -> NotificationSettings:
-    """사용자 알림 설정을 조회합니다. 없으면 기본값으로 생성합니다."""
+    """사용자 알림 설정을 조회합니다. 없으면 기본값으로 생성합니다.
+
+    - 대부분의 호출은 조회만 하므로 비동기 세션으로 읽고, 최초 생성 시에만 동기 헬퍼를 run_sync로 실행합니다.
+    """
 
-    settings = _get_settings_for_user(session, current_user.id)
+    settings = await session.run_sync(_get_settings_for_user, current_user_id)
     if not settings:
-        settings = NotificationSettings(
-            user_id=current_user.id,
-            email_enabled=True,
-            telegram_enabled=False,
-            warranty_days_before="[30, 7, 3]",
-            refund_days_before="[3]",
-        )
-        session.add(settings)
-        session.commit()
-        session.refresh(settings)
+        settings = await session.run_sync(_create_default_settings, current_user_id)
     return settings
 
 
@@ -58,11 +72,11 @@ def read_settings(
 def update_settings(
     payload: NotificationSettingsUpdate,
     session: Session = Depends(get_session),
-    current_user: User = Depends(get_current_user),
+    current_user_id: int = Depends(get_current_user_id),
 ) -> NotificationSettings:
     """사용자 알림 설정을 수정합니다."""
 
-    settings = _get_settings_for_user(session, current_user.id)
+    settings = _get_settings_for_user(session, current_user_id)
     if not settings:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Notification settings not found")
 
@@ -78,6 +92,10 @@ def update_settings(
 
     settings.updated_at = datetime.utcnow()
     session.add(settings)
+    # 알림 계산용 정규화 테이블과 발송 일정도 같은 트랜잭션에서 갱신합니다.
+    if "warranty_days_before" in data or "refund_days_before" in data:
+        sync_offsets_from_settings(session, settings)
+        refresh_user_schedule(session, current_user_id)
     session.commit()
     session.refresh(settings)
     return settings
@@ -1,19 +1,64 @@
 """제품(영수증/보증서 기반 엔티티) 관련 라우터입니다."""
 
-from datetime import datetime
-from typing import List
+from datetime import date, datetime
+from typing import List, Literal
 
-from fastapi import APIRouter, Depends, HTTPException, Response, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+from sqlalchemy import and_, func, or_
+from sqlalchemy.orm import load_only
 from sqlmodel import Session, select
+from sqlmodel.ext.asyncio.session import AsyncSession
 
-from app.api.dependencies.auth import get_current_user
-from app.core.db import get_session
+from app.api.dependencies.auth import get_current_user_id
+from app.core.db import get_async_session, get_session
+from app.core.etag import cache_headers, is_not_modified, make_etag, not_modified_response
+from app.core.pagination import InvalidCursorError, decode_cursor, encode_cursor
 from app.models.product import Product
-from app.models.user import User
-from app.schemas.product import ProductCreate, ProductRead, ProductUpdate
+from app.schemas.product import ProductCreate, ProductRead, ProductSummary, ProductUpdate
+from app.services.alert_schedule import refresh_product_schedule, remove_product_schedule
+from app.services.search_index import index_product, remove_product, search_product_ids
 
 router = APIRouter(prefix="/products", tags=["products"])
 
+# 목록 조회 한 페이지의 기본/최대 개수입니다. (기본값은 cursor만 보내고 limit을 생략했을 때 사용)
+DEFAULT_PAGE_LIMIT = 50
+MAX_PAGE_LIMIT = 200
+
+# 다음 페이지 커서를 전달하는 응답 헤더 이름입니다.
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+# 키셋 페이지네이션에 사용할 수 있는 정렬 컬럼입니다. (NULL이 없는 컬럼만 허용)
+_SORT_COLUMNS = {
+    "updated_at": Product.updated_at,
+    "created_at": Product.created_at,
+}
+
+# fields 파라미터로 요청할 수 있는 필드 목록입니다.
+_PROJECTABLE_FIELDS = tuple(ProductRead.__fields__)
+
+
+def _resolve_projection(fields: str | None, view: str) -> list[str] | None:
+    """fields/view 파라미터를 해석해 응답에 포함할 필드 목록을 반환합니다.
+
+    - 둘 다 지정하지 않으면 None(전체 ProductRead)을 반환합니다.
+    - id는 상세 이동/커서에 필요하므로 항상 포함합니다.
+    """
+
+    if fields:
+        requested = [name.strip() for name in fields.split(",") if name.strip()]
+        unknown = [name for name in requested if name not in _PROJECTABLE_FIELDS]
+        if unknown:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Unknown fields: {', '.join(unknown)}",
+            )
+        return ["id"] + [name for name in dict.fromkeys(requested) if name != "id"]
+    if view == "summary":
+        return list(ProductSummary.__fields__)
+    return None
+
 
 def _get_product_for_user(session: Session, product_id: int, user_id: int) -> Product | None:
     """현재 사용자 소유의 제품을 조회합니다."""
@@ -23,42 +68,196 @@ def _get_product_for_user(session: Session, product_id: int, user_id: int) -> Pr
 
 
 @router.get("", response_model=List[ProductRead])
-def list_products(
-    session: Session = Depends(get_session),
-    current_user: User = Depends(get_current_user),
-) -> List[Product]:
-    """현재 사용자 소유의 제품 목록을 반환합니다."""
+async def list_products(
+    request: Request,
+    response: Response,
+    store: str | None = None,
+    product_category: str | None = None,
+    purchase_date_from: date | None = None,
+    purchase_date_to: date | None = None,
+    warranty_end_from: date | None = None,
+    warranty_end_to: date | None = None,
+    refund_deadline_from: date | None = None,
+    refund_deadline_to: date | None = None,
+    sort: Literal["updated_at", "created_at"] = "updated_at",
+    order: Literal["desc", "asc"] = "desc",
+    limit: int | None = Query(None, ge=1, le=MAX_PAGE_LIMIT),
+    cursor: str | None = None,
+    fields: str | None = None,
+    view: Literal["full", "summary"] = "full",
+    session: AsyncSession = Depends(get_async_session),
+    current_user_id: int = Depends(get_current_user_id),
+) -> List[Product] | JSONResponse:
+    """현재 사용자 소유의 제품 목록을 페이지 단위로 반환합니다.
+
+    초급자용 설명:
+    - (정렬 컬럼, id) 키셋 페이지네이션을 사용합니다.
+    - 다음 페이지가 있으면 X-Next-Cursor 헤더에 커서를 담아 주고,
+      클라이언트는 그 값을 cursor 파라미터로 다시 보내면 됩니다.
+    - limit과 cursor를 모두 생략하면 예전처럼 전체 목록을 한 번에 반환합니다. (기존 클라이언트 호환)
+      cursor만 보내면 DEFAULT_PAGE_LIMIT개씩 반환합니다.
+    - 필터는 인덱스가 있는 컬럼(store, product_category, 날짜 컬럼)만 지원합니다.
+    - view=summary 또는 fields=a,b,c를 주면 해당 컬럼만 SQL에서 읽어 가볍게 응답합니다.
+    - 사용자별 컬렉션 버전(개수, 최신 updated_at, 최대 id)으로 ETag를 만들어, 변경이 없으면
+      목록 쿼리 자체를 건너뛰고 304를 반환합니다. (삭제 후 같은 시각에 새로 만든 경우도 id로 구분)
+    - 잘못된 커서는 304 판단보다 먼저 400으로 거절합니다.
+    - 비동기 세션을 사용하므로 DB를 기다리는 동안 스레드풀 슬롯을 점유하지 않습니다.
+    """
+
+    sort_column = _SORT_COLUMNS[sort]
+    projection = _resolve_projection(fields, view)
+    keyset = None
+    if cursor:
+        try:
+            keyset = decode_cursor(cursor, sort)
+        except InvalidCursorError:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor")
+
+    count, latest_update, max_id = (
+        await session.exec(
+            select(func.count(Product.id), func.max(Product.updated_at), func.max(Product.id)).where(
+                Product.user_id == current_user_id
+            )
+        )
+    ).one()
+    etag = make_etag("products", current_user_id, count, latest_update, max_id, request.url.query)
+    if is_not_modified(request, etag):
+        return not_modified_response(etag)
+
+    statement = select(Product).where(Product.user_id == current_user_id)
+    if projection is not None:
+        # raw_text 같은 큰 컬럼은 SELECT 대상에서 빠지도록 필요한 컬럼만 로드합니다.
+        load_columns = dict.fromkeys([*projection, sort])
+        statement = statement.options(load_only(*(getattr(Product, name) for name in load_columns)))
+
+    if store is not None:
+        statement = statement.where(Product.store == store)
+    if product_category is not None:
+        statement = statement.where(Product.product_category == product_category)
+
+    date_ranges = [
+        (Product.purchase_date, purchase_date_from, purchase_date_to),
+        (Product.warranty_end_date, warranty_end_from, warranty_end_to),
+        (Product.refund_deadline, refund_deadline_from, refund_deadline_to),
+    ]
+    for column, start, end in date_ranges:
+        if start is not None:
+            statement = statement.where(column >= start)
+        if end is not None:
+            statement = statement.where(column <= end)
 
-    result = session.exec(select(Product).where(Product.user_id == current_user.id))
-    return result.all()
+    if keyset is not None:
+        last_value, last_id = keyset
+        if order == "desc":
+            statement = statement.where(
+                or_(sort_column < last_value, and_(sort_column == last_value, Product.id < last_id))
+            )
+        else:
+            statement = statement.where(
+                or_(sort_column > last_value, and_(sort_column == last_value, Product.id > last_id))
+            )
+
+    if order == "desc":
+        statement = statement.order_by(sort_column.desc(), Product.id.desc())
+    else:
+        statement = statement.order_by(sort_column.asc(), Product.id.asc())
+
+    if limit is None and keyset is None:
+        products = (await session.exec(statement)).all()
+    else:
+        limit = limit or DEFAULT_PAGE_LIMIT
+        # 한 건을 더 읽어 다음 페이지 존재 여부를 판단합니다.
+        products = (await session.exec(statement.limit(limit + 1))).all()
+    page_headers = cache_headers(etag)
+    if limit is not None and len(products) > limit:
+        products = products[:limit]
+        last = products[-1]
+        page_headers[NEXT_CURSOR_HEADER] = encode_cursor(sort, getattr(last, sort), last.id)
+
+    if projection is None:
+        response.headers.update(page_headers)
+        return products
+
+    if fields:
+        items = [{name: getattr(product, name) for name in projection} for product in products]
+    else:
+        items = [ProductSummary.from_orm(product).dict() for product in products]
+    return JSONResponse(content=jsonable_encoder(items), headers=page_headers)
 
 
 @router.post("", response_model=ProductRead, status_code=status.HTTP_201_CREATED)
 def create_product(
     payload: ProductCreate,
     session: Session = Depends(get_session),
-    current_user: User = Depends(get_current_user),
+    current_user_id: int = Depends(get_current_user_id),
 ) -> Product:
     """제품을 생성합니다. user_id는 토큰에서 가져옵니다."""
 
-    product = Product(**payload.dict(), user_id=current_user.id)
+    product = Product(**payload.dict(), user_id=current_user_id)
     session.add(product)
+    # id를 먼저 발급받아 검색 인덱스와 같은 트랜잭션에서 커밋합니다.
+    session.flush()
+    index_product(session, product)
+    refresh_product_schedule(session, product)
     session.commit()
     session.refresh(product)
     return product
 
 
+@router.get("/search", response_model=List[ProductSummary])
+async def search_products(
+    q: str = Query(..., min_length=1, max_length=200),
+    limit: int = Query(20, ge=1, le=100),
+    session: AsyncSession = Depends(get_async_session),
+    current_user_id: int = Depends(get_current_user_id),
+) -> List[Product]:
+    """제목/구매처/카테고리/주문번호/마스킹된 원문에서 제품을 검색합니다.
+
+    - 전문 검색 인덱스로 후보 id를 찾은 뒤, 목록용 컬럼만 읽어 관련도 순으로 반환합니다.
+    """
+
+    product_ids = await session.run_sync(search_product_ids, current_user_id, q, limit=limit)
+    if not product_ids:
+        return []
+
+    statement = (
+        select(Product)
+        .where(Product.user_id == current_user_id, Product.id.in_(product_ids))
+        .options(load_only(*(getattr(Product, name) for name in ProductSummary.__fields__)))
+    )
+    by_id = {product.id: product for product in (await session.exec(statement)).all()}
+    return [by_id[product_id] for product_id in product_ids if product_id in by_id]
+
+
 @router.get("/{product_id}", response_model=ProductRead)
-def get_product(
+async def get_product(
     product_id: int,
-    session: Session = Depends(get_session),
-    current_user: User = Depends(get_current_user),
-) -> Product:
-    """단일 제품을 조회합니다."""
+    request: Request,
+    response: Response,
+    session: AsyncSession = Depends(get_async_session),
+    current_user_id: int = Depends(get_current_user_id),
+) -> Product | Response:
+    """단일 제품을 조회합니다.
+
+    - updated_at만 먼저 읽어 ETag를 비교하고, 변경이 없으면 전체 행을 읽지 않고 304를 반환합니다.
+    """
+
+    updated_at = (
+        await session.exec(
+            select(Product.updated_at).where(Product.id == product_id, Product.user_id == current_user_id)
+        )
+    ).first()
+    if updated_at is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Product not found")
+
+    etag = make_etag("product", product_id, updated_at)
+    if is_not_modified(request, etag, updated_at):
+        return not_modified_response(etag, updated_at)
 
-    product = _get_product_for_user(session, product_id, current_user.id)
+    product = await session.run_sync(_get_product_for_user, product_id, current_user_id)
     if not product:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Product not found")
+    response.headers.update(cache_headers(etag, updated_at))
     return product
 
 
@@ -67,11 +266,11 @@ def update_product(
     product_id: int,
     payload: ProductUpdate,
     session: Session = Depends(get_session),
-    current_user: User = Depends(get_current_user),
+    current_user_id: int = Depends(get_current_user_id),
 ) -> Product:
     """제품 정보를 부분 업데이트합니다."""
 
-    product = _get_product_for_user(session, product_id, current_user.id)
+    product = _get_product_for_user(session, product_id, current_user_id)
     if not product:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Product not found")
 
@@ -81,6 +280,8 @@ def update_product(
     product.updated_at = datetime.utcnow()
 
     session.add(product)
+    index_product(session, product)
+    refresh_product_schedule(session, product)
     session.commit()
     session.refresh(product)
     return product
@@ -90,14 +291,16 @@ def update_product(
 def delete_product(
     product_id: int,
     session: Session = Depends(get_session),
-    current_user: User = Depends(get_current_user),
+    current_user_id: int = Depends(get_current_user_id),
 ) -> Response:
     """제품을 삭제합니다."""
 
-    product = _get_product_for_user(session, product_id, current_user.id)
+    product = _get_product_for_user(session, product_id, current_user_id)
     if not product:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Product not found")
 
+    remove_product(session, product.id)
+    remove_product_schedule(session, product.id)
     session.delete(product)
     session.commit()
     return Response(status_code=status.HTTP_204_NO_CONTENT)
@@ -5,12 +5,13 @@ from datetime import datetime
 from fastapi import APIRouter, Depends, HTTPException, Response, status
 from sqlmodel import Session, select
 
-from app.api.dependencies.auth import get_current_user
+from app.api.dependencies.auth import get_current_user_id
 from app.core.db import get_session
 from app.models.notification import NotificationSettings
 from app.models.telegram_account import TelegramAccount
-from app.models.user import User
 from app.schemas.telegram_account import TelegramAccountCreate, TelegramAccountRead
+from app.services.alert_schedule import refresh_user_schedule
+from app.services.notification_offsets import sync_offsets_from_settings
 
 router = APIRouter(prefix="/telegram-account", tags=["telegram-account"])
 
@@ -36,6 +37,8 @@ def _get_or_create_settings(session: Session, user_id: int) -> NotificationSetti
             refund_days_before="[3]",
         )
         session.add(settings)
+        sync_offsets_from_settings(session, settings)
+        refresh_user_schedule(session, user_id)
         session.commit()
         session.refresh(settings)
     return settings
@@ -44,11 +47,11 @@ def _get_or_create_settings(session: Session, user_id: int) -> NotificationSetti
 @router.get("", response_model=TelegramAccountRead)
 def get_account(
     session: Session = Depends(get_session),
-    current_user: User = Depends(get_current_user),
+    current_user_id: int = Depends(get_current_user_id),
 ) -> TelegramAccount:
     """현재 사용자 텔레그램 연동 정보를 조회합니다."""
 
-    account = _get_account_for_user(session, current_user.id)
+    account = _get_account_for_user(session, current_user_id)
     if not account:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Telegram account not linked")
     return account
@@ -58,7 +61,7 @@ def get_account(
 def upsert_account(
     payload: TelegramAccountCreate,
     session: Session = Depends(get_session),
-    current_user: User = Depends(get_current_user),
+    current_user_id: int = Depends(get_current_user_id),
 ) -> TelegramAccount:
     """텔레그램 계정을 등록/갱신합니다. (user당 1개)"""
 
@@ -68,21 +71,21 @@ def upsert_account(
     if len(payload.chat_id.strip()) < 3:
         raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail="chat_id is too short")
 
-    account = _get_account_for_user(session, current_user.id)
+    account = _get_account_for_user(session, current_user_id)
     if account:
         account.chat_id = payload.chat_id
         account.username = payload.username
         account.linked_at = datetime.utcnow()
     else:
         account = TelegramAccount(
-            user_id=current_user.id,
+            user_id=current_user_id,
             chat_id=payload.chat_id,
             username=payload.username,
         )
         session.add(account)
 
     # 텔레그램 연동 시 알림 설정을 활성화합니다.
-    settings = _get_or_create_settings(session, current_user.id)
+    settings = _get_or_create_settings(session, current_user_id)
     settings.telegram_enabled = True
     settings.updated_at = datetime.utcnow()
     session.add(settings)
@@ -94,17 +97,17 @@ def upsert_account(
 @router.delete("", status_code=status.HTTP_204_NO_CONTENT, response_class=Response)
 def delete_account(
     session: Session = Depends(get_session),
-    current_user: User = Depends(get_current_user),
+    current_user_id: int = Depends(get_current_user_id),
 ) -> Response:
     """텔레그램 연동을 해제합니다."""
 
-    account = _get_account_for_user(session, current_user.id)
+    account = _get_account_for_user(session, current_user_id)
     if not account:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Telegram account not linked")
 
     session.delete(account)
     # 연동 해제 시 알림 설정도 비활성화합니다.
-    settings = _get_or_create_settings(session, current_user.id)
+    settings = _get_or_create_settings(session, current_user_id)
     settings.telegram_enabled = False
     settings.updated_at = datetime.utcnow()
     session.add(settings)
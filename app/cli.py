@@ -0,0 +1,114 @@
+"""운영용 관리 명령을 모아둔 CLI 모듈입니다.
+
+사용 예시:
+    uv run python -m app.cli migrate
+    uv run python -m app.cli migrate --check
+    uv run python -m app.cli rebuild-search-index
+    uv run python -m app.cli rebuild-alert-schedule
+    uv run python -m app.cli check-alert-schedule
+"""
+
+from __future__ import annotations
+
+import argparse
+from typing import Sequence
+
+from sqlmodel import Session
+
+import app.core.db as db
+from app.core.time import alert_today
+from app.models import (  # noqa: F401
+    alert_run,
+    alert_schedule,
+    document,
+    job,
+    notification,
+    product,
+    scheduler_lock,
+    schema_migration,
+    telegram_account,
+    user,
+)
+
+
+# DB 스키마 마이그레이션을 적용합니다.
+def _migrate(args: argparse.Namespace) -> int:
+    """--check면 적용하지 않고, 최신이 아니면 종료 코드 1을 반환합니다."""
+    from app.core.migrations import LATEST_VERSION, current_version, migrate
+
+    engine = db.get_worker_engine()
+    if args.check:
+        version = current_version(engine)
+        print(f"schema version {version}/{LATEST_VERSION}")
+        return 0 if version >= LATEST_VERSION else 1
+
+    applied = migrate(engine, target=args.target)
+    print(f"applied {len(applied)} migrations, schema version {current_version(engine)}/{LATEST_VERSION}")
+    return 0
+
+
+# 제품 검색 인덱스를 다시 만듭니다.
+def _rebuild_search_index(_args: argparse.Namespace) -> int:
+    """기존 제품 전체를 검색 인덱스에 백필합니다."""
+    from app.services.search_index import rebuild_search_index
+
+    with Session(db.get_worker_engine()) as session:
+        count = rebuild_search_index(session)
+    print(f"indexed {count} products")
+    return 0
+
+
+# 알림 발송 일정을 다시 만듭니다.
+def _rebuild_alert_schedule(_args: argparse.Namespace) -> int:
+    """모든 제품/알림 기준일로 alert_schedule을 다시 계산합니다. (지난 발송일은 만들지 않습니다)"""
+    from app.services.alert_schedule import rebuild_alert_schedule
+
+    with Session(db.get_worker_engine()) as session:
+        count = rebuild_alert_schedule(session, from_date=alert_today())
+    print(f"scheduled {count} alerts")
+    return 0
+
+
+# 알림 발송 일정이 실제 데이터와 일치하는지 검사합니다.
+def _check_alert_schedule(_args: argparse.Namespace) -> int:
+    """불일치가 있으면 종료 코드 1을 반환합니다."""
+    from app.services.alert_schedule import check_alert_schedule
+
+    with Session(db.get_worker_engine()) as session:
+        missing, stale = check_alert_schedule(session, from_date=alert_today())
+    print(f"missing {missing}, stale {stale}")
+    return 0 if missing == 0 and stale == 0 else 1
+
+
+# 명령행 파서를 구성합니다.
+def build_parser() -> argparse.ArgumentParser:
+    """서브커맨드별 파서를 등록합니다."""
+    parser = argparse.ArgumentParser(prog="python -m app.cli", description="ASHD 관리 명령")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    migrate = subparsers.add_parser("migrate", help="DB 스키마 마이그레이션 적용")
+    migrate.add_argument("--check", action="store_true", help="적용하지 않고 최신 여부만 확인")
+    migrate.add_argument("--target", type=int, default=None, help="이 버전까지만 적용")
+    migrate.set_defaults(handler=_migrate)
+
+    rebuild = subparsers.add_parser("rebuild-search-index", help="제품 검색 인덱스 재생성")
+    rebuild.set_defaults(handler=_rebuild_search_index)
+
+    rebuild_schedule = subparsers.add_parser("rebuild-alert-schedule", help="알림 발송 일정 재생성")
+    rebuild_schedule.set_defaults(handler=_rebuild_alert_schedule)
+
+    check_schedule = subparsers.add_parser("check-alert-schedule", help="알림 발송 일정 정합성 검사")
+    check_schedule.set_defaults(handler=_check_alert_schedule)
+
+    return parser
+
+
+# CLI 진입점입니다.
+def main(argv: Sequence[str] | None = None) -> int:
+    """인자를 해석해 해당 명령을 실행하고 종료 코드를 반환합니다."""
+    args = build_parser().parse_args(argv)
+    return args.handler(args)
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,74 @@
+"""프로세스 메모리 안에서 쓰는 크기 제한 TTL 캐시 모듈입니다.
+
+초급자용 설명:
+- 같은 값을 짧은 시간 안에 여러 번 계산/조회할 때, 결과를 잠시 메모리에 보관해 재사용합니다.
+- maxsize를 넘으면 가장 오래 쓰지 않은 항목부터 버리므로(LRU) 메모리가 무한히 늘지 않습니다.
+- 항목마다 만료 시각이 있어, 만료된 값은 꺼낼 때 지우고 없는 것으로 취급합니다.
+- 캐시는 프로세스마다 따로 있으므로, 여러 워커 사이에서는 TTL만큼 오래된 값이 보일 수 있습니다.
+"""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+import threading
+import time
+from typing import Generic, Hashable, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+# 크기 제한과 항목별 만료 시간을 가진 캐시입니다.
+class TTLCache(Generic[K, V]):
+    """maxsize개까지 보관하고, ttl_seconds가 지난 항목은 없는 것으로 취급합니다.
+
+    - 동기 의존성은 스레드풀에서 실행되므로 내부 상태는 threading.Lock으로 보호합니다.
+    - ttl_seconds 또는 maxsize가 0 이하면 아무것도 저장하지 않습니다. (캐시 끄기)
+    """
+
+    def __init__(self, maxsize: int, ttl_seconds: float) -> None:
+        self.maxsize = maxsize
+        self.ttl_seconds = ttl_seconds
+        self._items: OrderedDict[K, tuple[float, V]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    # 만료되지 않은 값을 반환합니다.
+    def get(self, key: K) -> V | None:
+        """없거나 만료됐으면 None을 반환합니다."""
+        with self._lock:
+            item = self._items.get(key)
+            if item is None:
+                return None
+            expires_at, value = item
+            if expires_at <= time.monotonic():
+                del self._items[key]
+                return None
+            self._items.move_to_end(key)
+            return value
+
+    # 값을 저장합니다.
+    def set(self, key: K, value: V, ttl_seconds: float | None = None) -> None:
+        """ttl_seconds를 주면 기본 TTL보다 짧을 때만 그 값을 사용합니다. (예: 토큰 남은 유효 시간)"""
+        ttl = self.ttl_seconds if ttl_seconds is None else min(ttl_seconds, self.ttl_seconds)
+        if ttl <= 0 or self.maxsize <= 0:
+            return
+        with self._lock:
+            self._items[key] = (time.monotonic() + ttl, value)
+            self._items.move_to_end(key)
+            while len(self._items) > self.maxsize:
+                self._items.popitem(last=False)
+
+    # 항목을 지웁니다.
+    def pop(self, key: K) -> None:
+        """없는 키여도 오류 없이 넘어갑니다."""
+        with self._lock:
+            self._items.pop(key, None)
+
+    # 모든 항목을 지웁니다.
+    def clear(self) -> None:
+        """테스트나 설정 변경 시 사용합니다."""
+        with self._lock:
+            self._items.clear()
+
+    def __len__(self) -> int:
+        return len(self._items)
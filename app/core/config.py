@@ -26,9 +26,37 @@ class AppSettings(BaseSettings):
 
     # 데이터베이스 설정 (v0.1: sync SQLite 기본, 운영 시 PostgreSQL URL로 교체 가능)
     DATABASE_URL: str = "sqlite:///./ashd.db"
+    # SQLite 성능 프로파일 (연결마다 PRAGMA로 적용, 다른 DB에서는 무시)
+    SQLITE_TUNING_ENABLED: bool = True
+    SQLITE_JOURNAL_MODE: str = "WAL"
+    SQLITE_SYNCHRONOUS: str = "NORMAL"
+    SQLITE_BUSY_TIMEOUT_MS: int = 5000
+    SQLITE_MMAP_SIZE: int = 268_435_456  # 256MiB
+    SQLITE_CACHE_SIZE: int = -65_536  # 음수는 KiB 단위 (64MiB)
+    SQLITE_TEMP_STORE: str = "MEMORY"
+    # 서버형 DB(PostgreSQL 등) 커넥션 풀 설정 (SQLite에서는 사용하지 않음)
+    DB_POOL_SIZE: int = 5
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT_SECONDS: int = 30
+    DB_POOL_PRE_PING: bool = True
+    DB_POOL_RECYCLE_SECONDS: int = 1800
+    DB_STATEMENT_TIMEOUT_MS: int = 30_000  # PostgreSQL statement_timeout, 0이면 사용 안 함
+    # 백그라운드 작업 전용 풀 (API 풀과 분리)
+    WORKER_DB_POOL_SIZE: int = 2
+    WORKER_DB_MAX_OVERFLOW: int = 2
+    # 시작 시 스키마가 뒤처져 있으면 마이그레이션을 바로 적용할지 여부 (false면 시작 실패)
+    DB_AUTO_MIGRATE: bool = True
     # JWT/토큰 설정 (v0.1: 단순 Access Token만 사용)
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 60
     JWT_ALGORITHM: str = "HS256"
+    # 비밀번호 해시 비용(pbkdf2_sha256 반복 횟수)과 해시 전용 스레드 수
+    PASSWORD_HASH_ROUNDS: int = 29_000
+    PASSWORD_HASH_WORKERS: int = 2
+    # 인증 캐시 (TTL 0이면 끄기): 검증된 토큰 클레임(토큰 만료 전까지)과 사용자별 토큰 버전
+    AUTH_TOKEN_CACHE_SIZE: int = 10_000
+    AUTH_TOKEN_CACHE_TTL_SECONDS: int = 300
+    AUTH_USER_CACHE_SIZE: int = 10_000
+    AUTH_USER_CACHE_TTL_SECONDS: int = 30
 
     # LLM 설정 (필드 보완 추출용)
     LLM_BASE_URL: Optional[str] = None
@@ -55,10 +83,33 @@ class AppSettings(BaseSettings):
     SMTP_USERNAME: Optional[str] = None
     SMTP_PASSWORD: Optional[str] = None
     SMTP_FROM: Optional[str] = None
+    # 일괄 발송 시 유지할 SMTP 연결 수와 연결당 최대 발송 수
+    SMTP_POOL_MAX_CONNECTIONS: int = 3
+    SMTP_MAX_MESSAGES_PER_CONNECTION: int = 100
 
     # 텔레그램 봇 설정
     TELEGRAM_BOT_TOKEN: Optional[str] = None
 
+    # 알림 발송 동시성/속도 제한 설정
+    ALERT_EMAIL_CONCURRENCY: int = 5
+    ALERT_TELEGRAM_CONCURRENCY: int = 10
+    # 텔레그램 권장 한도: 전체 초당 30건, 같은 채팅방에는 초당 1건
+    TELEGRAM_RATE_PER_SECOND: float = 30.0
+    TELEGRAM_PER_CHAT_INTERVAL_SECONDS: float = 1.0
+    TELEGRAM_MAX_RETRIES: int = 3
+
+    # 일일 알림 cron 한 번에 처리할 사용자 수와 실행 점유 시간(초)
+    ALERT_CHUNK_SIZE: int = 200
+    ALERT_RUN_LEASE_SECONDS: int = 600
+    # 실패한 (사용자, 채널) 전송을 같은 날 최대 몇 번까지 시도할지 (첫 시도 포함)
+    ALERT_DELIVERY_MAX_ATTEMPTS: int = 3
+
+    # 앱 내장 스케줄러 설정 (외부 cron 대신 앱 프로세스에서 일일 알림 실행)
+    SCHEDULER_ENABLED: bool = False
+    DAILY_ALERTS_TIME: str = "09:00"
+    SCHEDULER_TIMEZONE: str = "Asia/Seoul"
+    SCHEDULER_LOCK_TTL_SECONDS: int = 900
+
     class Config:
         env_file = ".env"
         env_file_encoding = "utf-8"
@@ -2,14 +2,26 @@
 
 v0.1에서는 sync SQLModel + SQLite를 사용합니다.
 추후 PostgreSQL로 전환할 때는 DATABASE_URL만 바꾸면 됩니다.
+조회 위주 비동기 라우트는 같은 DB를 가리키는 비동기 엔진(get_async_engine)과 get_async_session을 사용합니다.
+비동기 엔진은 처음 쓸 때 만들어지므로, 동기 경로만 쓰는 스크립트는 비동기 드라이버가 없어도 import할 수 있습니다.
 """
 
 from functools import lru_cache
-from typing import Generator, Optional
+from typing import AsyncGenerator, Generator
 
+from sqlalchemy import event
+from sqlalchemy.engine import Engine, make_url
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+from sqlalchemy.pool import QueuePool
 from sqlmodel import Session, SQLModel, create_engine
+from sqlmodel.ext.asyncio.session import AsyncSession
 
-from app.core.config import get_settings
+from app.core.config import AppSettings, get_settings
+
+# 설정값으로 허용하는 SQLite PRAGMA 값 목록입니다. (문자열을 그대로 SQL에 넣으므로 검증합니다)
+_SQLITE_JOURNAL_MODES = {"DELETE", "TRUNCATE", "PERSIST", "MEMORY", "WAL", "OFF"}
+_SQLITE_SYNCHRONOUS = {"OFF", "NORMAL", "FULL", "EXTRA"}
+_SQLITE_TEMP_STORE = {"DEFAULT", "FILE", "MEMORY"}
 
 
 def _is_sqlite_url(url: str) -> bool:
@@ -18,25 +30,271 @@ def _is_sqlite_url(url: str) -> bool:
     return url.startswith("sqlite")
 
 
-@lru_cache(maxsize=1)
-def get_engine():
-    """애플리케이션 전역에서 재사용할 SQLModel 엔진을 생성합니다."""
+# 설정값이 허용 목록에 있는지 확인합니다.
+def _checked_pragma(name: str, value: str, allowed: set[str]) -> str:
+    """허용되지 않은 값이면 ValueError를 발생시킵니다."""
 
-    settings = get_settings()
-    connect_args: Optional[dict[str, object]] = None
+    normalized = value.strip().upper()
+    if normalized not in allowed:
+        raise ValueError(f"invalid SQLite {name}: {value!r}")
+    return normalized
+
+
+# 새 SQLite 연결마다 실행할 PRAGMA 문 목록을 만듭니다.
+def sqlite_pragma_statements(settings: AppSettings) -> list[str]:
+    """AppSettings의 SQLITE_* 값으로 PRAGMA 문을 구성합니다.
+
+    초급자용 설명:
+    - journal_mode=WAL: 쓰기 중에도 다른 연결이 읽을 수 있어 API 조회가 백그라운드 작업에 막히지 않습니다.
+    - synchronous=NORMAL: WAL에서는 안전하면서 커밋마다 fsync하는 비용을 줄입니다.
+    - busy_timeout: 다른 연결이 쓰는 중이면 바로 "database is locked"를 내지 않고 지정 시간만큼 기다립니다.
+    - mmap_size/cache_size/temp_store: 읽기와 임시 정렬을 메모리에서 처리해 디스크 I/O를 줄입니다.
+    """
+
+    return [
+        f"PRAGMA journal_mode={_checked_pragma('journal_mode', settings.SQLITE_JOURNAL_MODE, _SQLITE_JOURNAL_MODES)}",
+        f"PRAGMA synchronous={_checked_pragma('synchronous', settings.SQLITE_SYNCHRONOUS, _SQLITE_SYNCHRONOUS)}",
+        f"PRAGMA busy_timeout={int(settings.SQLITE_BUSY_TIMEOUT_MS)}",
+        f"PRAGMA mmap_size={int(settings.SQLITE_MMAP_SIZE)}",
+        f"PRAGMA cache_size={int(settings.SQLITE_CACHE_SIZE)}",
+        f"PRAGMA temp_store={_checked_pragma('temp_store', settings.SQLITE_TEMP_STORE, _SQLITE_TEMP_STORE)}",
+    ]
+
+
+# 엔진의 connect 이벤트에 SQLite PRAGMA 적용 훅을 등록합니다.
+def apply_sqlite_pragmas(engine: Engine, settings: AppSettings) -> None:
+    """풀에서 새 DBAPI 연결이 만들어질 때마다 PRAGMA를 실행합니다."""
+
+    statements = sqlite_pragma_statements(settings)
+
+    @event.listens_for(engine, "connect")
+    def _set_sqlite_pragmas(dbapi_connection, _connection_record) -> None:
+        cursor = dbapi_connection.cursor()
+        try:
+            for statement in statements:
+                cursor.execute(statement)
+        finally:
+            cursor.close()
+
+
+def _is_postgres_url(url: str) -> bool:
+    """PostgreSQL URL 여부를 단순 검사합니다."""
+
+    return url.startswith("postgres")
+
+
+# 서버형 DB(PostgreSQL 등)용 커넥션 풀 옵션을 구성합니다.
+def _pool_options(settings: AppSettings, pool_size: int, max_overflow: int) -> dict[str, object]:
+    """pool_size/max_overflow/대기 시간/pre-ping/recycle 옵션 dict를 반환합니다.
+
+    초급자용 설명:
+    - pool_size: 평소 열어 두는 연결 수, max_overflow: 몰릴 때 추가로 여는 연결 수
+    - pool_timeout: 풀이 꽉 찼을 때 연결을 기다리는 최대 시간(초)
+    - pool_pre_ping: 꺼내기 전에 연결이 살아있는지 확인해 끊긴 연결로 인한 오류를 막습니다.
+    - pool_recycle: 오래된 연결을 주기적으로 새로 열어 DB/프록시의 유휴 연결 종료에 대비합니다.
+    """
+
+    return {
+        "pool_size": pool_size,
+        "max_overflow": max_overflow,
+        "pool_timeout": settings.DB_POOL_TIMEOUT_SECONDS,
+        "pool_pre_ping": settings.DB_POOL_PRE_PING,
+        "pool_recycle": settings.DB_POOL_RECYCLE_SECONDS,
+    }
+
+
+# DATABASE_URL과 설정으로 엔진을 생성합니다.
+def build_engine(
+    url: str,
+    settings: AppSettings,
+    pool_size: int | None = None,
+    max_overflow: int | None = None,
+) -> Engine:
+    """SQLite면 스레드 공유 옵션과 성능 PRAGMA를, 서버형 DB면 풀/타임아웃 옵션을 적용합니다.
+
+    - pool_size/max_overflow를 생략하면 API용 설정(DB_POOL_SIZE/DB_MAX_OVERFLOW)을 사용합니다.
+    """
+
+    connect_args: dict[str, object] = {}
+    engine_options: dict[str, object] = {}
 
     # SQLite 전용 옵션: FastAPI 스레드에서 동일 연결을 공유하려면 check_same_thread를 꺼야 합니다.
-    if _is_sqlite_url(settings.DATABASE_URL):
-        connect_args = {"check_same_thread": False}
+    if _is_sqlite_url(url):
+        connect_args["check_same_thread"] = False
+    else:
+        engine_options = _pool_options(
+            settings,
+            settings.DB_POOL_SIZE if pool_size is None else pool_size,
+            settings.DB_MAX_OVERFLOW if max_overflow is None else max_overflow,
+        )
+        # 오래 걸리는 쿼리가 연결을 붙잡지 않도록 서버 측 문장 타임아웃을 겁니다. (0이면 사용 안 함)
+        if _is_postgres_url(url) and settings.DB_STATEMENT_TIMEOUT_MS > 0:
+            connect_args["options"] = f"-c statement_timeout={int(settings.DB_STATEMENT_TIMEOUT_MS)}"
 
     # 운영 환경에서 PostgreSQL 등으로 전환할 때는 DATABASE_URL만 변경하면 됩니다.
-    return create_engine(settings.DATABASE_URL, connect_args=connect_args or {})
+    engine = create_engine(url, connect_args=connect_args, **engine_options)
+    if _is_sqlite_url(url) and settings.SQLITE_TUNING_ENABLED:
+        apply_sqlite_pragmas(engine, settings)
+    return engine
+
+
+@lru_cache(maxsize=1)
+def get_engine():
+    """애플리케이션 전역에서 재사용할 SQLModel 엔진을 생성합니다."""
+
+    settings = get_settings()
+    return build_engine(settings.DATABASE_URL, settings)
 
 
 # 모듈 레벨에서 엔진을 만들어 두면 import 시 한 번만 생성되어 재사용됩니다.
 engine = get_engine()
 
 
+@lru_cache(maxsize=1)
+def _build_worker_engine() -> Engine:
+    """백그라운드 작업 전용 풀(WORKER_DB_POOL_SIZE/WORKER_DB_MAX_OVERFLOW)을 가진 엔진을 만듭니다."""
+
+    settings = get_settings()
+    return build_engine(
+        settings.DATABASE_URL,
+        settings,
+        pool_size=settings.WORKER_DB_POOL_SIZE,
+        max_overflow=settings.WORKER_DB_MAX_OVERFLOW,
+    )
+
+
+# 백그라운드 작업(문서 처리, 예약 알림, CLI)에서 사용할 엔진을 반환합니다.
+def get_worker_engine() -> Engine:
+    """API 요청과 풀을 나눠, 긴 작업이 API 연결을 고갈시키지 않게 합니다.
+
+    - SQLite는 파일 하나를 함께 쓰므로 풀을 나눌 이점이 없어 API 엔진을 그대로 반환합니다.
+    """
+
+    if _is_sqlite_url(str(engine.url)):
+        return engine
+    return _build_worker_engine()
+
+
+# 커넥션 풀 사용 현황을 반환합니다.
+def pool_status(target: Engine) -> dict[str, object]:
+    """풀 크기/사용 중/대기 가능 연결 수와 사용률(0~1)을 반환합니다.
+
+    - 사용률이 1에 가까우면 요청이 연결을 기다리기 시작하므로 풀 크기나 쿼리 시간을 점검해야 합니다.
+    """
+
+    pool = target.pool
+    if not isinstance(pool, QueuePool):
+        return {"pool": type(pool).__name__}
+
+    max_overflow = getattr(pool, "_max_overflow", 0)
+    checked_out = pool.checkedout()
+    capacity = pool.size() + max(max_overflow, 0)
+    return {
+        "pool": type(pool).__name__,
+        "size": pool.size(),
+        "max_overflow": max_overflow,
+        "checked_out": checked_out,
+        "checked_in": pool.checkedin(),
+        "overflow": max(pool.overflow(), 0),
+        "utilization": round(checked_out / capacity, 3) if capacity else 0.0,
+    }
+
+
+# 동기 DATABASE_URL을 비동기 드라이버 URL로 바꿉니다.
+def async_database_url(url: str) -> str:
+    """sqlite -> sqlite+aiosqlite, postgresql -> postgresql+asyncpg로 드라이버만 교체합니다.
+
+    - 이미 드라이버가 지정된 URL(예: sqlite+aiosqlite)은 그대로 둡니다.
+    """
+
+    parsed = make_url(url)
+    if "+" in parsed.drivername:
+        return url
+    if parsed.drivername == "sqlite":
+        return parsed.set(drivername="sqlite+aiosqlite").render_as_string(hide_password=False)
+    if parsed.drivername in ("postgres", "postgresql"):
+        return parsed.set(drivername="postgresql+asyncpg").render_as_string(hide_password=False)
+    return url
+
+
+# 비동기 엔진을 생성합니다.
+def build_async_engine(
+    url: str,
+    settings: AppSettings,
+    pool_size: int | None = None,
+    max_overflow: int | None = None,
+) -> AsyncEngine:
+    """build_engine과 같은 풀 설정/SQLite PRAGMA를 비동기 드라이버(aiosqlite/asyncpg)에 적용합니다.
+
+    초급자용 설명:
+    - 비동기 엔진은 DB 응답을 기다리는 동안 스레드를 붙잡지 않고 이벤트 루프에 양보합니다.
+    - asyncpg는 문장 타임아웃을 server_settings로 받으므로 connect_args 형태가 다릅니다.
+    """
+
+    async_url = async_database_url(url)
+    connect_args: dict[str, object] = {}
+    engine_options: dict[str, object] = {}
+
+    if not _is_sqlite_url(async_url):
+        engine_options = _pool_options(
+            settings,
+            settings.DB_POOL_SIZE if pool_size is None else pool_size,
+            settings.DB_MAX_OVERFLOW if max_overflow is None else max_overflow,
+        )
+        if _is_postgres_url(async_url) and settings.DB_STATEMENT_TIMEOUT_MS > 0:
+            connect_args["server_settings"] = {"statement_timeout": str(int(settings.DB_STATEMENT_TIMEOUT_MS))}
+
+    async_engine = create_async_engine(async_url, connect_args=connect_args, **engine_options)
+    if _is_sqlite_url(async_url) and settings.SQLITE_TUNING_ENABLED:
+        apply_sqlite_pragmas(async_engine.sync_engine, settings)
+    return async_engine
+
+
+# 동기 engine과 같은 DB를 가리키는 비동기 엔진을 반환합니다.
+@lru_cache(maxsize=1)
+def get_async_engine() -> AsyncEngine:
+    """비동기 라우트에서 재사용할 엔진을 처음 호출될 때 한 번만 생성합니다.
+
+    - 엔진을 만들 때 드라이버(aiosqlite/asyncpg)를 import하므로 모듈 import 시점에는 만들지 않습니다.
+    - PostgreSQL에서는 asyncpg가 필요합니다. (`uv sync --extra postgres`)
+    """
+
+    settings = get_settings()
+    return build_async_engine(settings.DATABASE_URL, settings)
+
+
+@lru_cache(maxsize=1)
+def _build_worker_async_engine() -> AsyncEngine:
+    """백그라운드 작업 전용 풀(WORKER_DB_POOL_SIZE/WORKER_DB_MAX_OVERFLOW)을 가진 비동기 엔진을 만듭니다."""
+
+    settings = get_settings()
+    return build_async_engine(
+        settings.DATABASE_URL,
+        settings,
+        pool_size=settings.WORKER_DB_POOL_SIZE,
+        max_overflow=settings.WORKER_DB_MAX_OVERFLOW,
+    )
+
+
+# 이벤트 루프에서 도는 백그라운드 작업(예약 알림)에서 사용할 비동기 엔진을 반환합니다.
+def get_worker_async_engine() -> AsyncEngine:
+    """get_worker_engine과 같은 기준으로, SQLite면 API 비동기 엔진을 그대로 반환합니다."""
+
+    if _is_sqlite_url(get_settings().DATABASE_URL):
+        return get_async_engine()
+    return _build_worker_async_engine()
+
+
+# 지금까지 만들어진 비동기 엔진의 연결을 닫습니다.
+async def dispose_async_engines() -> None:
+    """앱 종료 시 호출합니다. 한 번도 쓰지 않은 엔진은 새로 만들지 않고 건너뜁니다."""
+
+    if _build_worker_async_engine.cache_info().currsize:
+        await _build_worker_async_engine().dispose()
+    if get_async_engine.cache_info().currsize:
+        await get_async_engine().dispose()
+
+
 def get_session() -> Generator[Session, None, None]:
     """FastAPI 의존성으로 사용할 세션 제공 함수입니다.
 
@@ -47,3 +305,15 @@ def get_session() -> Generator[Session, None, None]:
 
     with Session(engine) as session:
         yield session
+
+
+async def get_async_session() -> AsyncGenerator[AsyncSession, None]:
+    """비동기 라우트용 세션 의존성입니다.
+
+    - DB를 기다리는 동안 스레드풀 슬롯을 점유하지 않으므로, 조회 위주 라우트의 동시 처리량이 늘어납니다.
+    - 동기 헬퍼가 필요하면 await session.run_sync(helper, ...)로 호출합니다. (helper는 동기 Session을 받습니다)
+    - 커밋 후 속성을 다시 읽으면 await 밖에서 지연 로딩이 일어나 오류가 나므로 expire_on_commit을 끕니다.
+    """
+
+    async with AsyncSession(get_async_engine(), expire_on_commit=False) as session:
+        yield session
@@ -0,0 +1,76 @@
+"""조건부 GET(ETag/Last-Modified) 처리를 위한 유틸 모듈입니다.
+
+초급자용 설명:
+- 서버는 응답에 ETag(리소스 버전 식별자)를 붙여 보냅니다.
+- 클라이언트가 다음 요청에 If-None-Match로 그 값을 다시 보내고, 버전이 같으면
+  본문 없이 304 Not Modified만 돌려줘 직렬화/마스킹/전송 비용을 아낍니다.
+"""
+
+from __future__ import annotations
+
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+import hashlib
+
+from starlette.requests import Request
+from starlette.responses import Response
+
+# 클라이언트가 항상 재검증하도록 하는 캐시 정책입니다. (개인 데이터이므로 공유 캐시는 금지)
+CACHE_CONTROL = "private, no-cache"
+
+
+# 버전 구성 요소로 강한 ETag 값을 만듭니다.
+def make_etag(*parts: object) -> str:
+    """구성 요소를 해시해 따옴표로 감싼 강한 ETag 문자열을 반환합니다."""
+    raw = "|".join("" if part is None else str(part) for part in parts)
+    digest = hashlib.sha1(raw.encode("utf-8")).hexdigest()
+    return f'"{digest}"'
+
+
+# naive UTC datetime을 HTTP 날짜 형식으로 변환합니다.
+def format_http_date(value: datetime) -> str:
+    """Last-Modified 헤더용 HTTP 날짜 문자열을 반환합니다."""
+    return format_datetime(value.replace(tzinfo=timezone.utc, microsecond=0), usegmt=True)
+
+
+# If-None-Match 헤더가 현재 ETag와 일치하는지 확인합니다.
+def _etag_matches(header_value: str, etag: str) -> bool:
+    """If-None-Match는 약한 비교를 사용하므로 W/ 접두어를 무시합니다."""
+    if header_value.strip() == "*":
+        return True
+    candidates = [candidate.strip() for candidate in header_value.split(",")]
+    return any(candidate.removeprefix("W/") == etag for candidate in candidates)
+
+
+# 조건부 요청이 "변경 없음"에 해당하는지 판단합니다.
+def is_not_modified(request: Request, etag: str, last_modified: datetime | None = None) -> bool:
+    """If-None-Match를 우선 확인하고, 없을 때만 If-Modified-Since를 확인합니다."""
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        return _etag_matches(if_none_match, etag)
+
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since and last_modified is not None:
+        try:
+            since = parsedate_to_datetime(if_modified_since)
+        except (TypeError, ValueError):
+            return False
+        if since.tzinfo is None:
+            since = since.replace(tzinfo=timezone.utc)
+        return last_modified.replace(tzinfo=timezone.utc, microsecond=0) <= since
+    return False
+
+
+# 캐시 검증용 응답 헤더를 구성합니다.
+def cache_headers(etag: str, last_modified: datetime | None = None) -> dict[str, str]:
+    """ETag/Last-Modified/Cache-Control 헤더 dict를 반환합니다."""
+    headers = {"ETag": etag, "Cache-Control": CACHE_CONTROL}
+    if last_modified is not None:
+        headers["Last-Modified"] = format_http_date(last_modified)
+    return headers
+
+
+# 본문 없는 304 응답을 생성합니다.
+def not_modified_response(etag: str, last_modified: datetime | None = None) -> Response:
+    """304 Not Modified 응답을 반환합니다."""
+    return Response(status_code=304, headers=cache_headers(etag, last_modified))
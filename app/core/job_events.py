@@ -0,0 +1,57 @@
+"""문서 처리 Job 상태 변경을 프로세스 내부에 알리는 이벤트 버스 모듈입니다.
+
+초급자용 설명:
+- 백그라운드 작업(스레드)이 Job 상태를 바꾸면 publish(job_id)를 호출합니다.
+- 롱폴링/SSE 요청(이벤트 루프)은 subscribe(job_id)로 받은 asyncio.Event를 기다립니다.
+- 다른 프로세스(워커 여러 개)에서 바뀐 상태는 이 버스로 전달되지 않으므로,
+  구독자는 일정 주기로 DB를 다시 읽는 폴백을 함께 사용해야 합니다.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from contextlib import contextmanager
+import threading
+from typing import Iterator
+
+
+# Job 상태 변경 알림을 전달하는 버스입니다.
+class JobEventBus:
+    """job_id별 구독자(asyncio.Event)를 관리하고 스레드 안전하게 깨웁니다."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._subscribers: dict[int, set[tuple[asyncio.AbstractEventLoop, asyncio.Event]]] = {}
+
+    # 현재 이벤트 루프에서 job_id 변경 알림을 구독합니다.
+    @contextmanager
+    def subscribe(self, job_id: int) -> Iterator[asyncio.Event]:
+        """with 블록 동안 유효한 asyncio.Event를 반환합니다."""
+        subscriber = (asyncio.get_running_loop(), asyncio.Event())
+        with self._lock:
+            self._subscribers.setdefault(job_id, set()).add(subscriber)
+        try:
+            yield subscriber[1]
+        finally:
+            with self._lock:
+                subscribers = self._subscribers.get(job_id)
+                if subscribers is not None:
+                    subscribers.discard(subscriber)
+                    if not subscribers:
+                        del self._subscribers[job_id]
+
+    # job_id 구독자 모두에게 변경을 알립니다.
+    def publish(self, job_id: int) -> None:
+        """어느 스레드에서 호출해도 안전하도록 call_soon_threadsafe로 깨웁니다."""
+        with self._lock:
+            subscribers = list(self._subscribers.get(job_id, ()))
+        for loop, event in subscribers:
+            try:
+                loop.call_soon_threadsafe(event.set)
+            except RuntimeError:
+                # 이미 닫힌 이벤트 루프는 무시합니다.
+                continue
+
+
+# 애플리케이션 전역에서 공유하는 버스 인스턴스입니다.
+job_event_bus = JobEventBus()
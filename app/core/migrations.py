@@ -0,0 +1,318 @@
+"""버전 번호로 관리하는 DB 마이그레이션 러너 모듈입니다.
+
+초급자용 설명:
+- SQLModel.metadata.create_all은 "없는 테이블"만 만들고, 이미 있는 테이블에는 컬럼/인덱스를 추가하지 않습니다.
+- 그래서 스키마 변경은 MIGRATIONS 목록에 번호를 붙여 추가하고, 적용한 번호는 schema_migration 테이블에 남깁니다.
+- 앱 시작 시에는 최대 버전만 읽어 최신인지 확인하므로, 매 부팅마다 모든 테이블을 검사하지 않습니다.
+- 적용: uv run python -m app.cli migrate (확인만: --check)
+
+새 마이그레이션 추가 규칙:
+- 버전은 1씩 늘리고, 이미 배포된 마이그레이션은 수정하지 않습니다.
+- 각 단계는 여러 번 실행해도 안전하게(이미 있으면 건너뛰기) 작성합니다.
+- 새 테이블도 create_all 대신 새 마이그레이션에서 _create_tables로 만듭니다.
+"""
+
+from __future__ import annotations
+
+from contextlib import contextmanager
+from dataclasses import dataclass
+import logging
+import re
+import time
+from typing import Callable, Iterator
+
+from sqlalchemy import func, inspect, select, text
+from sqlalchemy.engine import Connection, Engine
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.schema import CreateIndex, Index
+from sqlmodel import Session, SQLModel
+
+from app.core.config import AppSettings
+from app.models import (  # noqa: F401  (메타데이터에 모든 테이블 등록)
+    alert_run,
+    alert_schedule,
+    document,
+    job,
+    notification,
+    product,
+    scheduler_lock,
+    schema_migration,
+    telegram_account,
+    user,
+)
+from app.models.schema_migration import SchemaMigration
+
+logger = logging.getLogger(__name__)
+
+# 동시 마이그레이션을 막는 PostgreSQL advisory lock 키입니다. ("ASHD")
+MIGRATION_LOCK_KEY = 0x41534844
+
+# 다른 프로세스의 마이그레이션이 끝나기를 기다리는 최대 시간(초)과 재시도 간격(초)입니다. (SQLite)
+MIGRATION_LOCK_TIMEOUT_SECONDS = 300
+MIGRATION_LOCK_POLL_SECONDS = 0.2
+
+
+# 마이그레이션 한 단계입니다.
+@dataclass(frozen=True)
+class Migration:
+    """transactional=False면 트랜잭션 밖(autocommit)에서 실행합니다. (PostgreSQL CONCURRENTLY 인덱스용)"""
+
+    version: int
+    name: str
+    upgrade: Callable[[Connection], None]
+    transactional: bool = True
+
+
+# 모델에 정의된 테이블 중 없는 것만 만듭니다.
+def _create_tables(connection: Connection) -> None:
+    """검색 인덱스(FTS/tsvector) 테이블도 메타데이터 이벤트로 함께 만들어집니다."""
+    from app.services import search_index  # noqa: F401  (검색 인덱스 DDL 등록)
+
+    SQLModel.metadata.create_all(connection)
+
+
+# 기존 테이블에 컬럼이 없으면 추가합니다.
+def _add_column(connection: Connection, table_name: str, column_name: str) -> None:
+    """ALTER TABLE ... ADD COLUMN으로 모델 정의와 같은 타입의 컬럼을 추가합니다.
+
+    - NOT NULL 컬럼은 기존 행을 채울 수 있도록 모델에 server_default가 있어야 합니다.
+    """
+    if column_name in {column["name"] for column in inspect(connection).get_columns(table_name)}:
+        return
+    column = SQLModel.metadata.tables[table_name].c[column_name]
+    preparer = connection.dialect.identifier_preparer
+    column_sql = f"{preparer.quote(column_name)} {column.type.compile(dialect=connection.dialect)}"
+    if column.server_default is not None:
+        column_sql += f" DEFAULT {column.server_default.arg}"
+    if not column.nullable:
+        column_sql += " NOT NULL"
+    connection.exec_driver_sql(f"ALTER TABLE {preparer.quote(table_name)} ADD COLUMN {column_sql}")
+
+
+# 인덱스 생성 SQL을 만듭니다.
+def create_index_sql(index: Index, dialect) -> str:
+    """PostgreSQL이면 쓰기를 막지 않는 CREATE INDEX CONCURRENTLY를 사용합니다."""
+    sql = str(CreateIndex(index, if_not_exists=True).compile(dialect=dialect))
+    if dialect.name == "postgresql":
+        sql = re.sub(r"^CREATE (UNIQUE )?INDEX", r"CREATE \1INDEX CONCURRENTLY", sql, count=1)
+    return sql
+
+
+# 테이블의 INVALID 인덱스 이름을 조회합니다. (PostgreSQL)
+def _invalid_indexes(connection: Connection, table_name: str) -> set[str]:
+    """CREATE INDEX CONCURRENTLY가 중간에 실패하면 pg_index.indisvalid가 false인 인덱스가 남습니다."""
+    if connection.dialect.name != "postgresql":
+        return set()
+    rows = connection.execute(
+        text(
+            "SELECT c.relname FROM pg_index i JOIN pg_class c ON c.oid = i.indexrelid "
+            "WHERE i.indrelid = to_regclass(:table_name) AND NOT i.indisvalid"
+        ),
+        {"table_name": table_name},
+    )
+    return {row[0] for row in rows}
+
+
+# 모델에 정의된 인덱스가 없으면 만듭니다.
+def _create_indexes(connection: Connection, table_name: str, index_names: list[str]) -> None:
+    """CONCURRENTLY가 실패해 INVALID 인덱스가 남아 있으면, DROP INDEX CONCURRENTLY 후 다시 만듭니다.
+
+    - INVALID 인덱스는 이름만 있고 조회에 쓰이지 않으므로, 이름만 보고 건너뛰면 인덱스가 없는 상태로 남습니다.
+    """
+    table = SQLModel.metadata.tables[table_name]
+    invalid = _invalid_indexes(connection, table_name)
+    existing = {index["name"] for index in inspect(connection).get_indexes(table_name)} - invalid
+    preparer = connection.dialect.identifier_preparer
+    for index in table.indexes:
+        if index.name not in index_names or index.name in existing:
+            continue
+        if index.name in invalid:
+            logger.warning("Dropping invalid index %s before recreating it", index.name)
+            connection.exec_driver_sql(f"DROP INDEX CONCURRENTLY IF EXISTS {preparer.quote(index.name)}")
+        connection.exec_driver_sql(create_index_sql(index, connection.dialect))
+
+
+# 사용자 조회 패턴에 맞춘 복합 인덱스를 만듭니다.
+def _create_composite_indexes(connection: Connection) -> None:
+    """product/document/job 복합 인덱스입니다."""
+    _create_indexes(
+        connection,
+        "product",
+        ["ix_product_user_warranty_end", "ix_product_user_refund_deadline", "ix_product_user_updated_id"],
+    )
+    _create_indexes(connection, "document", ["ix_document_user_content_hash"])
+    _create_indexes(connection, "documentprocessingjob", ["ix_job_status_updated"])
+
+
+# JSON 컬럼에만 있던 알림 기준일을 정규화 테이블로 옮깁니다.
+def _backfill_notification_offsets(connection: Connection) -> None:
+    """예전에는 매 부팅마다 실행하던 백필을 한 번만 실행합니다."""
+    from app.services.notification_offsets import backfill_notification_offsets
+
+    with Session(bind=connection) as session:
+        backfill_notification_offsets(session)
+
+
+# 알림 발송 일정이 없는 제품의 일정을 채웁니다.
+def _backfill_alert_schedule(connection: Connection) -> None:
+    """예전에는 매 부팅마다 실행하던 백필을 한 번만 실행합니다."""
+    from app.services.alert_schedule import backfill_alert_schedule
+
+    with Session(bind=connection) as session:
+        backfill_alert_schedule(session)
+
+
+# 사용자 필터를 MATCH 안으로 옮긴 SQLite 검색 테이블로 교체합니다.
+def _recreate_search_table(connection: Connection) -> None:
+    """예전 FTS5 테이블(user_id UNINDEXED)을 owner 토큰 컬럼이 있는 테이블로 바꾸고 다시 인덱싱합니다."""
+    from app.services.search_index import recreate_search_table
+
+    with Session(bind=connection) as session:
+        recreate_search_table(session)
+
+
+# 순서대로 적용할 마이그레이션 목록입니다.
+MIGRATIONS: list[Migration] = [
+    Migration(1, "create_tables", _create_tables),
+    Migration(2, "document_content_hash", lambda connection: _add_column(connection, "document", "content_hash")),
+    Migration(3, "composite_indexes", _create_composite_indexes, transactional=False),
+    Migration(4, "backfill_notification_offsets", _backfill_notification_offsets),
+    Migration(5, "backfill_alert_schedule", _backfill_alert_schedule),
+    Migration(6, "user_token_version", lambda connection: _add_column(connection, "user", "token_version")),
+    Migration(7, "search_owner_token", _recreate_search_table),
+]
+
+# 코드가 기대하는 최신 스키마 버전입니다.
+LATEST_VERSION = MIGRATIONS[-1].version
+
+
+# 현재 DB의 스키마 버전을 반환합니다.
+def current_version(engine: Engine) -> int:
+    """schema_migration 테이블이 없으면 0을 반환합니다."""
+    with engine.connect() as connection:
+        if not inspect(connection).has_table(SchemaMigration.__tablename__):
+            return 0
+        return connection.execute(select(func.max(SchemaMigration.version))).scalar() or 0
+
+
+# 아직 적용하지 않은 마이그레이션을 순서대로 적용합니다.
+def migrate(engine: Engine, target: int | None = None) -> list[int]:
+    """적용한 버전 목록을 반환합니다.
+
+    - target을 주면 그 버전까지만 적용합니다.
+    - 여러 워커/인스턴스가 동시에 시작해도 DB 잠금을 잡은 프로세스 하나만 적용하고,
+      나머지는 잠금을 얻은 뒤 적용 기록을 다시 읽어 이미 적용된 단계를 건너뜁니다.
+      - PostgreSQL: pg_advisory_lock, SQLite: BEGIN IMMEDIATE(쓰기 잠금)
+    """
+    if engine.dialect.name == "sqlite":
+        return _migrate_sqlite(engine, target)
+
+    with _advisory_lock(engine):
+        SchemaMigration.__table__.create(engine, checkfirst=True)
+        with engine.connect() as connection:
+            applied = _applied_versions(connection)
+
+        done: list[int] = []
+        for migration in _pending(applied, target):
+            logger.info("applying migration %s_%s", migration.version, migration.name)
+            if migration.transactional:
+                with engine.begin() as connection:
+                    migration.upgrade(connection)
+                    _record(connection, migration)
+            else:
+                with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as connection:
+                    migration.upgrade(connection)
+                with engine.begin() as connection:
+                    _record(connection, migration)
+            done.append(migration.version)
+        return done
+
+
+# SQLite에서 쓰기 잠금을 잡은 한 트랜잭션으로 마이그레이션을 적용합니다.
+def _migrate_sqlite(engine: Engine, target: int | None) -> list[int]:
+    """SQLite는 DDL도 트랜잭션으로 묶이므로 잠금을 잡은 연결 하나에서 모든 단계를 실행하고 마지막에 커밋합니다.
+
+    - 중간 단계가 실패하면 전체가 롤백되고, 다음 실행에서 처음부터 다시 적용합니다.
+    """
+    with engine.connect() as connection:
+        _begin_immediate(connection)
+        SchemaMigration.__table__.create(connection, checkfirst=True)
+        applied = _applied_versions(connection)
+
+        done: list[int] = []
+        for migration in _pending(applied, target):
+            logger.info("applying migration %s_%s", migration.version, migration.name)
+            migration.upgrade(connection)
+            _record(connection, migration)
+            done.append(migration.version)
+        connection.commit()
+        return done
+
+
+# SQLite 쓰기 잠금을 잡습니다.
+def _begin_immediate(connection: Connection) -> None:
+    """다른 프로세스가 마이그레이션 중이면 MIGRATION_LOCK_TIMEOUT_SECONDS 동안 다시 시도합니다."""
+    deadline = time.monotonic() + MIGRATION_LOCK_TIMEOUT_SECONDS
+    while True:
+        try:
+            connection.exec_driver_sql("BEGIN IMMEDIATE")
+            return
+        except OperationalError:
+            connection.rollback()
+            if time.monotonic() >= deadline:
+                raise
+            time.sleep(MIGRATION_LOCK_POLL_SECONDS)
+
+
+# PostgreSQL advisory lock을 잡고 있는 동안 블록을 실행합니다.
+@contextmanager
+def _advisory_lock(engine: Engine) -> Iterator[None]:
+    """세션 단위 잠금이라 잠금 연결과 별개인 연결에서 단계를 실행해도 유지됩니다. (PostgreSQL 외에는 잠그지 않습니다)"""
+    if engine.dialect.name != "postgresql":
+        yield
+        return
+
+    with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as connection:
+        connection.execute(text("SELECT pg_advisory_lock(:key)"), {"key": MIGRATION_LOCK_KEY})
+        try:
+            yield
+        finally:
+            connection.execute(text("SELECT pg_advisory_unlock(:key)"), {"key": MIGRATION_LOCK_KEY})
+
+
+# 적용된 버전 집합을 읽습니다.
+def _applied_versions(connection: Connection) -> set[int]:
+    return set(connection.execute(select(SchemaMigration.version)).scalars())
+
+
+# 적용할 마이그레이션을 순서대로 반환합니다.
+def _pending(applied: set[int], target: int | None) -> list[Migration]:
+    return [
+        migration
+        for migration in MIGRATIONS
+        if migration.version not in applied and (target is None or migration.version <= target)
+    ]
+
+
+# 적용한 마이그레이션을 기록합니다.
+def _record(connection: Connection, migration: Migration) -> None:
+    """schema_migration에 (version, name)을 추가합니다."""
+    connection.execute(
+        SchemaMigration.__table__.insert().values(version=migration.version, name=migration.name)
+    )
+
+
+# 앱 시작 시 스키마가 최신인지 확인합니다.
+def ensure_schema_current(engine: Engine, settings: AppSettings) -> None:
+    """버전 조회 한 번으로 끝나는 빠른 경로입니다.
+
+    - 뒤처져 있으면 DB_AUTO_MIGRATE=true일 때만 바로 적용하고, 아니면 RuntimeError로 시작을 멈춥니다.
+    """
+    version = current_version(engine)
+    if version >= LATEST_VERSION:
+        return
+    if not settings.DB_AUTO_MIGRATE:
+        raise RuntimeError(
+            f"DB schema version {version} is behind {LATEST_VERSION}; run `python -m app.cli migrate`"
+        )
+    migrate(engine)
@@ -0,0 +1,40 @@
+"""키셋(커서) 페이지네이션용 커서 인코딩 유틸 모듈입니다."""
+
+from __future__ import annotations
+
+import base64
+from datetime import datetime
+import json
+
+
+# 커서 형식이 잘못되었을 때 발생하는 예외입니다.
+class InvalidCursorError(ValueError):
+    """클라이언트가 보낸 커서를 해석할 수 없을 때 사용합니다."""
+
+
+# 마지막 행의 정렬 키를 커서 문자열로 인코딩합니다.
+def encode_cursor(sort: str, value: datetime, row_id: int) -> str:
+    """(정렬 컬럼 값, id)를 URL-safe base64 문자열로 만듭니다.
+
+    초급자용 설명:
+    - 커서는 "이 행 다음부터 보여 달라"는 위치 정보입니다.
+    - OFFSET과 달리 앞 페이지를 다시 세지 않으므로 목록이 커져도 일정한 속도를 유지합니다.
+    """
+    payload = {"s": sort, "v": value.isoformat(), "id": row_id}
+    raw = json.dumps(payload, separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+# 커서 문자열을 (정렬 컬럼 값, id)로 디코딩합니다.
+def decode_cursor(cursor: str, sort: str) -> tuple[datetime, int]:
+    """커서를 해석하고, 요청한 정렬 기준과 다르면 InvalidCursorError를 발생시킵니다."""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        if payload["s"] != sort:
+            raise InvalidCursorError("cursor does not match sort")
+        return datetime.fromisoformat(payload["v"]), int(payload["id"])
+    except InvalidCursorError:
+        raise
+    except Exception as exc:
+        raise InvalidCursorError("malformed cursor") from exc
@@ -0,0 +1,56 @@
+"""비동기 전송 속도 제한(토큰 버킷) 유틸 모듈입니다.
+
+초급자용 설명:
+- 토큰 버킷은 초당 rate개씩 토큰이 채워지고, 전송할 때마다 토큰 1개를 꺼내 쓰는 방식입니다.
+- 토큰이 없으면 채워질 때까지 기다리므로, 동시에 많은 작업이 몰려도 초당 전송량이 제한됩니다.
+- anyio 기반이라 asyncio/trio 어느 이벤트 루프에서도 동작합니다.
+"""
+
+from __future__ import annotations
+
+import time
+
+import anyio
+
+
+# 초당 전송량을 제한하는 토큰 버킷입니다.
+class AsyncTokenBucket:
+    """rate(초당 토큰)와 capacity(순간 최대 버스트)를 가진 토큰 버킷입니다."""
+
+    def __init__(self, rate: float, capacity: float | None = None) -> None:
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else max(rate, 1.0)
+        self._tokens = self.capacity
+        self._updated_at = time.monotonic()
+        self._paused_until = 0.0
+        self._lock = anyio.Lock()
+
+    # 경과 시간만큼 토큰을 채웁니다.
+    def _refill(self, now: float) -> None:
+        """마지막 갱신 이후 흐른 시간에 비례해 토큰을 보충합니다."""
+        elapsed = now - self._updated_at
+        self._tokens = min(self.capacity, self._tokens + elapsed * self.rate)
+        self._updated_at = now
+
+    # 토큰 1개를 얻을 때까지 기다립니다.
+    async def acquire(self) -> None:
+        """토큰이 생길 때까지 대기합니다. 대기는 락 안에서 해 순서를 보장합니다."""
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                if now < self._paused_until:
+                    await anyio.sleep(self._paused_until - now)
+                    continue
+                self._refill(now)
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await anyio.sleep((1 - self._tokens) / self.rate)
+
+    # 외부 서버가 지정한 시간 동안 전송을 멈춥니다.
+    def pause(self, seconds: float) -> None:
+        """429 retry_after처럼 서버가 요구한 시간만큼 이후 acquire를 지연시킵니다."""
+        self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+        self._tokens = 0
@@ -4,7 +4,7 @@ from __future__ import annotations
 
 import os
 import re
-from typing import Any
+from typing import Any, Iterable, Iterator
 
 try:
     from pydantic import BaseModel
@@ -197,51 +197,99 @@ def _mask_card_candidates_strict(line: str) -> str:
     return "".join(result)
 
 
-# 민감정보를 마스킹한 텍스트를 반환합니다.
-def redact_text(text: str, strict: bool | None = None) -> str:
-    """텍스트 내 민감정보를 찾아 마스킹합니다.
+# 한 줄 단위로 민감정보를 마스킹합니다.
+def _redact_line(line: str, strict_enabled: bool) -> str:
+    """줄바꿈이 없는 한 줄에 마스킹 규칙을 순서대로 적용합니다."""
+    redacted = line
+
+    # 승인/거래/가맹/단말기 번호는 키워드 패턴으로 마스킹합니다.
+    redacted = _APPROVAL_PATTERN.sub(_mask_keyword_number, redacted)
+
+    # 계좌번호는 키워드 패턴으로 마스킹합니다.
+    redacted = _ACCOUNT_PATTERN.sub(_mask_keyword_number, redacted)
+
+    # 카드번호는 키워드가 있거나, 4-4-4-4 형식이면 마스킹합니다.
+    if _contains_keyword(redacted, _CARD_KEYWORDS):
+        redacted = _CARD_LOOSE_PATTERN.sub(_mask_card, redacted)
+    redacted = _CARD_STRICT_PATTERN.sub(_mask_card, redacted)
+
+    # strict 모드에서는 라벨 없는 카드번호 후보도 추가로 마스킹합니다.
+    if strict_enabled:
+        redacted = _mask_card_candidates_strict(redacted)
+
+    # 이메일/전화번호는 전역 패턴으로 마스킹합니다.
+    redacted = _EMAIL_PATTERN.sub(_mask_email, redacted)
+    redacted = _PHONE_PATTERN.sub(_mask_phone, redacted)
+
+    # 주민번호는 키워드가 있는 라인에서만 마스킹합니다.
+    if _contains_keyword(redacted, _RRN_KEYWORDS):
+        redacted = _RRN_PATTERN.sub(_mask_rrn, redacted)
+
+    return redacted
+
+
+# 줄 끝의 개행 문자를 본문과 분리합니다.
+def _split_line_ending(line: str) -> tuple[str, str]:
+    """'\r\n'/'\n'/'\r' 개행을 떼어 (본문, 개행) 튜플로 반환합니다."""
+    if line.endswith("\r\n"):
+        return line[:-2], "\r\n"
+    if line.endswith(("\n", "\r")):
+        return line[:-1], line[-1]
+    return line, ""
+
+
+# 줄 단위 이터러블을 받아 마스킹된 줄을 하나씩 돌려줍니다.
+def iter_redact(lines: Iterable[str], strict: bool | None = None) -> Iterator[str]:
+    """줄 단위로 마스킹 결과를 스트리밍합니다.
 
     초급자용 설명:
-    - 이메일/전화번호/주민번호는 패턴 자체가 명확해 전역 적용합니다.
-    - 카드번호/승인번호/계좌번호는 키워드가 있는 라인에서만 강하게 마스킹합니다.
-    - 영수증에는 숫자가 많아 과도한 마스킹을 피하기 위해 문맥 기반을 사용합니다.
+    - 파일 객체나 io.StringIO처럼 줄을 하나씩 내주는 이터러블을 그대로 넘기면 됩니다.
+    - 전체 텍스트를 리스트로 복사하지 않으므로, 여러 페이지 OCR 결과나 큰 로그도
+      한 줄 분량의 메모리만 사용해 마스킹할 수 있습니다.
+    - 각 줄의 개행 문자는 그대로 보존합니다.
     """
-    if not text:
-        return text
-
     strict_enabled = _is_strict_enabled() if strict is None else strict
-    lines = text.splitlines()
-    redacted_lines = []
-
     for line in lines:
-        redacted = line
-
-        # 승인/거래/가맹/단말기 번호는 키워드 패턴으로 마스킹합니다.
-        redacted = _APPROVAL_PATTERN.sub(_mask_keyword_number, redacted)
+        body, ending = _split_line_ending(line)
+        yield _redact_line(body, strict_enabled) + ending
 
-        # 계좌번호는 키워드 패턴으로 마스킹합니다.
-        redacted = _ACCOUNT_PATTERN.sub(_mask_keyword_number, redacted)
 
-        # 카드번호는 키워드가 있거나, 4-4-4-4 형식이면 마스킹합니다.
-        if _contains_keyword(redacted, _CARD_KEYWORDS):
-            redacted = _CARD_LOOSE_PATTERN.sub(_mask_card, redacted)
-        redacted = _CARD_STRICT_PATTERN.sub(_mask_card, redacted)
+# 파일을 읽으면서 마스킹 결과를 다른 파일로 바로 씁니다.
+def redact_file(
+    source: str | os.PathLike[str],
+    destination: str | os.PathLike[str],
+    strict: bool | None = None,
+    encoding: str = "utf-8",
+) -> int:
+    """원본 파일을 줄 단위로 마스킹해 대상 파일에 기록하고, 처리한 줄 수를 반환합니다.
 
-        # strict 모드에서는 라벨 없는 카드번호 후보도 추가로 마스킹합니다.
-        if strict_enabled:
-            redacted = _mask_card_candidates_strict(redacted)
+    - 내보낸 로그/아카이브를 오프라인으로 마스킹할 때 사용합니다.
+    - 디코딩할 수 없는 바이트는 대체 문자로 바꿔 처리가 중단되지 않게 합니다.
+    """
+    count = 0
+    with open(source, encoding=encoding, errors="replace", newline="") as src, open(
+        destination, "w", encoding=encoding, newline=""
+    ) as dst:
+        for redacted in iter_redact(src, strict=strict):
+            dst.write(redacted)
+            count += 1
+    return count
 
-        # 이메일/전화번호는 전역 패턴으로 마스킹합니다.
-        redacted = _EMAIL_PATTERN.sub(_mask_email, redacted)
-        redacted = _PHONE_PATTERN.sub(_mask_phone, redacted)
 
-        # 주민번호는 키워드가 있는 라인에서만 마스킹합니다.
-        if _contains_keyword(redacted, _RRN_KEYWORDS):
-            redacted = _RRN_PATTERN.sub(_mask_rrn, redacted)
+# 민감정보를 마스킹한 텍스트를 반환합니다.
+def redact_text(text: str, strict: bool | None = None) -> str:
+    """텍스트 내 민감정보를 찾아 마스킹합니다.
 
-        redacted_lines.append(redacted)
+    초급자용 설명:
+    - 이메일/전화번호/주민번호는 패턴 자체가 명확해 전역 적용합니다.
+    - 카드번호/승인번호/계좌번호는 키워드가 있는 라인에서만 강하게 마스킹합니다.
+    - 영수증에는 숫자가 많아 과도한 마스킹을 피하기 위해 문맥 기반을 사용합니다.
+    - 큰 텍스트를 한 번에 다루지 않으려면 iter_redact를 사용하세요.
+    """
+    if not text:
+        return text
 
-    return "\n".join(redacted_lines)
+    return "\n".join(iter_redact(text.splitlines(), strict=strict))
 
 
 # dict/list/tuple/set/모델 등을 재귀적으로 마스킹합니다.
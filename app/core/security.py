@@ -3,20 +3,54 @@
 v0.1에서는 bcrypt 기반 비밀번호 해시와 단순 JWT Access Token만 사용합니다.
 """
 
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
+from functools import lru_cache
 from typing import Any, Dict, Optional
 
 from jose import JWTError, jwt
 from passlib.context import CryptContext
 
-from app.core.config import get_settings
+from app.core.config import AppSettings, get_settings
+
+
+# 설정의 반복 횟수로 비밀번호 해시 컨텍스트를 만듭니다.
+def build_password_context(settings: AppSettings) -> CryptContext:
+    """PASSWORD_HASH_ROUNDS를 기본값이자 최소/최대값으로 지정합니다.
+
+    - 최소/최대값을 같이 주면 다른 반복 횟수로 만든 해시를 needs_update가 True로 알려 주므로,
+      설정을 바꾼 뒤 로그인할 때 새 비용으로 다시 해시할 수 있습니다.
+    """
+
+    rounds = settings.PASSWORD_HASH_ROUNDS
+    return CryptContext(
+        schemes=["pbkdf2_sha256"],
+        deprecated="auto",
+        pbkdf2_sha256__default_rounds=rounds,
+        pbkdf2_sha256__min_rounds=rounds,
+        pbkdf2_sha256__max_rounds=rounds,
+    )
+
 
 # bcrypt 해시 설정 (passlib이 내부에서 안전한 솔트를 자동 생성/검증)
 # pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
-pwd_context = CryptContext(
-    schemes=["pbkdf2_sha256"],
-    deprecated="auto",
-)
+pwd_context = build_password_context(get_settings())
+
+
+@lru_cache(maxsize=1)
+def _password_executor() -> ThreadPoolExecutor:
+    """비밀번호 해시/검증 전용 스레드 풀입니다. (크기: PASSWORD_HASH_WORKERS)
+
+    초급자용 설명:
+    - 해시 계산은 수십 ms 동안 CPU를 쓰는 작업이라 요청 스레드에서 바로 돌리면 다른 요청이 밀립니다.
+    - 전용 풀의 크기만큼만 동시에 계산하고 나머지는 줄을 서므로, 로그인이 몰려도 다른 라우트는 영향을 덜 받습니다.
+    """
+
+    return ThreadPoolExecutor(
+        max_workers=max(1, get_settings().PASSWORD_HASH_WORKERS),
+        thread_name_prefix="password-hash",
+    )
 
 
 def get_password_hash(plain_password: str) -> str:
@@ -36,6 +70,24 @@ def verify_password(plain_password: str, password_hash: str) -> bool:
     return pwd_context.verify(plain_password, password_hash)
 
 
+def password_needs_rehash(password_hash: str) -> bool:
+    """저장된 해시가 현재 설정(알고리즘/반복 횟수)과 다르면 True를 반환합니다."""
+
+    return pwd_context.needs_update(password_hash)
+
+
+async def hash_password_async(plain_password: str) -> str:
+    """get_password_hash를 전용 스레드 풀에서 실행합니다."""
+
+    return await asyncio.wrap_future(_password_executor().submit(get_password_hash, plain_password))
+
+
+async def verify_password_async(plain_password: str, password_hash: str) -> bool:
+    """verify_password를 전용 스레드 풀에서 실행합니다."""
+
+    return await asyncio.wrap_future(_password_executor().submit(verify_password, plain_password, password_hash))
+
+
 def create_access_token(data: Dict[str, Any], expires_delta: Optional[timedelta] = None) -> str:
     """JWT Access Token을 생성합니다.
 
@@ -1,6 +1,9 @@
-"""UTC 시간 헬퍼를 제공하는 모듈입니다."""
+"""UTC 시간/알림 기준 날짜 헬퍼를 제공하는 모듈입니다."""
 
-from datetime import datetime, timezone
+from datetime import date, datetime, timezone
+from zoneinfo import ZoneInfo
+
+from app.core.config import AppSettings, get_settings
 
 
 # UTC 기준 naive datetime을 반환합니다.
@@ -12,3 +15,15 @@ def utc_now() -> datetime:
     - timezone.utc를 붙였다가 tzinfo를 제거해 naive UTC로 저장합니다.
     """
     return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+# 일일 알림의 기준 날짜(오늘)를 반환합니다.
+def alert_today(settings: AppSettings | None = None) -> date:
+    """SCHEDULER_TIMEZONE 기준 오늘 날짜를 반환합니다.
+
+    초급자용 설명:
+    - 서버 시간대(보통 UTC)의 date.today()를 쓰면 한국 시간 새벽에는 하루 전 날짜가 됩니다.
+    - 외부 cron과 내장 스케줄러가 같은 날짜를 써야 실행 기록/전송 기록을 공유해 중복 발송되지 않습니다.
+    """
+    config = settings or get_settings()
+    return datetime.now(ZoneInfo(config.SCHEDULER_TIMEZONE)).date()
@@ -11,7 +11,7 @@ from pathlib import Path
 from fastapi import Depends, FastAPI
 from fastapi.responses import RedirectResponse
 from fastapi.staticfiles import StaticFiles
-from sqlmodel import Session, SQLModel
+from sqlmodel import Session
 
 # from app.api.routes import auth, health, notification_settings, products, telegram_account
 from app.api.routes import (
@@ -26,9 +26,25 @@ from app.api.routes import (
 )
 from app.api.middlewares.redaction import RedactionMiddleware
 from app.core.config import get_settings
-from app.core.db import engine, get_session
+from app.core.db import dispose_async_engines, engine, get_session
 from app.core.health import check_db_health
-from app.models import document, job, notification, product, telegram_account, user  # noqa: F401
+from app.core.migrations import ensure_schema_current
+from app.models import (  # noqa: F401
+    alert_run,
+    alert_schedule,
+    document,
+    job,
+    notification,
+    product,
+    scheduler_lock,
+    schema_migration,
+    telegram_account,
+    user,
+)
+from app.services import search_index  # noqa: F401  (검색 인덱스 DDL 등록)
+from app.services.alert_templates import load_alert_templates
+from app.services.scheduler import create_scheduler
+from app.services.telegram_service import close_telegram_sender, get_telegram_sender
 
 BASE_DIR = Path(__file__).resolve().parents[1]
 
@@ -59,11 +75,40 @@ def create_app() -> FastAPI:
     # 설정을 한 번만 로드해 애플리케이션 상태에 저장합니다.
     app.state.settings = get_settings()
 
-    # 앱 시작 시 DB 테이블을 생성합니다.
-    # 주의: 모델이 정의된 모듈이 import되어 있어야 메타데이터에 반영됩니다.
+    # 앱 시작 시 스키마 버전만 확인합니다. (뒤처져 있으면 DB_AUTO_MIGRATE 설정에 따라 적용)
     @app.on_event("startup")
     def on_startup() -> None:
-        SQLModel.metadata.create_all(engine)
+        ensure_schema_current(engine, app.state.settings)
+        # 알림 템플릿은 시작 시 한 번 컴파일해 캐시합니다.
+        load_alert_templates()
+
+    # 텔레그램 발송기는 앱 수명 동안 커넥션 풀을 유지합니다.
+    @app.on_event("startup")
+    async def start_telegram_sender() -> None:
+        if app.state.settings.TELEGRAM_BOT_TOKEN:
+            await get_telegram_sender().start()
+
+    @app.on_event("shutdown")
+    async def stop_telegram_sender() -> None:
+        await close_telegram_sender()
+
+    # SCHEDULER_ENABLED면 앱 프로세스 안에서 일일 알림을 예약 실행합니다.
+    @app.on_event("startup")
+    async def start_scheduler() -> None:
+        if app.state.settings.SCHEDULER_ENABLED:
+            app.state.scheduler = create_scheduler(app.state.settings)
+            app.state.scheduler.start()
+
+    @app.on_event("shutdown")
+    async def stop_scheduler() -> None:
+        scheduler = getattr(app.state, "scheduler", None)
+        if scheduler is not None:
+            scheduler.shutdown(wait=False)
+
+    # 비동기 엔진의 연결은 이벤트 루프 안에서 닫아야 하므로 종료 시 명시적으로 정리합니다.
+    @app.on_event("shutdown")
+    async def dispose_async_engine() -> None:
+        await dispose_async_engines()
 
     # 간단한 DB 세션 의존성 사용 예시 (디버그용)
     @app.get("/debug/db-ping")
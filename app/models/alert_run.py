@@ -0,0 +1,57 @@
+"""일일 알림 실행 기록(ledger) 모델을 정의하는 모듈입니다."""
+
+from datetime import date, datetime
+
+from sqlalchemy import UniqueConstraint
+from sqlmodel import Field, SQLModel
+
+from app.core.time import utc_now
+
+
+class AlertRun(SQLModel, table=True):
+    """날짜/샤드별 일일 알림 실행 진행 상황을 저장하는 모델입니다.
+
+    초급자용 설명:
+    - cron 한 번 호출에 정해진 수의 사용자만 처리하고, 어디까지 처리했는지 cursor_user_id에 남깁니다.
+    - 다음 호출은 cursor 이후 사용자부터 이어서 처리하고, 끝까지 가면 done=True가 됩니다.
+    - shard는 "user_id_min-user_id_max" 형태의 문자열로, 사용자 범위를 나눠 여러 cron이 병렬로 돌 수 있게 합니다.
+    - locked_until은 같은 샤드를 동시에 두 번 처리하지 않도록 잡아 두는 임대(lease) 만료 시각입니다.
+    """
+
+    __tablename__ = "alert_run"
+    __table_args__ = (UniqueConstraint("run_date", "shard", name="uq_alert_run_date_shard"),)
+
+    id: int | None = Field(default=None, primary_key=True)
+    run_date: date = Field(index=True)
+    shard: str = Field(max_length=50)
+    cursor_user_id: int = Field(default=0)
+    done: bool = Field(default=False)
+    locked_until: datetime | None = Field(default=None)
+
+    created_at: datetime = Field(default_factory=utc_now)
+    updated_at: datetime = Field(default_factory=utc_now)
+
+
+class AlertDelivery(SQLModel, table=True):
+    """사용자/날짜/채널별 알림 전송 결과를 저장하는 모델입니다.
+
+    초급자용 설명:
+    - (run_date, user_id, channel)은 하나만 존재하므로, 재시도해도 이미 "sent"인 채널은 다시 보내지 않습니다.
+    - 실패한 전송은 "failed"로 남고, 같은 날 마지막 사용자까지 처리한 뒤 그 채널로만 다시 보냅니다.
+      attempts가 ALERT_DELIVERY_MAX_ATTEMPTS에 도달하면 더 이상 시도하지 않습니다.
+    """
+
+    __tablename__ = "alert_delivery"
+    __table_args__ = (
+        UniqueConstraint("run_date", "user_id", "channel", name="uq_alert_delivery_date_user_channel"),
+    )
+
+    id: int | None = Field(default=None, primary_key=True)
+    run_date: date = Field(index=True)
+    user_id: int = Field(index=True, foreign_key="user.id")
+    channel: str = Field(max_length=20)
+    status: str = Field(max_length=20)
+    attempts: int = Field(default=1)
+
+    created_at: datetime = Field(default_factory=utc_now)
+    updated_at: datetime = Field(default_factory=utc_now)
@@ -0,0 +1,29 @@
+"""미리 계산한 알림 발송 일정 모델을 정의하는 모듈입니다."""
+
+from datetime import date
+
+from sqlalchemy import Index, UniqueConstraint
+from sqlmodel import Field, SQLModel
+
+
+class AlertSchedule(SQLModel, table=True):
+    """제품별 알림 발송일(fire_date)을 미리 계산해 저장하는 모델입니다.
+
+    초급자용 설명:
+    - fire_date = 기한(보증 만료/환불 마감) - 사용자 알림 기준일(D-N) 입니다.
+    - 제품 기한이나 사용자 기준일이 바뀔 때마다 갱신해 두면,
+      cron은 "fire_date = 오늘"인 행만 인덱스로 읽으면 됩니다.
+    - kind는 "warranty"(보증 만료) 또는 "refund"(환불 마감)입니다.
+    """
+
+    __tablename__ = "alert_schedule"
+    __table_args__ = (
+        UniqueConstraint("product_id", "kind", "fire_date", name="uq_alert_schedule_product_kind_date"),
+        Index("ix_alert_schedule_fire_date_user", "fire_date", "user_id"),
+    )
+
+    id: int | None = Field(default=None, primary_key=True)
+    user_id: int = Field(index=True, foreign_key="user.id")
+    product_id: int = Field(index=True, foreign_key="product.id")
+    fire_date: date
+    kind: str = Field(max_length=20)
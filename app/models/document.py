@@ -2,13 +2,19 @@
 
 from datetime import datetime
 
+from sqlalchemy import Index
 from sqlmodel import Field, SQLModel
 
 from app.core.time import utc_now
 
 # 문서 원문을 저장하는 테이블입니다.
 class Document(SQLModel, table=True):
-    """업로드된 문서의 원문 텍스트를 저장합니다."""
+    """업로드된 문서의 원문 텍스트를 저장합니다.
+
+    - content_hash는 업로드 파일의 sha256(16진수)으로, 사용자별 중복 업로드 확인에 사용합니다.
+    """
+
+    __table_args__ = (Index("ix_document_user_content_hash", "user_id", "content_hash"),)
 
     id: int | None = Field(default=None, primary_key=True)
     user_id: int = Field(index=True, foreign_key="user.id")
@@ -16,6 +22,7 @@ class Document(SQLModel, table=True):
 
     title: str | None = Field(default=None, max_length=255)
     image_path: str | None = Field(default=None, max_length=500)
+    content_hash: str | None = Field(default=None, max_length=64)
     raw_text: str = Field(default="")
     parsed_fields: str = Field(default="{}")
     evidence: str | None = Field(default=None)
@@ -2,13 +2,19 @@
 
 from datetime import datetime
 
+from sqlalchemy import Index
 from sqlmodel import Field, SQLModel
 
 from app.core.time import utc_now
 
 # 문서 처리 작업 상태를 저장하는 테이블입니다.
 class DocumentProcessingJob(SQLModel, table=True):
-    """문서 업로드 후 OCR/추출 상태를 관리하는 Job 모델입니다."""
+    """문서 업로드 후 OCR/추출 상태를 관리하는 Job 모델입니다.
+
+    - (status, updated_at) 인덱스로 "오래 멈춘 pending/processing Job" 같은 상태별 조회를 빠르게 합니다.
+    """
+
+    __table_args__ = (Index("ix_job_status_updated", "status", "updated_at"),)
 
     id: int | None = Field(default=None, primary_key=True)
     user_id: int = Field(index=True, foreign_key="user.id")
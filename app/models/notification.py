@@ -2,6 +2,7 @@
 
 from datetime import datetime
 
+from sqlalchemy import Index, UniqueConstraint
 from sqlmodel import Field, SQLModel
 
 
@@ -11,7 +12,7 @@ class NotificationSettings(SQLModel, table=True):
     초급자용 설명:
     - user_id를 unique로 두어 1:1 관계를 강제합니다.
     - 알림 미리 알림일은 간단히 JSON 문자열로 저장합니다.
-      (필요하면 나중에 배열 타입이나 별도 테이블로 확장 가능합니다.)
+      (알림 계산용으로는 정규화된 NotificationOffset 테이블을 함께 유지합니다.)
     """
 
     id: int | None = Field(default=None, primary_key=True)
@@ -26,3 +27,24 @@ class NotificationSettings(SQLModel, table=True):
 
     created_at: datetime = Field(default_factory=datetime.utcnow)
     updated_at: datetime = Field(default_factory=datetime.utcnow)
+
+
+class NotificationOffset(SQLModel, table=True):
+    """사용자별 알림 기준일(D-N)을 한 행씩 저장하는 정규화 테이블입니다.
+
+    초급자용 설명:
+    - NotificationSettings의 JSON 문자열은 API 응답용으로 그대로 두고,
+      알림 계산은 이 테이블을 조인해 SQL에서 바로 처리합니다.
+    - kind는 "warranty"(보증 만료) 또는 "refund"(환불 마감)입니다.
+    """
+
+    __tablename__ = "notification_offset"
+    __table_args__ = (
+        UniqueConstraint("user_id", "kind", "days", name="uq_notification_offset_user_kind_days"),
+        Index("ix_notification_offset_kind_days_user", "kind", "days", "user_id"),
+    )
+
+    id: int | None = Field(default=None, primary_key=True)
+    user_id: int = Field(index=True, foreign_key="user.id")
+    kind: str = Field(max_length=20)
+    days: int
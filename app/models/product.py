@@ -2,6 +2,7 @@
 
 from datetime import date, datetime
 
+from sqlalchemy import Index
 from sqlmodel import Field, SQLModel
 
 
@@ -11,8 +12,17 @@ class Product(SQLModel, table=True):
     초급자용 설명:
     - table=True를 주면 SQLModel이 실제 DB 테이블과 1:1 매핑합니다.
     - user_id를 FK로 두어, 각 제품이 어떤 사용자 소유인지(멀티테넌시)를 강제할 수 있습니다.
+    - 조회는 항상 user_id로 먼저 거르므로, (user_id, 날짜/정렬 컬럼) 복합 인덱스로
+      사용자 범위 안에서 바로 범위 검색/정렬을 할 수 있게 합니다.
     """
 
+    __table_args__ = (
+        Index("ix_product_user_warranty_end", "user_id", "warranty_end_date"),
+        Index("ix_product_user_refund_deadline", "user_id", "refund_deadline"),
+        # 목록 키셋 페이지네이션(updated_at, id 정렬)용 인덱스입니다.
+        Index("ix_product_user_updated_id", "user_id", "updated_at", "id"),
+    )
+
     id: int | None = Field(default=None, primary_key=True)
     user_id: int = Field(index=True, foreign_key="user.id")
 
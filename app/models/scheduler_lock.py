@@ -0,0 +1,22 @@
+"""여러 프로세스 중 하나만 예약 작업을 실행하도록 하는 잠금 모델입니다."""
+
+from datetime import datetime
+
+from sqlmodel import Field, SQLModel
+
+
+class SchedulerLock(SQLModel, table=True):
+    """이름별 리더 잠금을 저장하는 모델입니다.
+
+    초급자용 설명:
+    - uvicorn 워커나 인스턴스가 여러 개면 모두 같은 시각에 스케줄러가 깨어납니다.
+    - 각 프로세스는 locked_until이 지난 잠금만 자신의 owner로 가져갈 수 있으므로,
+      한 번에 하나의 프로세스만 작업을 실행합니다.
+    - 프로세스가 죽어도 locked_until이 지나면 다른 프로세스가 이어받을 수 있습니다.
+    """
+
+    __tablename__ = "scheduler_lock"
+
+    name: str = Field(primary_key=True, max_length=100)
+    owner: str | None = Field(default=None, max_length=200)
+    locked_until: datetime | None = Field(default=None)
@@ -0,0 +1,22 @@
+"""적용된 DB 마이그레이션 버전을 기록하는 모델입니다."""
+
+from datetime import datetime
+
+from sqlmodel import Field, SQLModel
+
+from app.core.time import utc_now
+
+
+class SchemaMigration(SQLModel, table=True):
+    """마이그레이션 한 건이 적용되었음을 기록하는 모델입니다.
+
+    초급자용 설명:
+    - 앱 시작 시에는 이 테이블의 최대 version만 읽어 스키마가 최신인지 확인합니다.
+    - 행은 마이그레이션 러너(app/core/migrations.py)만 추가합니다.
+    """
+
+    __tablename__ = "schema_migration"
+
+    version: int = Field(primary_key=True, sa_column_kwargs={"autoincrement": False})
+    name: str = Field(max_length=100)
+    applied_at: datetime = Field(default_factory=utc_now)
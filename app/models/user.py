@@ -11,9 +11,12 @@ class User(SQLModel, table=True):
     초급자용 설명:
     - SQLModel 클래스에 table=True를 주면 실제 DB 테이블로 매핑됩니다.
     - 각 필드는 컬럼이 되고, 제약조건(기본키, 인덱스, unique)도 여기서 정의합니다.
+    - token_version은 액세스 토큰의 ver 클레임과 비교하는 값입니다. 비밀번호를 바꾸면 1 올라가
+      이전에 발급된 토큰이 모두 무효가 됩니다.
     """
 
     id: int | None = Field(default=None, primary_key=True)
     email: str = Field(index=True, unique=True)
     password_hash: str
+    token_version: int = Field(default=0, sa_column_kwargs={"server_default": "0"})
     created_at: datetime = Field(default_factory=datetime.utcnow)
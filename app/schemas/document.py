@@ -12,4 +12,11 @@ class DocumentUploadResponse(BaseModel):
     status: str
 
 
+# 여러 문서 일괄 업로드 응답 스키마입니다.
+class DocumentBatchUploadResponse(BaseModel):
+    """업로드한 파일 순서대로 문서/Job id를 담아 반환합니다."""
+
+    items: list[DocumentUploadResponse]
+
+
 # Job 상태 응답을 위한 베이스 스키마입니다.
@@ -66,3 +66,24 @@ class ProductRead(ProductBase):
 
     class Config:
         orm_mode = True
+
+
+class ProductSummary(BaseModel):
+    """목록 화면용 경량 조회 스키마입니다.
+
+    - raw_text/image_path처럼 목록에서 쓰지 않는 큰 컬럼을 제외합니다.
+    - 목록 조회 시 이 필드들만 SQL에서 읽어 오므로 DB I/O와 마스킹 비용이 함께 줄어듭니다.
+    """
+
+    id: int
+    title: str
+    product_category: str | None = None
+    purchase_date: date | None = None
+    amount: int | None = None
+    store: str | None = None
+    refund_deadline: date | None = None
+    warranty_end_date: date | None = None
+    updated_at: datetime
+
+    class Config:
+        orm_mode = True
@@ -0,0 +1,176 @@
+"""일일 알림 실행 기록(ledger)을 다루는 서비스 모듈입니다.
+
+초급자용 설명:
+- cron이 한 번에 모든 사용자를 처리하지 않고 일정 수(chunk)씩 나눠 처리할 수 있도록
+  실행 진행 상황(AlertRun)과 사용자별 전송 결과(AlertDelivery)를 DB에 남깁니다.
+- 같은 날 cron이 다시 호출되어도 이미 보낸 (사용자, 채널)은 건너뛰므로 중복 발송이 없습니다.
+"""
+
+from __future__ import annotations
+
+from datetime import date, timedelta
+from typing import Iterable, Sequence
+
+from sqlalchemy import or_, update
+from sqlalchemy.exc import IntegrityError
+from sqlmodel import Session, select
+
+from app.core.time import utc_now
+from app.models.alert_run import AlertDelivery, AlertRun
+
+# 전송 결과 상태 값입니다.
+DELIVERY_SENT = "sent"
+DELIVERY_FAILED = "failed"
+
+
+# 사용자 범위를 샤드 키 문자열로 변환합니다.
+def shard_key(user_id_min: int | None, user_id_max: int | None) -> str:
+    """범위가 없으면 "all", 있으면 "min-max" 형태(열린 쪽은 빈 문자열)를 반환합니다."""
+    if user_id_min is None and user_id_max is None:
+        return "all"
+    low = "" if user_id_min is None else str(user_id_min)
+    high = "" if user_id_max is None else str(user_id_max)
+    return f"{low}-{high}"
+
+
+# 날짜/샤드의 실행 기록을 가져오거나 새로 만듭니다.
+def _get_or_create_run(session: Session, run_date: date, shard: str) -> AlertRun:
+    """동시에 두 호출이 만들려고 해도 유니크 제약으로 하나만 남습니다."""
+    statement = select(AlertRun).where(AlertRun.run_date == run_date, AlertRun.shard == shard)
+    run = session.exec(statement).first()
+    if run is not None:
+        return run
+
+    session.add(AlertRun(run_date=run_date, shard=shard))
+    try:
+        session.commit()
+    except IntegrityError:
+        session.rollback()
+    return session.exec(statement).one()
+
+
+# 실행 기록을 잠시 점유(lease)합니다.
+def claim_alert_run(
+    session: Session,
+    run_date: date,
+    shard: str,
+    lease_seconds: int,
+) -> AlertRun | None:
+    """다른 호출이 처리 중이면 None을 반환합니다.
+
+    초급자용 설명:
+    - "잠금이 없거나 만료된 경우에만 잠금 시각을 갱신"하는 UPDATE 한 번으로 점유하므로
+      두 cron이 동시에 같은 샤드를 처리하지 않습니다.
+    - 처리 도중 프로세스가 죽어도 lease_seconds가 지나면 다음 호출이 이어받습니다.
+    """
+    run = _get_or_create_run(session, run_date, shard)
+    now = utc_now()
+    result = session.exec(
+        update(AlertRun)
+        .where(
+            AlertRun.id == run.id,
+            or_(AlertRun.locked_until.is_(None), AlertRun.locked_until < now),
+        )
+        .values(locked_until=now + timedelta(seconds=lease_seconds), updated_at=now)
+    )
+    session.commit()
+    if result.rowcount == 0:
+        return None
+    session.refresh(run)
+    return run
+
+
+# 처리한 chunk만큼 커서를 옮기고 점유를 해제합니다.
+def finish_alert_chunk(session: Session, run: AlertRun, cursor_user_id: int, done: bool) -> None:
+    """cursor_user_id까지 처리했음을 기록합니다."""
+    run.cursor_user_id = cursor_user_id
+    run.done = done
+    run.locked_until = None
+    run.updated_at = utc_now()
+    session.add(run)
+    session.commit()
+
+
+# 점유만 해제합니다. (예외 발생 시 사용)
+def release_alert_run(session: Session, run: AlertRun) -> None:
+    """커서는 그대로 두고 다음 호출이 바로 재시도할 수 있게 합니다."""
+    session.rollback()
+    run.locked_until = None
+    session.add(run)
+    session.commit()
+
+
+# 이미 전송 완료된 (사용자, 채널) 목록을 조회합니다.
+def load_sent_channels(session: Session, run_date: date, user_ids: Sequence[int]) -> set[tuple[int, str]]:
+    """run_date에 status="sent"로 기록된 (user_id, channel) 집합을 반환합니다."""
+    if not user_ids:
+        return set()
+    rows = session.exec(
+        select(AlertDelivery.user_id, AlertDelivery.channel).where(
+            AlertDelivery.run_date == run_date,
+            AlertDelivery.user_id.in_(user_ids),
+            AlertDelivery.status == DELIVERY_SENT,
+        )
+    ).all()
+    return {(row.user_id, row.channel) for row in rows}
+
+
+# 다시 시도할 실패 전송 (사용자, 채널) 목록을 조회합니다.
+def load_retryable_failures(
+    session: Session,
+    run_date: date,
+    max_attempts: int,
+    user_id_min: int | None = None,
+    user_id_max: int | None = None,
+) -> set[tuple[int, str]]:
+    """run_date에 status="failed"이고 attempts가 max_attempts 미만인 (user_id, channel) 집합을 반환합니다.
+
+    - user_id_min/user_id_max로 샤드의 사용자 범위만 조회합니다.
+    """
+    filters = [
+        AlertDelivery.run_date == run_date,
+        AlertDelivery.status == DELIVERY_FAILED,
+        AlertDelivery.attempts < max_attempts,
+    ]
+    if user_id_min is not None:
+        filters.append(AlertDelivery.user_id >= user_id_min)
+    if user_id_max is not None:
+        filters.append(AlertDelivery.user_id <= user_id_max)
+    rows = session.exec(select(AlertDelivery.user_id, AlertDelivery.channel).where(*filters)).all()
+    return {(row.user_id, row.channel) for row in rows}
+
+
+# 전송 결과를 기록합니다.
+def record_deliveries(
+    session: Session,
+    run_date: date,
+    deliveries: Iterable[tuple[int, str, bool]],
+) -> None:
+    """(user_id, channel, 성공 여부) 목록을 AlertDelivery에 upsert 합니다."""
+    deliveries = list(deliveries)
+    if not deliveries:
+        return
+
+    user_ids = sorted({user_id for user_id, _, _ in deliveries})
+    existing = {
+        (row.user_id, row.channel): row
+        for row in session.exec(
+            select(AlertDelivery).where(
+                AlertDelivery.run_date == run_date,
+                AlertDelivery.user_id.in_(user_ids),
+            )
+        ).all()
+    }
+    now = utc_now()
+    for user_id, channel, ok in deliveries:
+        status = DELIVERY_SENT if ok else DELIVERY_FAILED
+        row = existing.get((user_id, channel))
+        if row is None:
+            row = AlertDelivery(run_date=run_date, user_id=user_id, channel=channel, status=status)
+            existing[(user_id, channel)] = row
+        else:
+            row.status = status
+            row.attempts += 1
+            row.updated_at = now
+        session.add(row)
+    session.commit()
@@ -0,0 +1,168 @@
+"""알림 발송 일정(alert_schedule)을 계산/갱신하는 서비스 모듈입니다.
+
+초급자용 설명:
+- 제품 생성/수정/삭제, 문서 처리 완료, 알림 기준일 변경 시 해당 범위의 일정만 다시 계산합니다.
+- rebuild_alert_schedule은 전체를 다시 계산하는 백필/복구용이고,
+  check_alert_schedule은 저장된 일정이 실제 데이터와 일치하는지 검사합니다.
+- 발송일이 지난 일정은 일일 알림 실행이 끝날 때 prune_past_schedule로 지워 테이블이 계속 커지지 않게 합니다.
+"""
+
+from __future__ import annotations
+
+from datetime import date, timedelta
+from typing import Iterable, Iterator
+
+from sqlalchemy import delete, exists, or_
+from sqlmodel import Session, select
+
+from app.models.alert_schedule import AlertSchedule
+from app.models.notification import NotificationOffset
+from app.models.product import Product
+from app.services.notification_offsets import REFUND, WARRANTY
+
+# 일정 한 건을 나타내는 (user_id, product_id, fire_date, kind) 튜플입니다.
+ScheduleKey = tuple[int, int, date, str]
+
+# 전체 재계산 시 한 번에 읽을 제품 수입니다.
+REBUILD_BATCH_SIZE = 1000
+
+
+# 종류별 기한 날짜를 반환합니다.
+def _deadline_for(product: Product, kind: str) -> date | None:
+    """kind에 해당하는 제품 기한 컬럼 값을 반환합니다."""
+    if kind == WARRANTY:
+        return product.warranty_end_date
+    if kind == REFUND:
+        return product.refund_deadline
+    return None
+
+
+# 제품 하나의 알림 일정을 계산합니다.
+def compute_schedule(product: Product, offsets: Iterable[tuple[str, int]]) -> Iterator[ScheduleKey]:
+    """(kind, days) 기준일마다 기한 - days 날짜를 만들어 냅니다."""
+    for kind, days in offsets:
+        deadline = _deadline_for(product, kind)
+        if deadline is not None and product.id is not None:
+            yield (product.user_id, product.id, deadline - timedelta(days=days), kind)
+
+
+# 사용자의 알림 기준일 목록을 읽습니다.
+def _load_user_offsets(session: Session, user_id: int) -> list[tuple[str, int]]:
+    """NotificationOffset에서 (kind, days) 목록을 반환합니다."""
+    rows = session.exec(
+        select(NotificationOffset.kind, NotificationOffset.days).where(NotificationOffset.user_id == user_id)
+    ).all()
+    return [(row.kind, row.days) for row in rows]
+
+
+# 일정 키 목록을 AlertSchedule 행으로 추가합니다.
+def _add_schedule_rows(session: Session, keys: Iterable[ScheduleKey]) -> int:
+    """같은 키가 중복되지 않도록 set으로 정리한 뒤 추가하고 건수를 반환합니다."""
+    rows = [
+        AlertSchedule(user_id=user_id, product_id=product_id, fire_date=fire_date, kind=kind)
+        for user_id, product_id, fire_date, kind in sorted(set(keys))
+    ]
+    session.add_all(rows)
+    return len(rows)
+
+
+# 제품 하나의 일정을 다시 계산합니다.
+def refresh_product_schedule(session: Session, product: Product) -> None:
+    """제품 생성/수정 직후 호출합니다. (commit은 호출자가 수행)"""
+    remove_product_schedule(session, product.id)
+    _add_schedule_rows(session, compute_schedule(product, _load_user_offsets(session, product.user_id)))
+
+
+# 제품의 일정을 지웁니다.
+def remove_product_schedule(session: Session, product_id: int | None) -> None:
+    """제품 삭제 전에 호출합니다. (commit은 호출자가 수행)"""
+    if product_id is not None:
+        session.exec(delete(AlertSchedule).where(AlertSchedule.product_id == product_id))
+
+
+# 사용자의 모든 제품 일정을 다시 계산합니다.
+def refresh_user_schedule(session: Session, user_id: int) -> None:
+    """알림 기준일이 바뀐 직후 호출합니다. (commit은 호출자가 수행)"""
+    session.exec(delete(AlertSchedule).where(AlertSchedule.user_id == user_id))
+    offsets = _load_user_offsets(session, user_id)
+    if not offsets:
+        return
+    products = session.exec(select(Product).where(Product.user_id == user_id)).all()
+    _add_schedule_rows(session, (key for product in products for key in compute_schedule(product, offsets)))
+
+
+# 발송일이 지난 일정을 지웁니다.
+def prune_past_schedule(
+    session: Session,
+    before: date,
+    user_id_min: int | None = None,
+    user_id_max: int | None = None,
+) -> int:
+    """fire_date < before인 행을 지우고 건수를 반환합니다. (commit은 호출자가 수행)
+
+    - user_id_min/user_id_max로 일일 알림 샤드의 사용자 범위만 지울 수 있습니다.
+    """
+    filters = [AlertSchedule.fire_date < before]
+    if user_id_min is not None:
+        filters.append(AlertSchedule.user_id >= user_id_min)
+    if user_id_max is not None:
+        filters.append(AlertSchedule.user_id <= user_id_max)
+    return session.exec(delete(AlertSchedule).where(*filters)).rowcount or 0
+
+
+# 현재 데이터 기준으로 있어야 할 전체 일정을 계산합니다.
+def _expected_schedule(session: Session) -> Iterator[ScheduleKey]:
+    """기한이 있는 제품을 id 순으로 나눠 읽으며 일정 키를 만들어 냅니다."""
+    offsets_by_user: dict[int, list[tuple[str, int]]] = {}
+    for row in session.exec(select(NotificationOffset.user_id, NotificationOffset.kind, NotificationOffset.days)):
+        offsets_by_user.setdefault(row.user_id, []).append((row.kind, row.days))
+
+    last_id = 0
+    has_deadline = or_(Product.warranty_end_date.is_not(None), Product.refund_deadline.is_not(None))
+    while True:
+        batch = session.exec(
+            select(Product)
+            .where(Product.id > last_id, has_deadline)
+            .order_by(Product.id)
+            .limit(REBUILD_BATCH_SIZE)
+        ).all()
+        if not batch:
+            return
+        for product in batch:
+            yield from compute_schedule(product, offsets_by_user.get(product.user_id, ()))
+        last_id = batch[-1].id
+
+
+# 전체 일정을 다시 만듭니다.
+def rebuild_alert_schedule(session: Session, from_date: date | None = None) -> int:
+    """기존 일정을 모두 지우고 다시 계산한 뒤 커밋하고, 저장한 행 수를 반환합니다.
+
+    - from_date를 주면 그 날짜 이전(이미 지난) 발송일은 만들지 않습니다.
+    """
+    expected = {key for key in _expected_schedule(session) if from_date is None or key[2] >= from_date}
+    session.exec(delete(AlertSchedule))
+    count = _add_schedule_rows(session, expected)
+    session.commit()
+    return count
+
+
+# 저장된 일정과 실제 데이터를 비교합니다.
+def check_alert_schedule(session: Session, from_date: date | None = None) -> tuple[int, int]:
+    """(누락된 일정 수, 남아 있으면 안 되는 일정 수)를 반환합니다.
+
+    - from_date를 주면 그 날짜 이전 발송일은 비교하지 않습니다. (이미 정리된 지난 일정)
+    """
+    expected = {key for key in _expected_schedule(session) if from_date is None or key[2] >= from_date}
+    statement = select(AlertSchedule.user_id, AlertSchedule.product_id, AlertSchedule.fire_date, AlertSchedule.kind)
+    if from_date is not None:
+        statement = statement.where(AlertSchedule.fire_date >= from_date)
+    stored = {(row.user_id, row.product_id, row.fire_date, row.kind) for row in session.exec(statement)}
+    return len(expected - stored), len(stored - expected)
+
+
+# 일정 테이블이 비어 있으면 채웁니다.
+def backfill_alert_schedule(session: Session) -> int:
+    """일정 테이블 도입 전 데이터를 옮기는 용도로, 일정이 하나도 없을 때만 전체를 계산합니다."""
+    if session.exec(select(exists().where(AlertSchedule.id.is_not(None)))).one():
+        return 0
+    return rebuild_alert_schedule(session)
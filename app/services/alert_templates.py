@@ -0,0 +1,104 @@
+"""일일 알림 메시지를 채널별 템플릿으로 렌더링하는 서비스 모듈입니다.
+
+초급자용 설명:
+- 메시지 모양은 app/templates/alerts 아래 Jinja2 템플릿 파일에 둡니다.
+  - text: 이메일 본문(텍스트)
+  - html: 이메일 본문(HTML, 자동 이스케이프)
+  - telegram: 텔레그램 MarkdownV2 (특수문자 이스케이프)
+- 템플릿은 앱 시작 시 한 번 컴파일해 캐시하고, 알림마다 렌더링만 수행합니다.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import date
+from functools import lru_cache
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from jinja2 import Environment, FileSystemLoader, StrictUndefined, Template, select_autoescape
+
+if TYPE_CHECKING:
+    from app.services.notification_service import DailyAlert
+
+# 알림 템플릿 디렉터리입니다.
+TEMPLATE_DIR = Path(__file__).resolve().parents[1] / "templates" / "alerts"
+
+# 채널 이름과 템플릿 파일 매핑입니다.
+TEXT = "text"
+HTML = "html"
+TELEGRAM = "telegram"
+CHANNEL_TEMPLATES = {
+    TEXT: "daily_alert.txt.j2",
+    HTML: "daily_alert.html.j2",
+    TELEGRAM: "daily_alert.telegram.j2",
+}
+
+# 텔레그램 MarkdownV2에서 이스케이프해야 하는 문자 변환표입니다. (정규식보다 str.translate가 빠릅니다)
+_MARKDOWN_V2_TABLE = str.maketrans({char: "\\" + char for char in "_*[]()~`>#+-=|{}.!\\"})
+
+
+# 텔레그램 MarkdownV2 특수문자를 이스케이프합니다.
+def escape_markdown_v2(value: object) -> str:
+    """사용자 입력(제품명/구매처 등)이 서식으로 해석되지 않도록 특수문자 앞에 \\를 붙입니다."""
+    return str(value).translate(_MARKDOWN_V2_TABLE)
+
+
+# 템플릿에서 사용하는 제품 한 건의 표시용 값입니다.
+@dataclass(frozen=True, slots=True)
+class AlertItemView:
+    """템플릿의 item.title 같은 속성 접근이 dict 조회보다 빠르도록 slots 객체로 둡니다."""
+
+    title: str
+    amount: int | None
+    store: str | None
+    refund_deadline: str | None
+    refund_days_left: int | None
+    warranty_end_date: str | None
+    warranty_days_left: int | None
+
+
+# 숫자를 천 단위 구분 기호가 있는 문자열로 바꿉니다.
+def _thousands(value: int) -> str:
+    """12000 -> "12,000" 형태로 변환합니다."""
+    return f"{value:,}"
+
+
+# 템플릿을 컴파일해 채널별로 반환합니다. (프로세스당 한 번)
+@lru_cache(maxsize=1)
+def load_alert_templates() -> dict[str, Template]:
+    """앱 시작 시 호출해 미리 컴파일하고, 이후 호출은 캐시된 템플릿을 돌려줍니다."""
+    env = Environment(
+        loader=FileSystemLoader(TEMPLATE_DIR),
+        autoescape=select_autoescape(enabled_extensions=("html.j2",), default_for_string=False),
+        trim_blocks=True,
+        lstrip_blocks=True,
+        undefined=StrictUndefined,
+    )
+    env.filters["md"] = escape_markdown_v2
+    env.filters["thousands"] = _thousands
+    return {channel: env.get_template(name) for channel, name in CHANNEL_TEMPLATES.items()}
+
+
+# 알림 하나의 렌더링 컨텍스트를 만듭니다.
+def build_alert_context(alert: DailyAlert, today: date) -> dict[str, Any]:
+    """D-N 계산 등 채널과 무관한 값은 여기서 한 번만 계산합니다."""
+    items = [
+        AlertItemView(
+            title=item.title,
+            amount=item.amount,
+            store=item.store,
+            refund_deadline=item.refund_deadline.isoformat() if item.refund_deadline else None,
+            refund_days_left=(item.refund_deadline - today).days if item.refund_deadline else None,
+            warranty_end_date=item.warranty_end_date.isoformat() if item.warranty_end_date else None,
+            warranty_days_left=(item.warranty_end_date - today).days if item.warranty_end_date else None,
+        )
+        for item in alert.items
+    ]
+    return {"today": today.isoformat(), "items": items}
+
+
+# 컨텍스트를 지정 채널 템플릿으로 렌더링합니다.
+def render_alert(context: dict[str, Any], channel: str) -> str:
+    """channel은 "text" / "html" / "telegram" 중 하나입니다."""
+    return load_alert_templates()[channel].render(context)
@@ -10,6 +10,7 @@ from typing import Any
 from sqlmodel import Session
 
 import app.core.db as db
+from app.core.job_events import job_event_bus
 from app.core.redaction import redact_in_structure, redact_text
 from app.core.time import utc_now
 from app.extractors.llm import LLMFieldExtractor
@@ -18,6 +19,8 @@ from app.models.document import Document
 from app.models.job import DocumentProcessingJob
 from app.models.product import Product
 from app.ocr.base import OCRClient
+from app.services.alert_schedule import refresh_product_schedule
+from app.services.search_index import index_product
 
 
 # LLM 보완 여부를 판단할 때 사용하는 필드 목록입니다.
@@ -124,7 +127,7 @@ def process_document_job(
     llm_extractor: LLMFieldExtractor,
 ) -> None:
     """OCR → 필드 추출 → 제품 업데이트까지 처리하고 Job 상태를 갱신합니다."""
-    with Session(db.engine) as session:
+    with Session(db.get_worker_engine()) as session:
         job = session.get(DocumentProcessingJob, job_id)
         if not job:
             return
@@ -134,6 +137,7 @@ def process_document_job(
         job.updated_at = utc_now()
         session.add(job)
         session.commit()
+        job_event_bus.publish(job_id)
 
         try:
             # 2) OCR로 raw_text를 추출합니다.
@@ -198,13 +202,16 @@ def process_document_job(
             document.evidence = json.dumps(redact_in_structure(evidence_payload), ensure_ascii=False)
             session.add(document)
 
-            # 7) Job 완료 처리
+            # 7) 검색 인덱스/알림 일정을 갱신하고 Job 완료 처리
+            index_product(session, product)
+            refresh_product_schedule(session, product)
             job.status = "completed"
             job.error = redact_text(warning_message) if warning_message else None
             job.product_id = product.id
             job.updated_at = utc_now()
             session.add(job)
             session.commit()
+            job_event_bus.publish(job_id)
         except Exception as exc:
             # 실패 시 상태를 failed로 바꾸고 에러 메시지를 저장합니다.
             job.status = "failed"
@@ -212,3 +219,28 @@ def process_document_job(
             job.updated_at = utc_now()
             session.add(job)
             session.commit()
+            job_event_bus.publish(job_id)
+
+
+# 일괄 업로드된 문서들을 차례로 처리하는 백그라운드 작업입니다.
+def process_document_jobs(
+    jobs: list[tuple[int, int, str]],
+    user_id: int,
+    ocr_client: OCRClient,
+    llm_extractor: LLMFieldExtractor,
+) -> None:
+    """(job_id, document_id, image_path) 목록을 업로드 순서대로 처리합니다.
+
+    초급자용 설명:
+    - 파일마다 작업을 따로 등록하지 않고 한 묶음으로 등록해, 수백 개를 올려도 스레드풀을 모두 차지하지 않습니다.
+    - 각 Job의 실패는 process_document_job 안에서 기록되므로 나머지 Job은 계속 처리됩니다.
+    """
+    for job_id, document_id, image_path in jobs:
+        process_document_job(
+            job_id=job_id,
+            document_id=document_id,
+            user_id=user_id,
+            image_path=image_path,
+            ocr_client=ocr_client,
+            llm_extractor=llm_extractor,
+        )
@@ -1,33 +1,173 @@
-"""이메일 알림 발송을 담당하는 서비스 스켈레톤입니다."""
+"""이메일 알림 발송을 담당하는 서비스 모듈입니다."""
 
-from typing import Sequence
+from __future__ import annotations
 
-from aiosmtplib import SMTP
+from dataclasses import dataclass
+from email.message import EmailMessage
+from typing import Any, Callable, Sequence
 
-from app.core.config import get_settings
+import anyio
+from aiosmtplib import SMTP, SMTPRecipientsRefused, SMTPResponseException
+
+from app.core.config import AppSettings, get_settings
+
+
+# 풀에서 관리하는 SMTP 연결 하나입니다.
+@dataclass
+class _PooledConnection:
+    client: Any
+    sent: int = 0
+
+
+# 새 연결로 다시 보내 볼 만한 전송 오류인지 판단합니다.
+def _is_retryable(exc: Exception) -> bool:
+    """연결 끊김/타임아웃과 4xx(일시적 오류) 응답만 재시도합니다.
+
+    - 5xx 응답(잘못된 주소, 메시지 거부 등)과 수신자 전체 거부는 다시 보내도 같은 결과이므로 바로 실패로 둡니다.
+    """
+    if isinstance(exc, SMTPRecipientsRefused):
+        return False
+    if isinstance(exc, SMTPResponseException):
+        return 400 <= exc.code < 500
+    return isinstance(exc, OSError)
+
+
+# 인증된 SMTP 연결을 재사용하는 커넥션 풀입니다.
+class SMTPConnectionPool:
+    """여러 메일을 보내는 동안 소수의 SMTP 연결을 열어 두고 돌려 씁니다.
+
+    초급자용 설명:
+    - 메일마다 연결/STARTTLS/로그인을 새로 하면 한 통에 수백 ms가 더 듭니다.
+    - 풀은 최대 max_connections개의 연결을 유지하며, 한 연결로 max_messages_per_connection통까지 보낸 뒤
+      서버 제한에 걸리지 않도록 연결을 닫고 새로 엽니다.
+    - 전송 중 연결이 끊기거나 4xx 응답을 받으면 그 연결을 버리고 새 연결로 한 번 다시 시도합니다.
+      (5xx 응답/수신자 거부는 재시도하지 않습니다)
+    """
+
+    def __init__(
+        self,
+        settings: AppSettings,
+        *,
+        max_connections: int | None = None,
+        max_messages_per_connection: int | None = None,
+        smtp_factory: Callable[..., Any] = SMTP,
+    ) -> None:
+        self.settings = settings
+        self.max_connections = max(1, max_connections or settings.SMTP_POOL_MAX_CONNECTIONS)
+        self.max_messages_per_connection = max(
+            1, max_messages_per_connection or settings.SMTP_MAX_MESSAGES_PER_CONNECTION
+        )
+        self._smtp_factory = smtp_factory
+        self._slots = anyio.Semaphore(self.max_connections)
+        self._idle: list[_PooledConnection] = []
+
+    # 새 SMTP 연결을 열고 로그인합니다.
+    async def _connect(self) -> _PooledConnection:
+        """STARTTLS 후 계정 정보가 있으면 로그인까지 마친 연결을 반환합니다."""
+        client = self._smtp_factory(
+            hostname=self.settings.SMTP_HOST,
+            port=self.settings.SMTP_PORT,
+            start_tls=True,
+        )
+        await client.connect()
+        if self.settings.SMTP_USERNAME:
+            await client.login(self.settings.SMTP_USERNAME, self.settings.SMTP_PASSWORD or "")
+        return _PooledConnection(client=client)
+
+    # 연결을 조용히 닫습니다.
+    @staticmethod
+    async def _discard(connection: _PooledConnection) -> None:
+        """이미 끊긴 연결일 수 있으므로 종료 중 오류는 무시합니다."""
+        try:
+            await connection.client.quit()
+        except Exception:
+            try:
+                connection.client.close()
+            except Exception:
+                pass
+
+    # 메일 한 통을 풀의 연결로 전송합니다.
+    async def send(self, from_address: str, to_addresses: Sequence[str], message: str) -> None:
+        """유휴 연결을 꺼내 쓰고, 재시도할 만한 실패면 새 연결로 한 번 더 보냅니다."""
+        async with self._slots:
+            connection = self._idle.pop() if self._idle else None
+            for attempt in range(2):
+                if connection is None:
+                    connection = await self._connect()
+                try:
+                    await connection.client.sendmail(from_address, list(to_addresses), message)
+                except Exception as exc:
+                    await self._discard(connection)
+                    connection = None
+                    if attempt == 1 or not _is_retryable(exc):
+                        raise
+                    continue
+                connection.sent += 1
+                break
+
+            if connection.sent >= self.max_messages_per_connection:
+                await self._discard(connection)
+            else:
+                self._idle.append(connection)
+
+    # 열린 연결을 모두 닫습니다.
+    async def close(self) -> None:
+        """배치 전송이 끝나면 호출합니다."""
+        idle, self._idle = self._idle, []
+        for connection in idle:
+            await self._discard(connection)
+
+
+# 메일 본문을 구성합니다.
+def _build_message(
+    from_address: str,
+    to_addresses: Sequence[str],
+    subject: str,
+    body: str,
+    html: str | None = None,
+) -> str:
+    """From/To/Subject 헤더를 붙인 메일 문자열을 반환합니다.
+
+    - html이 있으면 텍스트/HTML 두 버전을 함께 담아(multipart/alternative) 메일 앱이 고르게 합니다.
+    - 한글 제목/본문도 깨지지 않도록 EmailMessage가 헤더 인코딩을 처리합니다.
+    """
+    message = EmailMessage()
+    message["From"] = from_address
+    message["To"] = ", ".join(to_addresses)
+    message["Subject"] = subject
+    message.set_content(body)
+    if html is not None:
+        message.add_alternative(html, subtype="html")
+    return message.as_string()
 
 
 # 이메일 알림 전송을 담당하는 함수입니다.
-async def send_email(to_addresses: Sequence[str], subject: str, body: str) -> None:
+async def send_email(
+    to_addresses: Sequence[str],
+    subject: str,
+    body: str,
+    pool: SMTPConnectionPool | None = None,
+    html: str | None = None,
+) -> None:
     """간단한 텍스트 이메일을 발송하는 비동기 함수입니다.
 
     초급자용 설명:
     - SMTP 프로토콜을 이용해 메일을 전송합니다.
-    - 실제 서비스에서는 TLS 설정, 에러 처리, HTML 템플릿 등을 추가해야 합니다.
+    - 여러 통을 보낼 때는 pool을 넘겨 연결을 재사용하고, 없으면 이번 한 통만을 위한 연결을 엽니다.
+    - html을 함께 넘기면 HTML 본문을 대체 버전으로 첨부합니다.
     """
 
     # 설정은 호출 시점에 읽어, 테스트/환경에 따라 유연하게 동작하도록 합니다.
-    settings = get_settings()
+    settings = pool.settings if pool is not None else get_settings()
     from_address = settings.SMTP_FROM or settings.SMTP_USERNAME or ""
+    message = _build_message(from_address, to_addresses, subject, body, html)
+
+    if pool is not None:
+        await pool.send(from_address, to_addresses, message)
+        return
 
-    message = f"""From: {from_address}\r
-To: {', '.join(to_addresses)}\r
-Subject: {subject}\r
-\r
-{body}
-"""
-
-    # 주의: 아래 코드는 예시이며, 실제 서비스에서는 예외 처리와 보안 설정이 더 필요합니다.
-    async with SMTP(hostname=settings.SMTP_HOST, port=settings.SMTP_PORT, start_tls=True) as client:
-        await client.login(settings.SMTP_USERNAME, settings.SMTP_PASSWORD)
-        await client.sendmail(from_address, list(to_addresses), message)
+    single_use = SMTPConnectionPool(settings, max_connections=1)
+    try:
+        await single_use.send(from_address, to_addresses, message)
+    finally:
+        await single_use.close()
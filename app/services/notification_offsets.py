@@ -0,0 +1,79 @@
+"""알림 기준일(D-N)을 정규화 테이블과 동기화하는 서비스 모듈입니다."""
+
+from __future__ import annotations
+
+import json
+from typing import Iterable
+
+from sqlalchemy import delete, exists
+from sqlmodel import Session, select
+
+from app.models.notification import NotificationOffset, NotificationSettings
+
+# 알림 기준 종류입니다.
+WARRANTY = "warranty"
+REFUND = "refund"
+
+# 기본 알림 기준일입니다.
+DEFAULT_WARRANTY_DAYS = [30, 7, 3]
+DEFAULT_REFUND_DAYS = [3]
+
+
+# 알림 기준 일수를 JSON 문자열에서 파싱합니다.
+def parse_days(value: str, fallback: list[int]) -> list[int]:
+    """JSON 문자열을 리스트[int]로 변환합니다.
+
+    초급자용 설명:
+    - DB에는 문자열로 저장되므로, 알림 계산 시에는 리스트로 변환해야 합니다.
+    - 파싱이 실패하면 기본값을 사용해 서비스가 깨지지 않게 합니다.
+    """
+
+    try:
+        parsed = json.loads(value)
+        if isinstance(parsed, list) and all(isinstance(v, int) for v in parsed):
+            return parsed
+    except Exception:
+        pass
+    return fallback
+
+
+# 사용자의 알림 기준일 행을 통째로 교체합니다.
+def replace_user_offsets(
+    session: Session,
+    user_id: int,
+    warranty_days: Iterable[int],
+    refund_days: Iterable[int],
+) -> None:
+    """기존 행을 지우고 새 기준일을 추가합니다. (commit은 호출자가 수행)"""
+
+    session.exec(delete(NotificationOffset).where(NotificationOffset.user_id == user_id))
+    rows = [NotificationOffset(user_id=user_id, kind=WARRANTY, days=days) for days in sorted(set(warranty_days))]
+    rows += [NotificationOffset(user_id=user_id, kind=REFUND, days=days) for days in sorted(set(refund_days))]
+    session.add_all(rows)
+
+
+# NotificationSettings의 JSON 값을 기준으로 정규화 테이블을 맞춥니다.
+def sync_offsets_from_settings(session: Session, settings: NotificationSettings) -> None:
+    """설정 생성/수정 직후 호출해 두 저장소를 같은 트랜잭션에서 일치시킵니다."""
+
+    replace_user_offsets(
+        session,
+        settings.user_id,
+        parse_days(settings.warranty_days_before, DEFAULT_WARRANTY_DAYS),
+        parse_days(settings.refund_days_before, DEFAULT_REFUND_DAYS),
+    )
+
+
+# 정규화 테이블이 비어 있는 사용자의 기준일을 JSON 컬럼에서 채웁니다.
+def backfill_notification_offsets(session: Session) -> int:
+    """기준일 행이 하나도 없는 사용자 설정을 옮겨 담고 처리 건수를 반환합니다.
+
+    - 정규화 테이블 도입 전 데이터를 마이그레이션하는 용도이며, 여러 번 실행해도 안전합니다.
+    """
+
+    has_offsets = exists().where(NotificationOffset.user_id == NotificationSettings.user_id)
+    pending = session.exec(select(NotificationSettings).where(~has_offsets)).all()
+    for settings in pending:
+        sync_offsets_from_settings(session, settings)
+    session.commit()
+    return len(pending)
@@ -1,19 +1,36 @@
 """보증/환불 임박 알림을 계산하고, 각 채널로 보내는 서비스 모듈입니다."""
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import date
-import json
-from typing import List
+from typing import Any, Callable, List, Sequence, TypeVar
 
+import anyio
 from sqlmodel import Session, select
+from sqlmodel.ext.asyncio.session import AsyncSession
 
 from app.core.config import AppSettings, get_settings
+from app.core.rate_limit import AsyncTokenBucket
+from app.core.time import alert_today
+from app.models.alert_schedule import AlertSchedule
 from app.models.notification import NotificationSettings
 from app.models.product import Product
 from app.models.telegram_account import TelegramAccount
 from app.models.user import User
-from app.services.email_service import send_email
-from app.services.telegram_service import send_telegram_message
+from app.services.alert_ledger import (
+    claim_alert_run,
+    finish_alert_chunk,
+    load_retryable_failures,
+    load_sent_channels,
+    record_deliveries,
+    release_alert_run,
+    shard_key,
+)
+from app.services.alert_schedule import prune_past_schedule
+from app.services.alert_templates import HTML, TELEGRAM, TEXT, build_alert_context, render_alert
+from app.services.email_service import SMTPConnectionPool, send_email
+from app.services.telegram_service import TelegramRateLimitError, send_telegram_message
+
+T = TypeVar("T")
 
 
 # 알림 대상 제품 정보를 담는 데이터 구조입니다.
@@ -54,93 +71,11 @@ class DailyAlertsSummary:
     telegram_sent: int
     skipped: dict[str, bool | str | None]
     errors: List[str]
-
-
-# 알림 기준 일수를 JSON 문자열에서 파싱합니다.
-def _parse_days(value: str, fallback: list[int]) -> list[int]:
-    """JSON 문자열을 리스트[int]로 변환합니다.
-
-    초급자용 설명:
-    - DB에는 문자열로 저장되므로, 알림 계산 시에는 리스트로 변환해야 합니다.
-    - 파싱이 실패하면 기본값을 사용해 서비스가 깨지지 않게 합니다.
-    """
-
-    try:
-        parsed = json.loads(value)
-        if isinstance(parsed, list) and all(isinstance(v, int) for v in parsed):
-            return parsed
-    except Exception:
-        pass
-    return fallback
-
-
-# 특정 날짜가 알림 기준에 해당하는지 판단합니다.
-def _is_due(target: date | None, days_before: list[int], today: date) -> bool:
-    """목표 날짜가 오늘 기준 D-N 조건에 맞는지 확인합니다."""
-
-    if target is None:
-        return False
-    days_left = (target - today).days
-    return days_left in days_before
-
-
-# 제품 목록에서 알림 대상만 추려 DailyAlertItem으로 변환합니다.
-def _collect_due_items(
-    products: list[Product],
-    today: date,
-    warranty_days: list[int],
-    refund_days: list[int],
-) -> list[DailyAlertItem]:
-    """보증/환불 기한이 임박한 제품만 선별합니다."""
-
-    items: list[DailyAlertItem] = []
-    for product in products:
-        is_warranty_due = _is_due(product.warranty_end_date, warranty_days, today)
-        is_refund_due = _is_due(product.refund_deadline, refund_days, today)
-        if not (is_warranty_due or is_refund_due):
-            continue
-
-        items.append(
-            DailyAlertItem(
-                product_id=product.id or 0,
-                title=product.title,
-                purchase_date=product.purchase_date,
-                refund_deadline=product.refund_deadline,
-                warranty_end_date=product.warranty_end_date,
-                amount=product.amount,
-                store=product.store,
-            )
-        )
-    return items
-
-
-# 사용자에게 보낼 간단한 텍스트 메시지를 생성합니다.
-def _format_alert_message(alert: DailyAlert, today: date) -> str:
-    """알림 메시지를 상세하게 구성합니다."""
-
-    lines = [
-        "🔔 [ASHD] 환불/보증 임박 알림",
-        f"📅 {today.isoformat()}",
-        "",
-        "아래 항목의 기한이 다가오고 있습니다:",
-        "",
-    ]
-    for item in alert.items:
-        lines.append(f"📦 {item.title}")
-        if item.amount:
-            lines.append(f"   💵 금액: {item.amount:,}원")
-        if item.store:
-            lines.append(f"   🏪 구매처: {item.store}")
-        if item.refund_deadline:
-            days_left = (item.refund_deadline - today).days
-            lines.append(f"   ⏰ 환불 마감: {item.refund_deadline} (D-{days_left})")
-        if item.warranty_end_date:
-            days_left = (item.warranty_end_date - today).days
-            lines.append(f"   🛡️ 보증 만료: {item.warranty_end_date} (D-{days_left})")
-        lines.append("")
-    
-    lines.append("⚠️ 기한 내에 처리하세요!")
-    return "\n".join(lines)
+    # chunk 단위 실행 정보: 이번 날짜/샤드 처리가 끝났는지, 어디까지 처리했는지
+    done: bool = True
+    cursor: int | None = None
+    # (user_id, 채널, 성공 여부) 전송 결과 목록
+    deliveries: List[tuple[int, str, bool]] = field(default_factory=list)
 
 
 # SMTP 설정이 충분한지 판단합니다.
@@ -165,54 +100,142 @@ def _is_telegram_configured(settings: AppSettings) -> bool:
     return bool(settings.TELEGRAM_BOT_TOKEN)
 
 
+# 동기/비동기 세션 어느 쪽이든 동기 DB 헬퍼를 실행합니다.
+async def _run_db(session: Session | AsyncSession, fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    """AsyncSession이면 run_sync로 실행해 이벤트 루프를 막지 않고, 동기 Session이면 바로 호출합니다."""
+    if isinstance(session, AsyncSession):
+        return await session.run_sync(fn, *args, **kwargs)
+    return fn(session, *args, **kwargs)
+
+
 # 오늘 기준으로 보증/환불 임박 상품을 찾아 DailyAlert 리스트를 생성합니다.
 async def generate_daily_alerts(
-    session: Session,
+    session: Session | AsyncSession,
     today: date | None = None,
+    after_user_id: int = 0,
+    user_id_max: int | None = None,
+    max_users: int | None = None,
+    user_ids: Sequence[int] | None = None,
 ) -> list[DailyAlert]:
     """오늘 기준 알림 대상을 계산합니다.
 
     초급자용 설명:
     - 이 함수는 DB를 조회해서 “누가, 어떤 제품에 대해” 알림을 받아야 하는지 계산합니다.
     - 실제 전송은 send_daily_alerts에서 처리하도록 분리해 책임을 나눕니다.
+    - 발송일은 제품/기준일이 바뀔 때 alert_schedule에 미리 계산해 두므로,
+      여기서는 "fire_date = 오늘"인 행만 인덱스로 읽습니다.
+    - after_user_id/user_id_max로 사용자 범위를, max_users로 한 번에 처리할 사용자 수를 제한합니다.
+    - user_ids를 넘기면 그 사용자만 계산합니다. (실패 전송 재시도용)
     """
 
-    base_date = today or date.today()
-    alerts: list[DailyAlert] = []
-
-    settings_list = session.exec(select(NotificationSettings)).all()
-    for settings in settings_list:
-        user = session.exec(select(User).where(User.id == settings.user_id)).first()
-        if not user:
-            continue
-
-        warranty_days = _parse_days(settings.warranty_days_before, [30, 7, 3])
-        refund_days = _parse_days(settings.refund_days_before, [3])
-
-        products = session.exec(select(Product).where(Product.user_id == settings.user_id)).all()
-        items = _collect_due_items(products, base_date, warranty_days, refund_days)
-        if not items:
-            continue
-
-        email = user.email if settings.email_enabled else None
-        telegram_chat_id: str | None = None
-        if settings.telegram_enabled:
-            account = session.exec(
-                select(TelegramAccount).where(TelegramAccount.user_id == settings.user_id)
-            ).first()
-            if account:
-                telegram_chat_id = account.chat_id
-
-        alerts.append(
-            DailyAlert(
-                user_id=settings.user_id,
-                email=email,
-                telegram_chat_id=telegram_chat_id,
-                items=items,
+    return await _run_db(
+        session,
+        _query_daily_alerts,
+        today or alert_today(),
+        after_user_id,
+        user_id_max,
+        max_users,
+        user_ids,
+    )
+
+
+# base_date에 발송 일정이 있는 사용자 id를 앞에서부터 max_users명 고릅니다.
+def _select_alert_user_ids(
+    session: Session,
+    base_date: date,
+    after_user_id: int,
+    user_id_max: int | None,
+    max_users: int,
+) -> list[int]:
+    """alert_schedule만 읽으므로, 사용자/알림 설정 join에서 빠지는 사용자도 포함됩니다. (chunk 경계/커서 계산용)"""
+
+    filters = [AlertSchedule.fire_date == base_date, AlertSchedule.user_id > after_user_id]
+    if user_id_max is not None:
+        filters.append(AlertSchedule.user_id <= user_id_max)
+    statement = (
+        select(AlertSchedule.user_id)
+        .where(*filters)
+        .distinct()
+        .order_by(AlertSchedule.user_id)
+        .limit(max_users)
+    )
+    return list(session.exec(statement).all())
+
+
+# generate_daily_alerts의 실제 조회 로직입니다. (동기 세션 기준)
+def _query_daily_alerts(
+    session: Session,
+    base_date: date,
+    after_user_id: int,
+    user_id_max: int | None,
+    max_users: int | None,
+    user_ids: Sequence[int] | None = None,
+) -> list[DailyAlert]:
+    """alert_schedule에서 base_date에 발송할 행을 읽어 사용자별 DailyAlert로 묶습니다."""
+
+    filters = [AlertSchedule.fire_date == base_date, AlertSchedule.user_id > after_user_id]
+    if user_id_max is not None:
+        filters.append(AlertSchedule.user_id <= user_id_max)
+    if user_ids is not None:
+        filters.append(AlertSchedule.user_id.in_(user_ids))
+
+    if max_users is not None:
+        # 알림 대상 사용자 id를 앞에서부터 max_users명만 골라 그 범위까지만 읽습니다.
+        chunk_user_ids = _select_alert_user_ids(session, base_date, after_user_id, user_id_max, max_users)
+        if not chunk_user_ids:
+            return []
+        filters.append(AlertSchedule.user_id <= chunk_user_ids[-1])
+
+    statement = (
+        select(
+            Product.id,
+            Product.user_id,
+            Product.title,
+            Product.purchase_date,
+            Product.refund_deadline,
+            Product.warranty_end_date,
+            Product.amount,
+            Product.store,
+            User.email,
+            NotificationSettings.email_enabled,
+            NotificationSettings.telegram_enabled,
+            TelegramAccount.chat_id,
+        )
+        .select_from(AlertSchedule)
+        .join(Product, Product.id == AlertSchedule.product_id)
+        .join(User, User.id == AlertSchedule.user_id)
+        .join(NotificationSettings, NotificationSettings.user_id == AlertSchedule.user_id)
+        .outerjoin(TelegramAccount, TelegramAccount.user_id == AlertSchedule.user_id)
+        .where(*filters)
+        .distinct()
+        .order_by(Product.user_id, Product.id)
+    )
+
+    alerts_by_user: dict[int, DailyAlert] = {}
+    for row in session.exec(statement).all():
+        alert = alerts_by_user.get(row.user_id)
+        if alert is None:
+            alert = DailyAlert(
+                user_id=row.user_id,
+                email=row.email if row.email_enabled else None,
+                telegram_chat_id=row.chat_id if row.telegram_enabled else None,
+                items=[],
+            )
+            alerts_by_user[row.user_id] = alert
+
+        alert.items.append(
+            DailyAlertItem(
+                product_id=row.id or 0,
+                title=row.title,
+                purchase_date=row.purchase_date,
+                refund_deadline=row.refund_deadline,
+                warranty_end_date=row.warranty_end_date,
+                amount=row.amount,
+                store=row.store,
             )
         )
 
-    return alerts
+    return list(alerts_by_user.values())
 
 
 # 알림 리스트를 각 채널로 발송하고 요약을 반환합니다.
@@ -226,10 +249,12 @@ async def send_daily_alerts(
     초급자용 설명:
     - 외부 설정이 없으면 전송을 건너뛰고, 실패 대신 안전한 요약을 반환합니다.
     - 한 사용자 전송 실패가 전체 cron을 죽이지 않도록 예외를 잡아 집계만 남깁니다.
+    - 전송은 채널별 동시성 한도 안에서 병렬로 진행하고, 텔레그램은 토큰 버킷으로
+      전체/채팅방별 초당 전송량을 제한하며 429 응답의 retry_after를 지킵니다.
     """
 
-    base_date = today or date.today()
     config = settings or get_settings()
+    base_date = today or alert_today(config)
 
     email_targets = sum(1 for alert in alerts if alert.email)
     telegram_targets = sum(1 for alert in alerts if alert.telegram_chat_id)
@@ -254,35 +279,91 @@ async def send_daily_alerts(
 
     email_sent = 0
     telegram_sent = 0
-
-    if email_configured:
-        for alert in alerts:
-            if not alert.email:
-                continue
+    deliveries: list[tuple[int, str, bool]] = []
+
+    email_limit = anyio.Semaphore(max(1, config.ALERT_EMAIL_CONCURRENCY))
+    telegram_limit = anyio.Semaphore(max(1, config.ALERT_TELEGRAM_CONCURRENCY))
+    telegram_bucket = AsyncTokenBucket(config.TELEGRAM_RATE_PER_SECOND)
+    chat_buckets: dict[int, AsyncTokenBucket] = {}
+    # 이메일은 실행 동안 소수의 인증된 SMTP 연결을 재사용합니다.
+    email_pool = SMTPConnectionPool(config)
+    # 채널과 무관한 렌더링 값(D-N 등)은 사용자별로 한 번만 계산합니다.
+    contexts: dict[int, dict[str, object]] = {}
+
+    def _context_for(alert: DailyAlert) -> dict[str, object]:
+        context = contexts.get(alert.user_id)
+        if context is None:
+            context = contexts[alert.user_id] = build_alert_context(alert, base_date)
+        return context
+
+    async def _deliver_email(alert: DailyAlert) -> None:
+        nonlocal email_sent
+        async with email_limit:
             try:
                 subject = f"[ASHD] {base_date.isoformat()} 알림"
-                body = _format_alert_message(alert, base_date)
-                await send_email([alert.email], subject, body)
+                context = _context_for(alert)
+                await send_email(
+                    [alert.email],
+                    subject,
+                    render_alert(context, TEXT),
+                    pool=email_pool,
+                    html=render_alert(context, HTML),
+                )
                 email_sent += 1
+                deliveries.append((alert.user_id, "email", True))
             except Exception:
                 errors.append(f"email_failed_user_{alert.user_id}")
-
-    if telegram_configured:
-        for alert in alerts:
-            if not alert.telegram_chat_id:
-                continue
-            try:
-                chat_id = int(alert.telegram_chat_id)
-            except ValueError:
-                errors.append(f"telegram_invalid_chat_id_user_{alert.user_id}")
-                continue
-
-            try:
-                text = _format_alert_message(alert, base_date)
-                await send_telegram_message(chat_id, text)
-                telegram_sent += 1
-            except Exception:
-                errors.append(f"telegram_failed_user_{alert.user_id}")
+                deliveries.append((alert.user_id, "email", False))
+
+    async def _deliver_telegram(alert: DailyAlert, chat_id: int) -> None:
+        nonlocal telegram_sent
+        # 같은 채팅방으로 가는 메시지는 채팅방별 간격을 지키도록 버킷을 공유합니다.
+        chat_bucket = chat_buckets.setdefault(
+            chat_id,
+            AsyncTokenBucket(1 / max(config.TELEGRAM_PER_CHAT_INTERVAL_SECONDS, 0.001), capacity=1),
+        )
+        async with telegram_limit:
+            # 재시도 때도 같은 본문을 쓰도록 루프 밖에서 한 번만 렌더링합니다.
+            text = render_alert(_context_for(alert), TELEGRAM)
+            for attempt in range(config.TELEGRAM_MAX_RETRIES + 1):
+                await chat_bucket.acquire()
+                await telegram_bucket.acquire()
+                try:
+                    await send_telegram_message(chat_id, text, parse_mode="MarkdownV2")
+                    telegram_sent += 1
+                    deliveries.append((alert.user_id, "telegram", True))
+                    return
+                except TelegramRateLimitError as exc:
+                    # 429는 봇 전체 한도 초과이므로 모든 텔레그램 전송을 retry_after 동안 멈춥니다.
+                    telegram_bucket.pause(exc.retry_after)
+                    if attempt == config.TELEGRAM_MAX_RETRIES:
+                        errors.append(f"telegram_rate_limited_user_{alert.user_id}")
+                        deliveries.append((alert.user_id, "telegram", False))
+                except Exception:
+                    errors.append(f"telegram_failed_user_{alert.user_id}")
+                    deliveries.append((alert.user_id, "telegram", False))
+                    return
+
+    # 채널별 동시성 제한 안에서 모든 전송을 한 태스크 그룹으로 병렬 실행합니다.
+    try:
+        async with anyio.create_task_group() as task_group:
+            if email_configured:
+                for alert in alerts:
+                    if alert.email:
+                        task_group.start_soon(_deliver_email, alert)
+
+            if telegram_configured:
+                for alert in alerts:
+                    if not alert.telegram_chat_id:
+                        continue
+                    try:
+                        chat_id = int(alert.telegram_chat_id)
+                    except ValueError:
+                        errors.append(f"telegram_invalid_chat_id_user_{alert.user_id}")
+                        continue
+                    task_group.start_soon(_deliver_telegram, alert, chat_id)
+    finally:
+        await email_pool.close()
 
     return DailyAlertsSummary(
         date=base_date,
@@ -293,15 +374,171 @@ async def send_daily_alerts(
         telegram_sent=telegram_sent,
         skipped=skipped,
         errors=errors,
+        deliveries=deliveries,
+    )
+
+
+# 이미 전송 완료된 채널을 알림에서 제외합니다.
+def _without_sent_channels(alerts: list[DailyAlert], sent: set[tuple[int, str]]) -> list[DailyAlert]:
+    """재시도 시 같은 날 이미 보낸 (사용자, 채널)로는 다시 보내지 않도록 합니다."""
+    pending: list[DailyAlert] = []
+    for alert in alerts:
+        email = None if (alert.user_id, "email") in sent else alert.email
+        chat_id = None if (alert.user_id, "telegram") in sent else alert.telegram_chat_id
+        if email or chat_id:
+            pending.append(
+                DailyAlert(user_id=alert.user_id, email=email, telegram_chat_id=chat_id, items=alert.items)
+            )
+    return pending
+
+
+# 실패했던 채널만 남긴 알림 목록을 만듭니다.
+def _only_failed_channels(alerts: list[DailyAlert], failed: set[tuple[int, str]]) -> list[DailyAlert]:
+    """재시도 때는 이미 성공한 채널로 다시 보내지 않도록 실패한 (사용자, 채널)만 남깁니다."""
+    retry: list[DailyAlert] = []
+    for alert in alerts:
+        email = alert.email if (alert.user_id, "email") in failed else None
+        chat_id = alert.telegram_chat_id if (alert.user_id, "telegram") in failed else None
+        if email or chat_id:
+            retry.append(DailyAlert(user_id=alert.user_id, email=email, telegram_chat_id=chat_id, items=alert.items))
+    return retry
+
+
+# 샤드 범위의 실패 전송을 한 번 더 시도합니다.
+async def _retry_failed_deliveries(
+    session: Session | AsyncSession,
+    base_date: date,
+    config: AppSettings,
+    user_id_min: int | None,
+    user_id_max: int | None,
+) -> DailyAlertsSummary:
+    """attempts가 한도 미만인 실패 전송을 다시 보내고, 시도한 모든 (사용자, 채널)의 attempts를 올립니다.
+
+    - 알림 대상에서 빠졌거나 채널 설정이 없어 보내지 못한 경우도 실패로 기록해 시도 횟수가 반드시 늘어나게 합니다.
+    """
+    failed = await _run_db(
+        session,
+        load_retryable_failures,
+        base_date,
+        config.ALERT_DELIVERY_MAX_ATTEMPTS,
+        user_id_min,
+        user_id_max,
+    )
+    if not failed:
+        return await send_daily_alerts([], today=base_date, settings=config)
+
+    alerts = await generate_daily_alerts(
+        session,
+        today=base_date,
+        user_ids=sorted({user_id for user_id, _ in failed}),
+    )
+    summary = await send_daily_alerts(_only_failed_channels(alerts, failed), today=base_date, settings=config)
+    outcomes = {(user_id, channel): ok for user_id, channel, ok in summary.deliveries}
+    await _run_db(
+        session,
+        record_deliveries,
+        base_date,
+        [(user_id, channel, outcomes.get((user_id, channel), False)) for user_id, channel in sorted(failed)],
     )
+    return summary
 
 
-# 알림 계산과 발송을 한 번에 실행하는 진입점입니다.
+# 알림 계산과 발송을 chunk 단위로 실행하는 진입점입니다.
 async def run_daily_alerts(
-    session: Session,
+    session: Session | AsyncSession,
     today: date | None = None,
+    chunk_size: int | None = None,
+    user_id_min: int | None = None,
+    user_id_max: int | None = None,
 ) -> DailyAlertsSummary:
-    """알림 계산과 전송을 한 번에 수행합니다."""
+    """알림 대상 사용자를 chunk_size명까지 계산/전송하고 진행 상황을 기록합니다.
+
+    초급자용 설명:
+    - 한 번의 호출은 (날짜, 사용자 범위) 실행 기록의 커서 다음 사용자부터 chunk_size명만 처리합니다.
+    - 반환값의 done이 False면 같은 요청을 다시 호출해 이어서 처리하면 됩니다.
+    - user_id_min/user_id_max로 사용자 범위를 나누면 여러 cron이 서로 다른 범위를 병렬로 처리할 수 있습니다.
+    - 같은 날 이미 보낸 (사용자, 채널)은 기록을 보고 건너뛰므로 재시도해도 중복 발송되지 않습니다.
+    - 마지막 사용자까지 처리한 뒤에는 실패한 전송만 ALERT_DELIVERY_MAX_ATTEMPTS번까지 다시 보내고,
+      다시 보낼 실패가 남아 있는 동안은 done=False를 반환합니다.
+    - AsyncSession을 넘기면(cron 라우트) DB 작업이 이벤트 루프를 막지 않고 비동기 드라이버로 실행됩니다.
+    """
+
+    config = get_settings()
+    base_date = today or alert_today(config)
+    size = max(1, chunk_size or config.ALERT_CHUNK_SIZE)
+
+    shard = shard_key(user_id_min, user_id_max)
+    run = await _run_db(session, claim_alert_run, base_date, shard, config.ALERT_RUN_LEASE_SECONDS)
+    if run is None:
+        summary = _empty_summary(base_date, done=False)
+        summary.skipped["reason"] = "run_in_progress"
+        return summary
+    if run.done:
+        cursor = run.cursor_user_id
+        await _run_db(session, finish_alert_chunk, run, cursor, done=True)
+        return _empty_summary(base_date, done=True, cursor=cursor)
+
+    try:
+        after_user_id = max(run.cursor_user_id, (user_id_min or 1) - 1)
+        # chunk 경계는 발송 일정 기준으로 먼저 정합니다. 알림 설정이 없는 사용자처럼 join에서 빠지는
+        # 사용자가 있어도, 고른 id 수로 끝 여부를 판단하고 커서를 마지막 id까지 옮길 수 있습니다.
+        chunk_user_ids = await _run_db(
+            session, _select_alert_user_ids, base_date, after_user_id, user_id_max, size
+        )
+        alerts: list[DailyAlert] = []
+        if chunk_user_ids:
+            alerts = await generate_daily_alerts(
+                session,
+                today=base_date,
+                after_user_id=after_user_id,
+                user_id_max=chunk_user_ids[-1],
+            )
+            sent = await _run_db(session, load_sent_channels, base_date, [alert.user_id for alert in alerts])
+            summary = await send_daily_alerts(
+                _without_sent_channels(alerts, sent), today=base_date, settings=config
+            )
+            await _run_db(session, record_deliveries, base_date, summary.deliveries)
+        else:
+            # 새 대상이 없으면 마지막 사용자까지 처리한 것이므로 실패했던 전송을 다시 보냅니다.
+            summary = await _retry_failed_deliveries(session, base_date, config, user_id_min, user_id_max)
+
+        # 대상 끝에 도달했어도 다시 보낼 실패가 남아 있으면 다음 호출에서 재시도하도록 done을 미룹니다.
+        done = len(chunk_user_ids) < size and not await _run_db(
+            session,
+            load_retryable_failures,
+            base_date,
+            config.ALERT_DELIVERY_MAX_ATTEMPTS,
+            user_id_min,
+            user_id_max,
+        )
+        if done:
+            # 샤드를 끝까지 처리했으면 지난 발송일의 일정은 더 읽을 일이 없으므로 함께 지웁니다. (아래 커밋에 포함)
+            await _run_db(session, prune_past_schedule, base_date, user_id_min, user_id_max)
+    except Exception:
+        await _run_db(session, release_alert_run, run)
+        raise
+
+    cursor = chunk_user_ids[-1] if chunk_user_ids else after_user_id
+    await _run_db(session, finish_alert_chunk, run, cursor, done)
+
+    summary.processed = len(alerts)
+    summary.done = done
+    summary.cursor = cursor
+    return summary
 
-    alerts = await generate_daily_alerts(session, today=today)
-    return await send_daily_alerts(alerts, today=today)
+
+# 전송할 대상이 없을 때의 요약을 만듭니다.
+def _empty_summary(base_date: date, done: bool, cursor: int | None = None) -> DailyAlertsSummary:
+    """처리 건수가 0인 DailyAlertsSummary를 반환합니다."""
+    return DailyAlertsSummary(
+        date=base_date,
+        processed=0,
+        email_targets=0,
+        telegram_targets=0,
+        email_sent=0,
+        telegram_sent=0,
+        skipped={"email": False, "telegram": False, "reason": None},
+        errors=[],
+        done=done,
+        cursor=cursor,
+    )
@@ -0,0 +1,139 @@
+"""앱 프로세스 안에서 일일 알림을 예약 실행하는 스케줄러 모듈입니다.
+
+초급자용 설명:
+- SCHEDULER_ENABLED=true면 외부 cron 없이도 정해진 시각(DAILY_ALERTS_TIME, SCHEDULER_TIMEZONE)에
+  일일 알림을 실행합니다. HTTP 요청이 아니므로 요청 타임아웃 제한을 받지 않습니다.
+- 워커/인스턴스가 여러 개여도 DB 리더 잠금(scheduler_lock)을 잡은 프로세스 하나만 실행합니다.
+- 외부 cron 방식(/internal/cron/daily-alerts)과 같은 실행 기록을 쓰므로 함께 켜도 중복 발송되지 않습니다.
+"""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+import logging
+import os
+import socket
+import uuid
+from zoneinfo import ZoneInfo
+
+from apscheduler.schedulers.asyncio import AsyncIOScheduler
+from apscheduler.triggers.cron import CronTrigger
+from sqlalchemy import or_, update
+from sqlalchemy.exc import IntegrityError
+from sqlmodel import Session
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+import app.core.db as db
+from app.core.config import AppSettings, get_settings
+from app.core.time import alert_today, utc_now
+from app.models.scheduler_lock import SchedulerLock
+from app.services.notification_service import run_daily_alerts
+
+logger = logging.getLogger(__name__)
+
+# 일일 알림 작업/잠금 이름입니다.
+DAILY_ALERTS_JOB = "daily-alerts"
+
+# 한 번의 예약 실행에서 반복할 최대 chunk 수입니다. (무한 반복 방지)
+MAX_CHUNKS_PER_RUN = 10_000
+
+# 이 프로세스를 구분하는 잠금 소유자 값입니다.
+PROCESS_OWNER = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+
+
+# 리더 잠금을 획득하거나 연장합니다.
+def acquire_leader_lock(session: Session, name: str, owner: str, ttl_seconds: int) -> bool:
+    """잠금이 비었거나 만료됐거나 이미 내 것이면 locked_until을 연장하고 True를 반환합니다.
+
+    - 조건부 UPDATE 한 번으로 처리하므로 여러 프로세스가 동시에 시도해도 하나만 성공합니다.
+    """
+    if session.get(SchedulerLock, name) is None:
+        session.add(SchedulerLock(name=name))
+        try:
+            session.commit()
+        except IntegrityError:
+            session.rollback()
+
+    now = utc_now()
+    result = session.exec(
+        update(SchedulerLock)
+        .where(
+            SchedulerLock.name == name,
+            or_(
+                SchedulerLock.locked_until.is_(None),
+                SchedulerLock.locked_until < now,
+                SchedulerLock.owner == owner,
+            ),
+        )
+        .values(owner=owner, locked_until=now + timedelta(seconds=ttl_seconds))
+    )
+    session.commit()
+    return result.rowcount == 1
+
+
+# 리더 잠금을 해제합니다.
+def release_leader_lock(session: Session, name: str, owner: str) -> None:
+    """내가 가진 잠금만 해제합니다."""
+    session.exec(
+        update(SchedulerLock)
+        .where(SchedulerLock.name == name, SchedulerLock.owner == owner)
+        .values(locked_until=None)
+    )
+    session.commit()
+
+
+# 예약 시각에 실행되는 일일 알림 작업입니다.
+async def run_scheduled_daily_alerts(settings: AppSettings | None = None, owner: str = PROCESS_OWNER) -> int:
+    """리더 잠금을 잡은 경우에만 모든 chunk를 끝까지 처리하고, 처리한 사용자 수를 반환합니다."""
+    config = settings or get_settings()
+    today = alert_today(config)
+    processed = 0
+
+    # 예약 작업은 API와 같은 이벤트 루프에서 돌므로, DB 대기 중에도 루프를 막지 않도록 AsyncSession을 사용합니다.
+    async with AsyncSession(db.get_worker_async_engine(), expire_on_commit=False) as session:
+        ttl_seconds = config.SCHEDULER_LOCK_TTL_SECONDS
+        if not await session.run_sync(acquire_leader_lock, DAILY_ALERTS_JOB, owner, ttl_seconds):
+            logger.info("daily alerts skipped: another process holds the scheduler lock")
+            return 0
+        try:
+            for _ in range(MAX_CHUNKS_PER_RUN):
+                summary = await run_daily_alerts(session, today=today)
+                processed += summary.processed
+                if summary.done or summary.skipped.get("reason") == "run_in_progress":
+                    break
+                # chunk마다 잠금을 연장해 긴 실행 중 다른 프로세스가 끼어들지 않게 합니다.
+                await session.run_sync(acquire_leader_lock, DAILY_ALERTS_JOB, owner, ttl_seconds)
+        except Exception:
+            logger.exception("scheduled daily alerts failed")
+            await session.rollback()
+        finally:
+            await session.run_sync(release_leader_lock, DAILY_ALERTS_JOB, owner)
+
+    logger.info("scheduled daily alerts finished: processed=%s", processed)
+    return processed
+
+
+# "HH:MM" 문자열을 (시, 분)으로 변환합니다.
+def _parse_time(value: str) -> tuple[int, int]:
+    """형식이 잘못되면 ValueError를 발생시켜 앱 시작 단계에서 바로 알 수 있게 합니다."""
+    parsed = datetime.strptime(value.strip(), "%H:%M")
+    return parsed.hour, parsed.minute
+
+
+# 일일 알림 작업을 등록한 스케줄러를 만듭니다. (시작은 호출자가 수행)
+def create_scheduler(settings: AppSettings) -> AsyncIOScheduler:
+    """DAILY_ALERTS_TIME/SCHEDULER_TIMEZONE 기준 cron 트리거로 작업을 등록합니다."""
+    hour, minute = _parse_time(settings.DAILY_ALERTS_TIME)
+    timezone = ZoneInfo(settings.SCHEDULER_TIMEZONE)
+    scheduler = AsyncIOScheduler(timezone=timezone)
+    scheduler.add_job(
+        run_scheduled_daily_alerts,
+        CronTrigger(hour=hour, minute=minute, timezone=timezone),
+        kwargs={"settings": settings},
+        id=DAILY_ALERTS_JOB,
+        max_instances=1,
+        coalesce=True,
+        misfire_grace_time=3600,
+        replace_existing=True,
+    )
+    return scheduler
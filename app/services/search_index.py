@@ -0,0 +1,198 @@
+"""제품 전문 검색(Full-text search) 인덱스를 관리하는 서비스 모듈입니다.
+
+초급자용 설명:
+- SQLite에서는 FTS5 가상 테이블, PostgreSQL에서는 tsvector + GIN 인덱스를 사용합니다.
+- 한국어는 띄어쓰기 단위로 단어를 나누면 "무선이어폰" 안의 "이어폰"을 찾을 수 없습니다.
+  그래서 글자 2개씩 겹쳐 자른 n-gram(bigram) 토큰을 만들어 인덱스에 넣습니다.
+- 인덱스 테이블은 SQLModel 메타데이터의 create_all 시점에 함께 생성됩니다.
+- SQLite FTS5는 MATCH 결과를 다른 조건으로 거르려면 일치 행을 모두 읽어야 하므로,
+  소유자도 owner 컬럼에 "u<id>" 토큰으로 넣고 MATCH 식 안에서 함께 찾습니다.
+"""
+
+from __future__ import annotations
+
+import re
+from typing import Iterable
+
+from sqlalchemy import DDL, event, text
+from sqlmodel import Session, SQLModel, select
+
+from app.core.redaction import redact_text
+from app.models.product import Product
+
+# 검색 인덱스 테이블 이름입니다.
+SEARCH_TABLE = "product_search"
+
+# 한국어 친화 n-gram 크기입니다.
+NGRAM_SIZE = 2
+
+# 인덱스에 넣을 제품 필드 목록입니다.
+INDEXED_FIELDS = ["title", "store", "product_category", "order_id", "raw_text"]
+
+# SQLite FTS5 검색 테이블 생성 DDL입니다. (rowid = product.id, owner = 소유자 토큰)
+SQLITE_SEARCH_TABLE_DDL = (
+    f"CREATE VIRTUAL TABLE IF NOT EXISTS {SEARCH_TABLE} USING fts5(body, owner, tokenize='unicode61')"
+)
+
+# 단어(문자/숫자 연속)를 찾는 정규식입니다. FTS 토크나이저가 쪼개지 않도록 '_'는 제외합니다.
+_WORD_PATTERN = re.compile(r"[^\W_]+")
+
+
+# SQLite: FTS5 가상 테이블을 생성합니다.
+event.listen(SQLModel.metadata, "after_create", DDL(SQLITE_SEARCH_TABLE_DDL).execute_if(dialect="sqlite"))
+
+# PostgreSQL: tsvector 컬럼과 GIN 인덱스를 생성합니다.
+for _statement in [
+    f"CREATE TABLE IF NOT EXISTS {SEARCH_TABLE} ("
+    "product_id INTEGER PRIMARY KEY REFERENCES product(id) ON DELETE CASCADE, "
+    "user_id INTEGER NOT NULL, "
+    "body_tsv TSVECTOR NOT NULL)",
+    f"CREATE INDEX IF NOT EXISTS ix_{SEARCH_TABLE}_body_tsv ON {SEARCH_TABLE} USING GIN (body_tsv)",
+    f"CREATE INDEX IF NOT EXISTS ix_{SEARCH_TABLE}_user_id ON {SEARCH_TABLE} (user_id)",
+]:
+    event.listen(SQLModel.metadata, "after_create", DDL(_statement).execute_if(dialect="postgresql"))
+
+event.listen(SQLModel.metadata, "before_drop", DDL(f"DROP TABLE IF EXISTS {SEARCH_TABLE}"))
+
+
+# 문자열을 n-gram 토큰 목록으로 변환합니다.
+def ngram_tokens(value: str, size: int = NGRAM_SIZE) -> list[str]:
+    """단어별로 글자 n개씩 겹쳐 자른 토큰을 반환합니다.
+
+    - 단어 길이가 n 이하이면 단어 자체를 토큰으로 사용합니다.
+    - 예: "무선이어폰" -> ["무선", "선이", "이어", "어폰"]
+    """
+    tokens: list[str] = []
+    for word in _WORD_PATTERN.findall(value.lower()):
+        if len(word) <= size:
+            tokens.append(word)
+            continue
+        tokens.extend(word[index : index + size] for index in range(len(word) - size + 1))
+    return tokens
+
+
+# 소유자 토큰을 만듭니다.
+def _owner_token(user_id: int) -> str:
+    """FTS5 owner 컬럼에 넣고 MATCH에서 찾을 사용자 토큰입니다. (예: 7 -> "u7")"""
+    return f"u{user_id}"
+
+
+# 제품 필드를 모아 인덱스 본문을 만듭니다.
+def _build_document(product: Product) -> str:
+    """검색 대상 필드를 n-gram 토큰 문자열로 변환합니다."""
+    parts: list[str] = []
+    for field in INDEXED_FIELDS:
+        value = getattr(product, field, None)
+        if not value:
+            continue
+        if field == "raw_text":
+            # 직접 입력된 raw_text도 있으므로 인덱스에는 항상 마스킹된 텍스트만 넣습니다.
+            value = redact_text(value)
+        parts.extend(ngram_tokens(str(value)))
+    return " ".join(parts)
+
+
+# 검색어를 n-gram 토큰으로 바꿉니다.
+def _query_tokens(query: str) -> list[tuple[str, bool]]:
+    """(토큰, 접두어 검색 여부) 목록을 반환합니다.
+
+    - 한 글자 단어는 bigram 토큰의 접두어로 찾아야 하므로 접두어 검색으로 표시합니다.
+    """
+    tokens: list[tuple[str, bool]] = []
+    for word in _WORD_PATTERN.findall(query.lower()):
+        if len(word) < NGRAM_SIZE:
+            tokens.append((word, True))
+        else:
+            tokens.extend((token, False) for token in ngram_tokens(word))
+    return list(dict.fromkeys(tokens))
+
+
+# 현재 세션의 DB 종류를 반환합니다.
+def _dialect(session: Session) -> str:
+    """세션이 연결된 DB 방언 이름(sqlite/postgresql 등)을 반환합니다."""
+    return session.get_bind().dialect.name
+
+
+# 제품 하나를 인덱스에 추가/갱신합니다.
+def index_product(session: Session, product: Product) -> None:
+    """제품의 검색 인덱스를 갱신합니다. (commit은 호출자가 수행)"""
+    if product.id is None:
+        return
+    body = _build_document(product)
+    params = {"product_id": product.id, "user_id": product.user_id, "body": body}
+    if _dialect(session) == "postgresql":
+        session.exec(
+            text(
+                f"INSERT INTO {SEARCH_TABLE} (product_id, user_id, body_tsv) "
+                "VALUES (:product_id, :user_id, to_tsvector('simple', :body)) "
+                "ON CONFLICT (product_id) DO UPDATE "
+                "SET user_id = EXCLUDED.user_id, body_tsv = EXCLUDED.body_tsv"
+            ).bindparams(**params)
+        )
+        return
+    session.exec(text(f"DELETE FROM {SEARCH_TABLE} WHERE rowid = :product_id").bindparams(product_id=product.id))
+    session.exec(
+        text(f"INSERT INTO {SEARCH_TABLE} (rowid, body, owner) VALUES (:product_id, :body, :owner)").bindparams(
+            product_id=product.id, body=body, owner=_owner_token(product.user_id)
+        )
+    )
+
+
+# 제품을 인덱스에서 제거합니다.
+def remove_product(session: Session, product_id: int) -> None:
+    """삭제된 제품을 검색 인덱스에서 제거합니다. (commit은 호출자가 수행)"""
+    key = "product_id" if _dialect(session) == "postgresql" else "rowid"
+    session.exec(text(f"DELETE FROM {SEARCH_TABLE} WHERE {key} = :product_id").bindparams(product_id=product_id))
+
+
+# 사용자 제품 중 검색어와 일치하는 id를 관련도 순으로 반환합니다.
+def search_product_ids(session: Session, user_id: int, query: str, limit: int = 20) -> list[int]:
+    """검색어의 모든 n-gram을 포함하는 제품 id를 반환합니다."""
+    tokens = _query_tokens(query)
+    if not tokens:
+        return []
+
+    if _dialect(session) == "postgresql":
+        ts_query = " & ".join(f"{token}:*" if prefix else token for token, prefix in tokens)
+        statement = text(
+            f"SELECT product_id FROM {SEARCH_TABLE} "
+            "WHERE user_id = :user_id AND body_tsv @@ to_tsquery('simple', :query) "
+            "ORDER BY ts_rank(body_tsv, to_tsquery('simple', :query)) DESC, product_id DESC "
+            "LIMIT :limit"
+        ).bindparams(user_id=user_id)
+    else:
+        # 소유자 토큰과 검색어 토큰을 한 MATCH 식으로 찾아, 다른 사용자의 일치 행은 읽지 않습니다.
+        phrases = " ".join(f'body:"{token}"*' if prefix else f'body:"{token}"' for token, prefix in tokens)
+        ts_query = f'owner:"{_owner_token(user_id)}" AND {phrases}'
+        statement = text(
+            f"SELECT rowid FROM {SEARCH_TABLE} "
+            f"WHERE {SEARCH_TABLE} MATCH :query "
+            "ORDER BY rank, rowid DESC LIMIT :limit"
+        )
+    rows = session.exec(statement.bindparams(query=ts_query, limit=limit)).all()
+    return [int(row[0]) for row in rows]
+
+
+# SQLite 검색 테이블을 현재 스키마로 다시 만들고 전체 제품을 인덱싱합니다.
+def recreate_search_table(session: Session) -> int:
+    """FTS5 가상 테이블은 컬럼을 바꿀 수 없으므로 지우고 새로 만듭니다. (PostgreSQL은 변경 없음)"""
+    if _dialect(session) != "sqlite":
+        return 0
+    session.exec(text(f"DROP TABLE IF EXISTS {SEARCH_TABLE}"))
+    session.exec(text(SQLITE_SEARCH_TABLE_DDL))
+    return rebuild_search_index(session)
+
+
+# 전체 제품을 다시 인덱싱합니다.
+def rebuild_search_index(session: Session, products: Iterable[Product] | None = None) -> int:
+    """기존 제품 데이터를 인덱스에 채워 넣고 처리 건수를 반환합니다.
+
+    - 검색 기능 도입 전 데이터를 백필하거나, 인덱스가 어긋났을 때 사용합니다.
+    """
+    session.exec(text(f"DELETE FROM {SEARCH_TABLE}"))
+    count = 0
+    for product in products if products is not None else session.exec(select(Product)):
+        index_product(session, product)
+        count += 1
+    session.commit()
+    return count
@@ -1,22 +1,135 @@
-"""텔레그램 알림 발송을 담당하는 서비스 스켈레톤입니다."""
+"""텔레그램 알림 발송을 담당하는 서비스 모듈입니다."""
+
+from __future__ import annotations
+
+import importlib.util
 
 import httpx
 
 from app.core.config import get_settings
 
+# 텔레그램 Bot API 기본 주소입니다.
+TELEGRAM_API_BASE = "https://api.telegram.org"
+
+
+# 텔레그램 API가 429(Too Many Requests)를 반환했을 때 발생하는 예외입니다.
+class TelegramRateLimitError(Exception):
+    """retry_after(초) 만큼 기다린 뒤 다시 보내야 함을 나타냅니다."""
+
+    def __init__(self, retry_after: float) -> None:
+        super().__init__(f"telegram rate limited (retry after {retry_after}s)")
+        self.retry_after = retry_after
+
+
+# 429 응답 본문에서 retry_after 값을 꺼냅니다.
+def _parse_retry_after(response: httpx.Response) -> float:
+    """parameters.retry_after가 없으면 Retry-After 헤더, 그것도 없으면 1초를 사용합니다."""
+    try:
+        return float(response.json()["parameters"]["retry_after"])
+    except Exception:
+        pass
+    try:
+        return float(response.headers.get("Retry-After", "1"))
+    except ValueError:
+        return 1.0
+
+
+# 커넥션 풀을 재사용하는 텔레그램 발송기입니다.
+class TelegramSender:
+    """앱 수명 동안 하나의 httpx.AsyncClient를 유지하며 메시지를 보냅니다.
+
+    초급자용 설명:
+    - 메시지마다 클라이언트를 새로 만들면 매번 TCP/TLS 연결을 다시 맺어야 합니다.
+    - 클라이언트를 재사용하면 keep-alive 연결(h2 패키지가 있으면 HTTP/2 멀티플렉싱)을 그대로 써서
+      일일 알림처럼 메시지가 몰릴 때 지연이 크게 줄어듭니다.
+    """
+
+    def __init__(
+        self,
+        token: str | None,
+        *,
+        timeout: float = 10.0,
+        max_connections: int = 20,
+        transport: httpx.AsyncBaseTransport | None = None,
+    ) -> None:
+        self.token = token
+        self.timeout = timeout
+        self.max_connections = max_connections
+        self._transport = transport
+        self._client: httpx.AsyncClient | None = None
+
+    # 풀링된 HTTP 클라이언트를 생성합니다.
+    def _build_client(self) -> httpx.AsyncClient:
+        """HTTP/2는 h2 패키지가 설치된 경우에만 켭니다."""
+        return httpx.AsyncClient(
+            base_url=TELEGRAM_API_BASE,
+            timeout=self.timeout,
+            limits=httpx.Limits(
+                max_connections=self.max_connections,
+                max_keepalive_connections=self.max_connections,
+            ),
+            http2=importlib.util.find_spec("h2") is not None,
+            transport=self._transport,
+        )
+
+    # 클라이언트를 미리 만들어 둡니다.
+    async def start(self) -> None:
+        """앱 시작 시 호출해 첫 메시지 지연을 줄입니다."""
+        if self._client is None:
+            self._client = self._build_client()
+
+    # 클라이언트와 커넥션 풀을 정리합니다.
+    async def close(self) -> None:
+        """앱 종료 시 열린 연결을 닫습니다."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    # 메시지를 전송합니다.
+    async def send_message(self, chat_id: int, text: str, parse_mode: str | None = None) -> None:
+        """429 응답은 TelegramRateLimitError로, 그 밖의 오류 응답은 httpx 예외로 알립니다."""
+        if self._client is None:
+            await self.start()
+        payload: dict[str, object] = {"chat_id": chat_id, "text": text}
+        if parse_mode:
+            payload["parse_mode"] = parse_mode
+
+        response = await self._client.post(f"/bot{self.token}/sendMessage", json=payload)
+        if response.status_code == 429:
+            raise TelegramRateLimitError(_parse_retry_after(response))
+        response.raise_for_status()
+
+
+# 애플리케이션 전역에서 공유하는 발송기입니다.
+_sender: TelegramSender | None = None
+
+
+# 공유 발송기를 반환합니다. (없으면 생성)
+def get_telegram_sender() -> TelegramSender:
+    """설정의 봇 토큰으로 공유 TelegramSender를 만들어 재사용합니다."""
+    global _sender
+    if _sender is None:
+        _sender = TelegramSender(get_settings().TELEGRAM_BOT_TOKEN)
+    return _sender
+
+
+# 공유 발송기의 연결을 닫습니다.
+async def close_telegram_sender() -> None:
+    """앱 종료 시 호출합니다."""
+    global _sender
+    if _sender is not None:
+        await _sender.close()
+        _sender = None
+
 
 # 텔레그램 메시지 전송을 담당하는 함수입니다.
-async def send_telegram_message(chat_id: int, text: str) -> None:
+async def send_telegram_message(chat_id: int, text: str, parse_mode: str | None = None) -> None:
     """지정된 chat_id로 텔레그램 메시지를 전송하는 비동기 함수입니다.
 
     초급자용 설명:
     - 텔레그램 봇 API는 HTTP 요청으로 메시지를 보내는 방식입니다.
     - 이 함수는 '어떤 텍스트를 어떤 사용자에게 보낼지'만 신경 쓰고,
-      토큰/엔드포인트 구성은 내부에서 처리합니다.
+      토큰/엔드포인트/커넥션 풀 관리는 공유 TelegramSender가 처리합니다.
+    - parse_mode="MarkdownV2"를 주면 텍스트의 서식 문법을 해석합니다. (특수문자는 미리 이스케이프해야 함)
     """
-    settings = get_settings()
-    base_url = f"https://api.telegram.org/bot{settings.TELEGRAM_BOT_TOKEN}/sendMessage"
-    payload = {"chat_id": chat_id, "text": text}
-
-    async with httpx.AsyncClient() as client:
-        await client.post(base_url, json=payload)
+    await get_telegram_sender().send_message(chat_id, text, parse_mode=parse_mode)
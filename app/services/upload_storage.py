@@ -0,0 +1,276 @@
+"""multipart 업로드 본문을 스트리밍으로 받아 디스크에 바로 저장하는 서비스 모듈입니다.
+
+초급자용 설명:
+- request.stream()으로 요청 본문을 조각(chunk) 단위로 읽어 python-multipart 파서에 넘깁니다.
+- 파일 데이터는 임시 파일을 거치지 않고 최종 경로에 바로 쓰며, 쓰는 동안 크기 제한/sha256/MIME 판별을 함께 합니다.
+- 크기 제한을 넘으면 남은 본문을 읽지 않고 바로 중단하므로 큰 파일이 대역폭/디스크를 끝까지 차지하지 않습니다.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+import hashlib
+from pathlib import Path
+from typing import Any
+import uuid
+
+import anyio
+from python_multipart import MultipartParser
+from python_multipart.exceptions import MultipartParseError
+from python_multipart.multipart import parse_options_header
+from starlette.requests import Request
+
+# 파일 종류 판별에 사용하는 앞부분 바이트 수입니다.
+SNIFF_BYTES = 16
+
+# 파일 하나당 허용하는 multipart 헤더/경계 문자열 여유분(바이트)입니다.
+PART_OVERHEAD_BYTES = 16 * 1024
+
+# 파일 시그니처(매직 바이트)와 MIME 타입 매핑입니다.
+_SIGNATURES = (
+    (b"\xff\xd8\xff", "image/jpeg"),
+    (b"\x89PNG\r\n\x1a\n", "image/png"),
+    (b"%PDF-", "application/pdf"),
+    (b"GIF87a", "image/gif"),
+    (b"GIF89a", "image/gif"),
+)
+
+# MIME 타입별 저장 확장자입니다. (PDF 여부는 확장자로 판단하므로 실제 내용 기준으로 맞춥니다)
+_SUFFIX_BY_TYPE = {
+    "image/jpeg": ".jpg",
+    "image/png": ".png",
+    "image/gif": ".gif",
+    "image/webp": ".webp",
+    "application/pdf": ".pdf",
+}
+
+
+# 업로드 크기 제한을 넘었을 때 발생하는 예외입니다.
+class UploadTooLargeError(Exception):
+    """파일 하나 또는 요청 본문 전체가 허용 크기를 넘었습니다."""
+
+
+# multipart 본문 형식이 잘못됐을 때 발생하는 예외입니다.
+class UploadFormatError(Exception):
+    """boundary가 없거나, 본문이 깨졌거나, 파일 개수가 너무 많습니다."""
+
+
+# 디스크에 저장을 마친 업로드 파일 정보입니다.
+@dataclass(frozen=True, slots=True)
+class StoredUpload:
+    """content_type은 파일 앞부분으로 판별한 MIME 타입이며, 알 수 없으면 None입니다."""
+
+    filename: str | None
+    path: Path
+    size: int
+    content_hash: str
+    content_type: str | None
+
+
+# 파일 앞부분 바이트로 MIME 타입을 판별합니다.
+def sniff_content_type(head: bytes) -> str | None:
+    """클라이언트가 보낸 Content-Type 대신 실제 내용으로 이미지/PDF 여부를 확인합니다."""
+    for signature, content_type in _SIGNATURES:
+        if head.startswith(signature):
+            return content_type
+    if head[:4] == b"RIFF" and head[8:12] == b"WEBP":
+        return "image/webp"
+    return None
+
+
+# 저장 파일 확장자를 결정합니다.
+def upload_suffix(filename: str | None, content_type: str | None) -> str:
+    """판별한 MIME 타입을 우선하고, 모르면 원래 파일명의 확장자를 사용합니다."""
+    if content_type in _SUFFIX_BY_TYPE:
+        return _SUFFIX_BY_TYPE[content_type]
+    return Path(filename or "upload.bin").suffix or ".bin"
+
+
+# bytes를 문자열로 바꿉니다. (UTF-8이 아니면 latin-1)
+def _decode(value: bytes) -> str:
+    """브라우저마다 파일명 인코딩이 달라도 예외 없이 문자열로 만듭니다."""
+    try:
+        return value.decode("utf-8")
+    except UnicodeDecodeError:
+        return value.decode("latin-1")
+
+
+# 파서 콜백 이벤트를 모아 두는 클래스입니다.
+class _PartEvents:
+    """파서 콜백은 동기 함수라 파일 쓰기(await)를 할 수 없으므로, 이벤트만 모아 두고 chunk마다 꺼내 처리합니다."""
+
+    def __init__(self) -> None:
+        self.events: list[tuple[str, Any]] = []
+        self._headers: dict[bytes, bytes] = {}
+        self._field = bytearray()
+        self._value = bytearray()
+
+    def on_part_begin(self) -> None:
+        self._headers = {}
+
+    def on_header_field(self, data: bytes, start: int, end: int) -> None:
+        self._field += data[start:end]
+
+    def on_header_value(self, data: bytes, start: int, end: int) -> None:
+        self._value += data[start:end]
+
+    def on_header_end(self) -> None:
+        self._headers[bytes(self._field).lower()] = bytes(self._value)
+        self._field.clear()
+        self._value.clear()
+
+    def on_headers_finished(self) -> None:
+        self.events.append(("begin", self._headers))
+
+    def on_part_data(self, data: bytes, start: int, end: int) -> None:
+        self.events.append(("data", data[start:end]))
+
+    def on_part_end(self) -> None:
+        self.events.append(("end", None))
+
+    # 쌓인 이벤트를 꺼내고 비웁니다.
+    def drain(self) -> list[tuple[str, Any]]:
+        events, self.events = self.events, []
+        return events
+
+    def callbacks(self) -> dict[str, Any]:
+        return {
+            "on_part_begin": self.on_part_begin,
+            "on_header_field": self.on_header_field,
+            "on_header_value": self.on_header_value,
+            "on_header_end": self.on_header_end,
+            "on_headers_finished": self.on_headers_finished,
+            "on_part_data": self.on_part_data,
+            "on_part_end": self.on_part_end,
+        }
+
+
+# 파일 파트 하나를 최종 경로에 쓰는 클래스입니다.
+class _PartWriter:
+    """앞부분 SNIFF_BYTES를 모아 MIME 타입(=확장자)을 정한 뒤 파일을 열고, 이후 데이터는 바로 씁니다."""
+
+    def __init__(self, filename: str | None, upload_dir: Path, max_bytes: int) -> None:
+        self.filename = filename
+        self.upload_dir = upload_dir
+        self.max_bytes = max_bytes
+        self.size = 0
+        self.content_type: str | None = None
+        self.path: Path | None = None
+        self._hasher = hashlib.sha256()
+        self._head = bytearray()
+        self._file: Any = None
+
+    # 판별한 확장자로 최종 파일을 열고, 모아 둔 앞부분을 반환합니다.
+    async def _open(self) -> bytes:
+        head, self._head = bytes(self._head), bytearray()
+        self.content_type = sniff_content_type(head)
+        self.path = self.upload_dir / f"{uuid.uuid4().hex}{upload_suffix(self.filename, self.content_type)}"
+        self._file = await anyio.open_file(self.path, "wb")
+        return head
+
+    # 데이터 조각을 크기 확인/해시 계산 후 씁니다.
+    async def write(self, data: bytes) -> None:
+        self.size += len(data)
+        if self.size > self.max_bytes:
+            raise UploadTooLargeError(self.filename)
+        self._hasher.update(data)
+        if self._file is None:
+            self._head += data
+            if len(self._head) < SNIFF_BYTES:
+                return
+            data = await self._open()
+        await self._file.write(data)
+
+    # 파일을 닫고 저장 결과를 반환합니다.
+    async def finish(self) -> StoredUpload:
+        if self._file is None:
+            # SNIFF_BYTES보다 작은 파일은 여기서 한 번에 씁니다.
+            head = await self._open()
+            await self._file.write(head)
+        await self._file.aclose()
+        assert self.path is not None
+        return StoredUpload(
+            filename=self.filename,
+            path=self.path,
+            size=self.size,
+            content_hash=self._hasher.hexdigest(),
+            content_type=self.content_type,
+        )
+
+    # 쓰던 파일을 닫고 지웁니다. (오류/제한 초과 시)
+    async def abort(self) -> None:
+        if self._file is not None:
+            await self._file.aclose()
+        if self.path is not None:
+            self.path.unlink(missing_ok=True)
+
+
+# 요청 본문에서 파일 파트를 스트리밍으로 받아 저장합니다.
+async def receive_uploads(
+    request: Request,
+    upload_dir: Path,
+    *,
+    field_name: str,
+    max_file_bytes: int,
+    max_files: int = 1,
+    max_body_bytes: int | None = None,
+) -> list[StoredUpload]:
+    """field_name 이름의 파일 파트를 upload_dir에 저장하고 결과 목록을 반환합니다.
+
+    초급자용 설명:
+    - Content-Length가 본문 제한(max_body_bytes, 없으면 파일 크기 제한 x 개수 + 여유분)을 넘으면
+      본문을 읽기 전에 바로 거절합니다.
+    - Content-Length가 없거나(chunked) 거짓이어도 읽은 양을 세며 같은 제한을 지킵니다.
+    - 실패하면 이번 요청에서 쓴 파일을 모두 지웁니다.
+    """
+    mime, params = parse_options_header(request.headers.get("content-type", ""))
+    boundary = params.get(b"boundary")
+    if mime.lower() != b"multipart/form-data" or not boundary:
+        raise UploadFormatError("Expected a multipart/form-data body.")
+
+    if max_body_bytes is None:
+        max_body_bytes = max_files * (max_file_bytes + PART_OVERHEAD_BYTES)
+    content_length = request.headers.get("content-length")
+    if content_length is not None and content_length.isdigit() and int(content_length) > max_body_bytes:
+        raise UploadTooLargeError("request body")
+
+    events = _PartEvents()
+    parser = MultipartParser(boundary, events.callbacks())
+    uploads: list[StoredUpload] = []
+    current: _PartWriter | None = None
+    received = 0
+    try:
+        async for chunk in request.stream():
+            received += len(chunk)
+            if received > max_body_bytes:
+                raise UploadTooLargeError("request body")
+            try:
+                parser.write(chunk)
+            except MultipartParseError as exc:
+                raise UploadFormatError("Malformed multipart body.") from exc
+
+            for kind, payload in events.drain():
+                if kind == "begin":
+                    _, disposition = parse_options_header(payload.get(b"content-disposition", b""))
+                    if _decode(disposition.get(b"name", b"")) != field_name or b"filename" not in disposition:
+                        continue
+                    if len(uploads) >= max_files:
+                        raise UploadFormatError(f"Too many files (max {max_files}).")
+                    current = _PartWriter(_decode(disposition[b"filename"]) or None, upload_dir, max_file_bytes)
+                elif current is None:
+                    continue
+                elif kind == "data":
+                    await current.write(payload)
+                else:
+                    uploads.append(await current.finish())
+                    current = None
+        parser.finalize()
+        if current is not None:
+            raise UploadFormatError("Incomplete multipart body.")
+    except BaseException:
+        if current is not None:
+            await current.abort()
+        for upload in uploads:
+            upload.path.unlink(missing_ok=True)
+        raise
+    return uploads
@@ -0,0 +1,131 @@
+"""일일 알림 메시지 렌더링 성능을 측정하는 벤치마크 스크립트입니다.
+
+사용 예시:
+    uv run python scripts/bench_alert_rendering.py --users 10000 --items 3
+
+초급자용 설명:
+- baseline: 예전 방식처럼 문자열을 한 줄씩 조립하고, 이메일/텔레그램 채널마다 다시 만듭니다.
+- templates: 미리 컴파일한 Jinja2 템플릿으로 사용자별 컨텍스트를 한 번 만들고 채널별로 렌더링합니다.
+  (templates 쪽은 HTML 이메일과 MarkdownV2 이스케이프까지 포함해 더 많은 결과물을 만듭니다.)
+"""
+
+from __future__ import annotations
+
+import argparse
+from datetime import date, timedelta
+from pathlib import Path
+import sys
+import time
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+if str(ROOT_DIR) not in sys.path:
+    sys.path.insert(0, str(ROOT_DIR))
+
+from app.services.alert_templates import (  # noqa: E402
+    HTML,
+    TELEGRAM,
+    TEXT,
+    build_alert_context,
+    load_alert_templates,
+    render_alert,
+)
+from app.services.notification_service import DailyAlert, DailyAlertItem  # noqa: E402
+
+
+# 벤치마크용 알림 데이터를 만듭니다.
+def _build_alerts(users: int, items: int, today: date) -> list[DailyAlert]:
+    return [
+        DailyAlert(
+            user_id=user_id,
+            email=f"user{user_id}@example.com",
+            telegram_chat_id=str(user_id),
+            items=[
+                DailyAlertItem(
+                    product_id=user_id * items + index,
+                    title=f"제품 {index} (모델-{user_id}.v2)",
+                    purchase_date=today - timedelta(days=30),
+                    refund_deadline=today + timedelta(days=3),
+                    warranty_end_date=today + timedelta(days=30),
+                    amount=129000 + index,
+                    store="쿠팡",
+                )
+                for index in range(items)
+            ],
+        )
+        for user_id in range(1, users + 1)
+    ]
+
+
+# 예전 방식(줄 단위 문자열 조립)의 메시지 생성입니다.
+def _legacy_format(alert: DailyAlert, today: date) -> str:
+    lines = [
+        "🔔 [ASHD] 환불/보증 임박 알림",
+        f"📅 {today.isoformat()}",
+        "",
+        "아래 항목의 기한이 다가오고 있습니다:",
+        "",
+    ]
+    for item in alert.items:
+        lines.append(f"📦 {item.title}")
+        if item.amount:
+            lines.append(f"   💵 금액: {item.amount:,}원")
+        if item.store:
+            lines.append(f"   🏪 구매처: {item.store}")
+        if item.refund_deadline:
+            lines.append(f"   ⏰ 환불 마감: {item.refund_deadline} (D-{(item.refund_deadline - today).days})")
+        if item.warranty_end_date:
+            lines.append(f"   🛡️ 보증 만료: {item.warranty_end_date} (D-{(item.warranty_end_date - today).days})")
+        lines.append("")
+    lines.append("⚠️ 기한 내에 처리하세요!")
+    return "\n".join(lines)
+
+
+def _run_baseline(alerts: list[DailyAlert], today: date) -> int:
+    total = 0
+    for alert in alerts:
+        total += len(_legacy_format(alert, today))  # 이메일
+        total += len(_legacy_format(alert, today))  # 텔레그램
+    return total
+
+
+def _run_templates(alerts: list[DailyAlert], today: date, channels: tuple[str, ...] = (TEXT, HTML, TELEGRAM)) -> int:
+    total = 0
+    for alert in alerts:
+        context = build_alert_context(alert, today)
+        for channel in channels:
+            total += len(render_alert(context, channel))
+    return total
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="일일 알림 렌더링 벤치마크")
+    parser.add_argument("--users", type=int, default=10_000, help="알림 대상 사용자 수")
+    parser.add_argument("--items", type=int, default=3, help="사용자별 제품 수")
+    args = parser.parse_args()
+
+    today = date(2024, 1, 1)
+    alerts = _build_alerts(args.users, args.items, today)
+
+    started = time.perf_counter()
+    load_alert_templates()
+    print(f"template compile: {(time.perf_counter() - started) * 1000:.1f} ms (앱 시작 시 1회)")
+
+    runs = (
+        ("baseline (text x2)", lambda: _run_baseline(alerts, today)),
+        ("templates text", lambda: _run_templates(alerts, today, (TEXT,))),
+        ("templates html", lambda: _run_templates(alerts, today, (HTML,))),
+        ("templates telegram", lambda: _run_templates(alerts, today, (TELEGRAM,))),
+        ("templates text+html+telegram", lambda: _run_templates(alerts, today)),
+    )
+    for name, runner in runs:
+        started = time.perf_counter()
+        size = runner()
+        elapsed = time.perf_counter() - started
+        print(
+            f"{name:32s} {elapsed * 1000:8.1f} ms"
+            f"  {elapsed / len(alerts) * 1_000_000:6.1f} us/user  {size / 1024 / 1024:6.1f} MiB"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+"""로그인 처리량과 로그인 폭주 중 다른 라우트 응답 시간을 측정하는 벤치마크 스크립트입니다.
+
+사용 예시:
+    uv run python scripts/bench_login.py --users 50 --logins 400 --concurrency 50
+
+초급자용 설명:
+- threadpool: 예전처럼 요청 스레드풀(기본 40개)에서 비밀번호를 검증합니다.
+- executor: app.core.security의 전용 해시 스레드 풀(PASSWORD_HASH_WORKERS)에서 검증합니다.
+- 로그인 요청을 동시에 보내는 동안 /health를 주기적으로 호출해, 다른 라우트가 얼마나 밀리는지 함께 봅니다.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import os
+from pathlib import Path
+import statistics
+import sys
+import tempfile
+import time
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+if str(ROOT_DIR) not in sys.path:
+    sys.path.insert(0, str(ROOT_DIR))
+
+_TMP_DIR = tempfile.mkdtemp(prefix="ashd-bench-login-")
+os.environ.setdefault("SECRET_KEY", "bench-login")
+os.environ["DATABASE_URL"] = f"sqlite:///{Path(_TMP_DIR) / 'bench.db'}"
+
+import httpx  # noqa: E402
+from starlette.concurrency import run_in_threadpool  # noqa: E402
+
+import app.api.routes.auth as auth_routes  # noqa: E402
+from app.core.db import dispose_async_engines, engine  # noqa: E402
+from app.core.migrations import migrate  # noqa: E402
+from app.core.security import verify_password, verify_password_async  # noqa: E402
+from app.main import create_app  # noqa: E402
+
+PASSWORD = "bench-password"
+
+
+# 요청 스레드풀에서 검증하는 예전 방식입니다.
+async def _verify_in_threadpool(plain_password: str, password_hash: str) -> bool:
+    return await run_in_threadpool(verify_password, plain_password, password_hash)
+
+
+# 로그인 폭주와 /health 호출을 함께 실행하고 결과를 반환합니다.
+async def _run(client: httpx.AsyncClient, users: int, logins: int, concurrency: int) -> dict[str, float]:
+    semaphore = asyncio.Semaphore(concurrency)
+    health_latencies: list[float] = []
+    done = asyncio.Event()
+
+    async def _login(index: int) -> None:
+        async with semaphore:
+            response = await client.post(
+                "/auth/login", json={"email": f"bench{index % users}@example.com", "password": PASSWORD}
+            )
+            assert response.status_code == 200, response.text
+
+    async def _probe_health() -> None:
+        while not done.is_set():
+            started = time.perf_counter()
+            await client.get("/health")
+            health_latencies.append(time.perf_counter() - started)
+            await asyncio.sleep(0.01)
+
+    probe = asyncio.create_task(_probe_health())
+    started = time.perf_counter()
+    await asyncio.gather(*(_login(index) for index in range(logins)))
+    elapsed = time.perf_counter() - started
+    done.set()
+    await probe
+
+    health_latencies.sort()
+    return {
+        "logins_per_second": logins / elapsed,
+        "health_p50_ms": statistics.median(health_latencies) * 1000,
+        "health_p95_ms": health_latencies[int(len(health_latencies) * 0.95) - 1] * 1000,
+    }
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description="로그인 처리량 벤치마크")
+    parser.add_argument("--users", type=int, default=50, help="가입시킬 사용자 수")
+    parser.add_argument("--logins", type=int, default=400, help="보낼 로그인 요청 수")
+    parser.add_argument("--concurrency", type=int, default=50, help="동시에 진행할 로그인 수")
+    args = parser.parse_args()
+
+    migrate(engine)
+    application = create_app()
+    transport = httpx.ASGITransport(app=application)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        for index in range(args.users):
+            await client.post("/auth/register", json={"email": f"bench{index}@example.com", "password": PASSWORD})
+
+        for name, verifier in (("threadpool", _verify_in_threadpool), ("executor", verify_password_async)):
+            auth_routes.verify_password_async = verifier
+            result = await _run(client, args.users, args.logins, args.concurrency)
+            print(
+                f"{name:10s} {result['logins_per_second']:8.1f} logins/s"
+                f"  /health p50 {result['health_p50_ms']:7.1f} ms  p95 {result['health_p95_ms']:7.1f} ms"
+            )
+    await dispose_async_engines()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
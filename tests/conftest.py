@@ -11,7 +11,9 @@ from typing import Iterator
 
 import pytest
 from fastapi.testclient import TestClient
+from sqlalchemy.ext.asyncio import create_async_engine
 from sqlmodel import Session, SQLModel, create_engine
+from sqlmodel.ext.asyncio.session import AsyncSession
 
 import sys
 from pathlib import Path
@@ -24,6 +26,8 @@ if str(ROOT_DIR) not in sys.path:
 
 import app.core.db as db
 import app.main as main
+from app.api.dependencies.auth import clear_auth_caches
+from app.core.config import get_settings
 from app.main import create_app
 
 
@@ -42,24 +46,51 @@ def test_engine(tmp_path) -> Iterator:
     yield engine
 
 
+# 같은 테스트 DB 파일을 가리키는 비동기 엔진을 제공하는 픽스처입니다.
+@pytest.fixture
+def test_async_engine(test_engine) -> Iterator:
+    """비동기 라우트(get_async_session)가 테스트 DB를 사용하도록 aiosqlite 엔진을 만듭니다."""
+
+    engine = create_async_engine(f"sqlite+aiosqlite:///{test_engine.url.database}")
+    yield engine
+    # aiosqlite 연결은 각 요청의 이벤트 루프에서 열리므로 연결을 닫지 않고 풀만 버립니다.
+    engine.sync_engine.dispose(close=False)
+
+
 # 테스트용 FastAPI 앱을 제공하는 픽스처입니다.
 @pytest.fixture
-def app(test_engine):
+def app(test_engine, test_async_engine, tmp_path, monkeypatch):
     """테스트용 FastAPI 앱을 생성합니다.
 
     - main/core 모듈의 엔진을 테스트 엔진으로 교체합니다.
-    - DB 세션 의존성(get_session)을 테스트 세션으로 override 합니다.
+    - DB 세션 의존성(get_session/get_async_session)을 테스트 세션으로 override 합니다.
+    - 프로세스 전역 인증 캐시를 비웁니다.
+    - 업로드 파일은 저장소의 uploads/ 대신 tmp_path 아래에 저장합니다.
     """
 
+    # 설정 캐시가 비워져 새로 만들어지는 경우에도 같은 경로를 쓰도록 환경 변수도 함께 바꿉니다.
+    upload_dir = str(tmp_path / "uploads")
+    monkeypatch.setenv("DOCUMENT_UPLOAD_DIR", upload_dir)
+    monkeypatch.setattr(get_settings(), "DOCUMENT_UPLOAD_DIR", upload_dir)
+
     db.engine = test_engine
     main.engine = test_engine
+    monkeypatch.setattr(db, "get_async_engine", lambda: test_async_engine)
 
     def get_session_override():
         with Session(test_engine) as session:
             yield session
 
+    async def get_async_session_override():
+        async with AsyncSession(test_async_engine, expire_on_commit=False) as session:
+            yield session
+
+    # 테스트마다 DB가 새로 만들어져 user id가 겹치므로 인증 캐시를 비웁니다.
+    clear_auth_caches()
+
     application = create_app()
     application.dependency_overrides[db.get_session] = get_session_override
+    application.dependency_overrides[db.get_async_session] = get_async_session_override
     return application
 
 
@@ -0,0 +1,101 @@
+"""알림 발송 일정(alert_schedule) 갱신 동작을 검증합니다."""
+
+from datetime import date, timedelta
+
+from sqlmodel import select
+
+from app.cli import main as cli_main
+from app.core.time import alert_today
+from app.models.alert_schedule import AlertSchedule
+from app.services.alert_schedule import check_alert_schedule, prune_past_schedule, rebuild_alert_schedule
+
+
+def _auth(client, email="schedule@example.com", password="pw1234"):
+    client.post("/auth/register", json={"email": email, "password": password})
+    token = client.post("/auth/login", json={"email": email, "password": password}).json()["access_token"]
+    return {"Authorization": f"Bearer {token}"}
+
+
+def _fire_dates(db_session, product_id):
+    rows = db_session.exec(select(AlertSchedule).where(AlertSchedule.product_id == product_id)).all()
+    return sorted((row.kind, row.fire_date) for row in rows)
+
+
+def test_schedule_follows_product_and_settings_changes(client, db_session):
+    """제품 생성/수정/삭제와 기준일 변경 시 일정이 함께 갱신되는지 확인합니다."""
+
+    headers = _auth(client)
+    created = client.post(
+        "/products",
+        json={"title": "노트북", "warranty_end_date": "2025-01-31", "refund_deadline": "2024-02-10"},
+        headers=headers,
+    ).json()
+    product_id = created["id"]
+
+    # 회원가입 시 기본 기준일(보증 30/7/3, 환불 3)이 적용됩니다.
+    assert _fire_dates(db_session, product_id) == [
+        ("refund", date(2024, 2, 7)),
+        ("warranty", date(2025, 1, 1)),
+        ("warranty", date(2025, 1, 24)),
+        ("warranty", date(2025, 1, 28)),
+    ]
+
+    client.put(f"/products/{product_id}", json={"refund_deadline": None}, headers=headers)
+    db_session.expire_all()
+    assert [kind for kind, _ in _fire_dates(db_session, product_id)] == ["warranty"] * 3
+
+    client.put("/notification-settings", json={"warranty_days_before": [1]}, headers=headers)
+    db_session.expire_all()
+    assert _fire_dates(db_session, product_id) == [("warranty", date(2025, 1, 30))]
+    assert check_alert_schedule(db_session) == (0, 0)
+
+    client.delete(f"/products/{product_id}", headers=headers)
+    db_session.expire_all()
+    assert _fire_dates(db_session, product_id) == []
+
+
+def test_rebuild_and_check_alert_schedule(client, db_session, test_engine, monkeypatch, capsys):
+    """일정이 어긋나면 검사 명령이 실패하고, 재생성 명령으로 복구되는지 확인합니다."""
+
+    headers = _auth(client, email="schedule2@example.com")
+    # CLI는 오늘 이전 발송일을 비교/생성하지 않으므로 충분히 미래의 기한을 사용합니다.
+    warranty_end = (date.today() + timedelta(days=400)).isoformat()
+    client.post("/products", json={"title": "청소기", "warranty_end_date": warranty_end}, headers=headers)
+
+    for row in db_session.exec(select(AlertSchedule)).all():
+        db_session.delete(row)
+    db_session.commit()
+    assert check_alert_schedule(db_session) == (3, 0)
+
+    monkeypatch.setattr("app.core.db.engine", test_engine)
+    assert cli_main(["check-alert-schedule"]) == 1
+    assert cli_main(["rebuild-alert-schedule"]) == 0
+    assert "scheduled 3 alerts" in capsys.readouterr().out
+    assert cli_main(["check-alert-schedule"]) == 0
+    assert rebuild_alert_schedule(db_session) == 3
+
+
+def test_prune_past_schedule(client, db_session, test_engine, monkeypatch, capsys):
+    """지난 발송일만 지우고, 정리 후에도 CLI 검사/재생성이 지난 일정을 되살리지 않는지 확인합니다."""
+
+    headers = _auth(client, email="schedule3@example.com")
+    # CLI는 SCHEDULER_TIMEZONE 기준 오늘을 쓰므로 테스트도 같은 날짜를 기준으로 합니다.
+    warranty_end = alert_today() + timedelta(days=3)
+    product_id = client.post(
+        "/products", json={"title": "선풍기", "warranty_end_date": warranty_end.isoformat()}, headers=headers
+    ).json()["id"]
+    # 기본 기준일(30/7/3일 전) 중 30/7일 전 발송일은 이미 지났습니다.
+    assert [fire_date for _, fire_date in _fire_dates(db_session, product_id)] == [
+        warranty_end - timedelta(days=30),
+        warranty_end - timedelta(days=7),
+        warranty_end - timedelta(days=3),
+    ]
+
+    assert prune_past_schedule(db_session, alert_today()) == 2
+    db_session.commit()
+    assert _fire_dates(db_session, product_id) == [("warranty", warranty_end - timedelta(days=3))]
+
+    monkeypatch.setattr("app.core.db.engine", test_engine)
+    assert cli_main(["check-alert-schedule"]) == 0
+    assert cli_main(["rebuild-alert-schedule"]) == 0
+    assert "scheduled 1 alerts" in capsys.readouterr().out
@@ -0,0 +1,70 @@
+"""알림 메시지 템플릿 렌더링을 검증합니다."""
+
+from datetime import date
+
+from app.services.alert_templates import (
+    HTML,
+    TELEGRAM,
+    TEXT,
+    build_alert_context,
+    escape_markdown_v2,
+    render_alert,
+)
+from app.services.notification_service import DailyAlert, DailyAlertItem
+
+TODAY = date(2024, 1, 1)
+
+
+def _alert(title: str = "노트북", store: str | None = "쿠팡") -> DailyAlert:
+    return DailyAlert(
+        user_id=1,
+        email="user@example.com",
+        telegram_chat_id="1",
+        items=[
+            DailyAlertItem(
+                product_id=1,
+                title=title,
+                purchase_date=None,
+                refund_deadline=date(2024, 1, 4),
+                warranty_end_date=None,
+                amount=1200000,
+                store=store,
+            )
+        ],
+    )
+
+
+# 텍스트 템플릿이 기존 메시지 형식을 그대로 유지하는지 확인합니다.
+def test_text_template_matches_plain_format() -> None:
+    text = render_alert(build_alert_context(_alert(), TODAY), TEXT)
+    assert text.splitlines() == [
+        "🔔 [ASHD] 환불/보증 임박 알림",
+        "📅 2024-01-01",
+        "",
+        "아래 항목의 기한이 다가오고 있습니다:",
+        "",
+        "📦 노트북",
+        "   💵 금액: 1,200,000원",
+        "   🏪 구매처: 쿠팡",
+        "   ⏰ 환불 마감: 2024-01-04 (D-3)",
+        "",
+        "⚠️ 기한 내에 처리하세요!",
+    ]
+
+
+# HTML/텔레그램 템플릿이 사용자 입력을 채널에 맞게 이스케이프하는지 확인합니다.
+def test_html_and_telegram_templates_escape_user_input() -> None:
+    context = build_alert_context(_alert(title="<b>A_B</b> (v2.0)!", store=None), TODAY)
+
+    html = render_alert(context, HTML)
+    assert "&lt;b&gt;A_B&lt;/b&gt;" in html
+    assert "구매처" not in html
+
+    telegram = render_alert(context, TELEGRAM)
+    assert "*<b\\>A\\_B</b\\> \\(v2\\.0\\)\\!*" in telegram
+    assert "2024\\-01\\-04 \\(D\\-3\\)" in telegram
+    assert telegram.rstrip().endswith("처리하세요\\!")
+
+
+def test_escape_markdown_v2() -> None:
+    assert escape_markdown_v2("a.b-c[d]") == "a\\.b\\-c\\[d\\]"
@@ -81,3 +81,88 @@ def test_change_password_unauthenticated(client):
         json={"current_password": "pw", "new_password": "pw2"},
     )
     assert resp.status_code == status.HTTP_401_UNAUTHORIZED
+
+
+def test_authenticated_requests_use_auth_cache(client, make_user_and_token, monkeypatch):
+    """같은 토큰의 두 번째 요청은 JWT 재검증/DB 조회 없이 처리되고, 비밀번호 변경 시 캐시가 지워지는지 확인합니다."""
+
+    from app.api.dependencies import auth as auth_dependencies
+
+    user = make_user_and_token(password="oldpw123")
+    headers = user["headers"]
+    assert client.get("/notification-settings", headers=headers).status_code == status.HTTP_200_OK
+    assert auth_dependencies._token_version_cache.get(user["user"]["id"]) == 0
+
+    def fail_decode(_token):
+        raise AssertionError("token should be served from cache")
+
+    monkeypatch.setattr(auth_dependencies, "decode_access_token", fail_decode)
+    assert client.get("/notification-settings", headers=headers).status_code == status.HTTP_200_OK
+
+    change = client.post(
+        "/auth/change-password",
+        json={"current_password": "oldpw123", "new_password": "newpw456"},
+        headers=headers,
+    )
+    assert change.status_code == status.HTTP_200_OK
+    assert auth_dependencies._token_version_cache.get(user["user"]["id"]) is None
+
+
+def test_change_password_revokes_existing_tokens(client, make_user_and_token):
+    """비밀번호 변경 후 이전 토큰은 401, 새로 로그인한 토큰은 200인지 확인합니다."""
+
+    user = make_user_and_token(password="oldpw123")
+    old_headers = user["headers"]
+    assert client.get("/products", headers=old_headers).status_code == status.HTTP_200_OK
+
+    change = client.post(
+        "/auth/change-password",
+        json={"current_password": "oldpw123", "new_password": "newpw456"},
+        headers=old_headers,
+    )
+    assert change.status_code == status.HTTP_200_OK
+    assert client.get("/products", headers=old_headers).status_code == status.HTTP_401_UNAUTHORIZED
+
+    login = client.post("/auth/login", json={"email": user["email"], "password": "newpw456"})
+    new_headers = {"Authorization": f"Bearer {login.json()['access_token']}"}
+    assert client.get("/products", headers=new_headers).status_code == status.HTTP_200_OK
+
+
+def test_login_rehashes_password_when_cost_changes(client, db_session):
+    """설정과 다른 반복 횟수로 저장된 해시는 로그인 성공 시 현재 설정으로 다시 해시되는지 확인합니다."""
+
+    from app.core.config import AppSettings
+    from app.core.security import build_password_context, password_needs_rehash
+    from app.models.user import User
+
+    legacy_context = build_password_context(AppSettings(SECRET_KEY="test", PASSWORD_HASH_ROUNDS=1_000))
+    legacy_hash = legacy_context.hash("password123")
+    assert password_needs_rehash(legacy_hash)
+
+    user = User(email="legacy@example.com", password_hash=legacy_hash)
+    db_session.add(user)
+    db_session.commit()
+
+    login = client.post("/auth/login", json={"email": "legacy@example.com", "password": "password123"})
+    assert login.status_code == status.HTTP_200_OK
+
+    db_session.refresh(user)
+    assert user.password_hash != legacy_hash
+    assert not password_needs_rehash(user.password_hash)
+
+
+def test_current_user_id_does_not_hold_a_connection(app, make_user_and_token, test_async_engine):
+    """캐시가 빈 상태의 인증 조회가 전용 세션을 쓰고, 끝나면 커넥션을 바로 반납하는지 확인합니다."""
+
+    import asyncio
+
+    from app.api.dependencies import auth as auth_dependencies
+
+    user = make_user_and_token()
+    token = user["headers"]["Authorization"].removeprefix("Bearer ")
+    auth_dependencies.clear_auth_caches()
+
+    user_id = asyncio.run(auth_dependencies.get_current_user_id(token))
+
+    assert user_id == user["user"]["id"]
+    assert test_async_engine.sync_engine.pool.checkedout() == 0
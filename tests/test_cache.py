@@ -0,0 +1,41 @@
+"""TTL 캐시 동작을 검증합니다."""
+
+import time
+
+from app.core.cache import TTLCache
+
+
+# 만료 시간이 지나면 값이 사라지고, 항목별 TTL은 기본 TTL보다 길어지지 않는지 확인합니다.
+def test_ttl_cache_expires_entries(monkeypatch) -> None:
+    now = [1000.0]
+    monkeypatch.setattr(time, "monotonic", lambda: now[0])
+    cache: TTLCache[str, int] = TTLCache(maxsize=10, ttl_seconds=30)
+
+    cache.set("a", 1)
+    cache.set("b", 2, ttl_seconds=5)
+    cache.set("c", 3, ttl_seconds=600)
+    now[0] += 10
+    assert (cache.get("a"), cache.get("b"), cache.get("c")) == (1, None, 3)
+
+    now[0] += 25
+    assert cache.get("a") is None
+    assert cache.get("c") is None
+
+
+# 최대 크기를 넘으면 가장 오래 쓰지 않은 항목부터 버리는지 확인합니다.
+def test_ttl_cache_evicts_least_recently_used() -> None:
+    cache: TTLCache[str, int] = TTLCache(maxsize=2, ttl_seconds=60)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1
+    cache.set("c", 3)
+
+    assert (cache.get("a"), cache.get("b"), cache.get("c")) == (1, None, 3)
+    assert len(cache) == 2
+
+
+# TTL이 0이면 저장하지 않는지 확인합니다.
+def test_ttl_cache_disabled_with_zero_ttl() -> None:
+    cache: TTLCache[str, int] = TTLCache(maxsize=10, ttl_seconds=0)
+    cache.set("a", 1)
+    assert cache.get("a") is None
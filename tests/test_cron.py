@@ -1,12 +1,14 @@
 """cron 엔드포인트 보안 동작을 검증합니다."""
 
-from datetime import date
+from datetime import date, datetime
+from zoneinfo import ZoneInfo
 
 from fastapi import FastAPI
 from fastapi.testclient import TestClient
 
 from app.api.routes.cron import router as cron_router
 from app.core.config import get_settings
+from app.core.time import alert_today
 from app.services.notification_service import DailyAlertsSummary
 
 
@@ -43,7 +45,7 @@ def test_cron_authorized_returns_200(monkeypatch) -> None:
     monkeypatch.setenv("CRON_SECRET", "test-secret")
     get_settings.cache_clear()
 
-    async def fake_run_daily_alerts(_session):
+    async def fake_run_daily_alerts(_session, **_kwargs):
         return DailyAlertsSummary(
             date=date(2024, 1, 1),
             processed=1,
@@ -72,3 +74,35 @@ def test_cron_authorized_returns_200(monkeypatch) -> None:
     assert payload["email_targets"] == 1
     assert payload["email_sent"] == 1
     assert "telegram_sent" in payload
+    assert payload["done"] is True
+
+
+# cron 라우트가 SCHEDULER_TIMEZONE 기준 오늘 날짜로 실행하는지 확인합니다.
+def test_cron_uses_scheduler_timezone_date(monkeypatch) -> None:
+    monkeypatch.setenv("CRON_SECRET", "test-secret")
+    monkeypatch.setenv("SCHEDULER_TIMEZONE", "Etc/GMT-14")
+    get_settings.cache_clear()
+    captured: dict[str, object] = {}
+
+    async def fake_run_daily_alerts(_session, **kwargs):
+        captured.update(kwargs)
+        return DailyAlertsSummary(
+            date=kwargs["today"],
+            processed=0,
+            email_targets=0,
+            telegram_targets=0,
+            email_sent=0,
+            telegram_sent=0,
+            skipped={"email": False, "telegram": False, "reason": None},
+            errors=[],
+        )
+
+    monkeypatch.setattr("app.api.routes.cron.run_daily_alerts", fake_run_daily_alerts)
+    response = TestClient(_build_app()).post(
+        "/internal/cron/daily-alerts",
+        headers={"X-CRON-SECRET": "test-secret"},
+    )
+    assert response.status_code == 200
+    assert captured["today"] == datetime.now(ZoneInfo("Etc/GMT-14")).date()
+    assert captured["today"] == alert_today()
+    get_settings.cache_clear()
@@ -0,0 +1,75 @@
+"""DB 엔진 설정(SQLite PRAGMA 프로파일)을 검증합니다."""
+
+import pytest
+from sqlalchemy import text
+
+from app.core.config import AppSettings
+from app.core.db import async_database_url, build_engine, pool_status, sqlite_pragma_statements
+
+
+def _settings(**overrides) -> AppSettings:
+    return AppSettings(SECRET_KEY="test", **overrides)
+
+
+# 새 연결마다 설정한 PRAGMA가 적용되는지 확인합니다.
+def test_sqlite_pragmas_applied_on_connect(tmp_path) -> None:
+    engine = build_engine(f"sqlite:///{tmp_path / 'tuned.db'}", _settings(SQLITE_BUSY_TIMEOUT_MS=1234))
+    with engine.connect() as connection:
+        assert connection.execute(text("PRAGMA journal_mode")).scalar() == "wal"
+        assert connection.execute(text("PRAGMA synchronous")).scalar() == 1  # NORMAL
+        assert connection.execute(text("PRAGMA busy_timeout")).scalar() == 1234
+        assert connection.execute(text("PRAGMA cache_size")).scalar() == -65536
+        assert connection.execute(text("PRAGMA temp_store")).scalar() == 2  # MEMORY
+
+
+# 튜닝을 끄면 SQLite 기본값을 유지하는지 확인합니다.
+def test_sqlite_tuning_can_be_disabled(tmp_path) -> None:
+    engine = build_engine(f"sqlite:///{tmp_path / 'plain.db'}", _settings(SQLITE_TUNING_ENABLED=False))
+    with engine.connect() as connection:
+        assert connection.execute(text("PRAGMA journal_mode")).scalar() == "delete"
+
+
+# 허용되지 않은 PRAGMA 값은 거부하는지 확인합니다.
+def test_sqlite_pragma_values_are_validated() -> None:
+    with pytest.raises(ValueError):
+        sqlite_pragma_statements(_settings(SQLITE_JOURNAL_MODE="WAL; DROP TABLE user"))
+
+
+# 서버형 DB URL이면 풀/타임아웃 옵션을 create_engine에 넘기는지 확인합니다.
+def test_postgres_engine_gets_pool_options(monkeypatch) -> None:
+    captured = {}
+
+    def fake_create_engine(url, **kwargs):
+        captured["url"] = url
+        captured.update(kwargs)
+        return object()
+
+    monkeypatch.setattr("app.core.db.create_engine", fake_create_engine)
+    settings = _settings(DB_POOL_SIZE=7, DB_MAX_OVERFLOW=3, DB_STATEMENT_TIMEOUT_MS=1500)
+
+    build_engine("postgresql://db/ashd", settings)
+    assert captured["pool_size"] == 7
+    assert captured["max_overflow"] == 3
+    assert captured["pool_pre_ping"] is True
+    assert captured["pool_recycle"] == 1800
+    assert captured["connect_args"] == {"options": "-c statement_timeout=1500"}
+
+    build_engine("postgresql://db/ashd", settings, pool_size=2, max_overflow=1)
+    assert (captured["pool_size"], captured["max_overflow"]) == (2, 1)
+
+
+# 풀 사용률이 사용 중인 연결 수에 맞게 계산되는지 확인합니다.
+def test_pool_status_reports_utilization(tmp_path) -> None:
+    engine = build_engine(f"sqlite:///{tmp_path / 'pool.db'}", _settings())
+    with engine.connect():
+        status = pool_status(engine)
+        assert status["checked_out"] == 1
+        assert status["utilization"] == round(1 / (status["size"] + status["max_overflow"]), 3)
+    assert pool_status(engine)["checked_out"] == 0
+
+
+# 동기 URL이 비동기 드라이버 URL로 바뀌는지 확인합니다.
+def test_async_database_url() -> None:
+    assert async_database_url("sqlite:///./ashd.db") == "sqlite+aiosqlite:///./ashd.db"
+    assert async_database_url("postgresql://u:p@db/ashd") == "postgresql+asyncpg://u:p@db/ashd"
+    assert async_database_url("sqlite+aiosqlite:///x.db") == "sqlite+aiosqlite:///x.db"
@@ -1,10 +1,14 @@
 """문서 업로드/Job 처리 플로우를 검증하는 테스트 모듈입니다."""
 
+import hashlib
 from pathlib import Path
 
 from fastapi import status
+import pytest
+from sqlmodel import select
 
 from app.api.routes import documents
+from app.core.config import get_settings
 from app.models.document import Document
 from app.models.job import DocumentProcessingJob
 from app.models.product import Product
@@ -187,6 +191,120 @@ def test_document_upload_too_large(client, make_user_and_token):
     assert response.status_code == status.HTTP_413_REQUEST_ENTITY_TOO_LARGE
 
 
+# 업로드 파일의 해시와 실제 형식이 저장되는지 검증합니다.
+def test_document_upload_stores_hash_and_sniffed_suffix(client, app, db_session, make_user_and_token, monkeypatch, tmp_path):
+    """확장자가 .jpg여도 내용이 PDF면 .pdf로 저장하고, sha256을 content_hash에 기록합니다."""
+    monkeypatch.setattr(get_settings(), "DOCUMENT_UPLOAD_DIR", str(tmp_path / "uploads"))
+    app.dependency_overrides[documents.get_ocr_client] = lambda: MockPDFOCR()
+    app.dependency_overrides[documents.get_llm_extractor] = lambda: MockLLMExtractor()
+
+    try:
+        auth = make_user_and_token()
+        pdf_bytes = b"%PDF-1.4\n" + b"/Type /Page\n" * 2
+        response = client.post(
+            "/documents/upload",
+            files={"file": ("scan.jpg", pdf_bytes, "image/jpeg")},
+            headers=auth["headers"],
+        )
+        assert response.status_code == 202
+
+        document = db_session.get(Document, response.json()["document_id"])
+        assert document is not None
+        assert document.content_hash == hashlib.sha256(pdf_bytes).hexdigest()
+        assert document.image_path.endswith(".pdf")
+        assert Path(document.image_path).read_bytes() == pdf_bytes
+    finally:
+        app.dependency_overrides.pop(documents.get_ocr_client, None)
+        app.dependency_overrides.pop(documents.get_llm_extractor, None)
+
+
+# 스트리밍 중 크기 제한을 넘으면 쓰던 파일을 지우고 413을 반환하는지 검증합니다.
+def test_document_upload_too_large_while_streaming(client, make_user_and_token, monkeypatch, tmp_path):
+    """Content-Length 사전 검사를 통과해도 파일 데이터가 제한을 넘으면 중단합니다."""
+    upload_dir = tmp_path / "uploads"
+    monkeypatch.setattr(get_settings(), "DOCUMENT_UPLOAD_DIR", str(upload_dir))
+    monkeypatch.setattr(documents, "MAX_UPLOAD_BYTES", 1024)
+    auth = make_user_and_token()
+
+    response = client.post(
+        "/documents/upload",
+        files={"file": ("big.jpg", b"\xff\xd8\xff" + b"a" * 4096, "image/jpeg")},
+        headers=auth["headers"],
+    )
+    assert response.status_code == status.HTTP_413_REQUEST_ENTITY_TOO_LARGE
+    assert list(upload_dir.iterdir()) == []
+
+    missing = client.post("/documents/upload", files={"other": ("a.jpg", b"x", "image/jpeg")}, headers=auth["headers"])
+    assert missing.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
+
+# 레코드 저장에 실패하면 저장한 파일을 지우는지 검증합니다.
+def test_document_upload_removes_file_when_insert_fails(client, db_session, make_user_and_token, monkeypatch, tmp_path):
+    """Job 생성이 실패하면 트랜잭션을 되돌리고 업로드 파일도 남기지 않습니다."""
+    upload_dir = tmp_path / "uploads"
+    monkeypatch.setattr(get_settings(), "DOCUMENT_UPLOAD_DIR", str(upload_dir))
+    auth = make_user_and_token()
+
+    def fail_job(**_kwargs):
+        raise RuntimeError("insert failed")
+
+    monkeypatch.setattr(documents, "DocumentProcessingJob", fail_job)
+
+    with pytest.raises(RuntimeError):
+        client.post("/documents/upload", files={"file": ("a.jpg", b"\xff\xd8\xffdata", "image/jpeg")}, headers=auth["headers"])
+    assert list(upload_dir.iterdir()) == []
+    assert db_session.exec(select(Document)).first() is None
+
+
+# 일괄 업로드가 파일마다 문서/Job을 만들고 모두 처리하는지 검증합니다.
+def test_document_batch_upload(client, app, db_session, make_user_and_token, monkeypatch, tmp_path):
+    """업로드 순서대로 job id를 반환하고, 백그라운드 작업이 모든 Job을 완료합니다."""
+    monkeypatch.setattr(get_settings(), "DOCUMENT_UPLOAD_DIR", str(tmp_path / "uploads"))
+    app.dependency_overrides[documents.get_ocr_client] = lambda: MockOCR()
+    app.dependency_overrides[documents.get_llm_extractor] = lambda: MockLLMExtractor()
+
+    try:
+        auth = make_user_and_token()
+        contents = [b"\xff\xd8\xff-receipt-%d" % index for index in range(3)]
+        response = client.post(
+            "/documents/upload-batch",
+            files=[("files", (f"receipt{index}.jpg", data, "image/jpeg")) for index, data in enumerate(contents)],
+            headers=auth["headers"],
+        )
+        assert response.status_code == 202
+        items = response.json()["items"]
+        assert len(items) == 3
+
+        for item, data in zip(items, contents):
+            job = db_session.get(DocumentProcessingJob, item["job_id"])
+            assert job is not None
+            assert job.document_id == item["document_id"]
+            assert job.status == "completed"
+            document = db_session.get(Document, item["document_id"])
+            assert document.content_hash == hashlib.sha256(data).hexdigest()
+    finally:
+        app.dependency_overrides.pop(documents.get_ocr_client, None)
+        app.dependency_overrides.pop(documents.get_llm_extractor, None)
+
+
+# 일괄 업로드 파일 수 제한을 넘으면 저장한 파일을 지우고 400을 반환하는지 검증합니다.
+def test_document_batch_upload_too_many_files(client, db_session, make_user_and_token, monkeypatch, tmp_path):
+    """제한을 넘는 요청은 문서/Job을 하나도 만들지 않습니다."""
+    upload_dir = tmp_path / "uploads"
+    monkeypatch.setattr(get_settings(), "DOCUMENT_UPLOAD_DIR", str(upload_dir))
+    monkeypatch.setattr(documents, "MAX_BATCH_FILES", 2)
+    auth = make_user_and_token()
+
+    response = client.post(
+        "/documents/upload-batch",
+        files=[("files", (f"r{index}.jpg", b"data", "image/jpeg")) for index in range(3)],
+        headers=auth["headers"],
+    )
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+    assert list(upload_dir.iterdir()) == []
+    assert db_session.exec(select(Document)).first() is None
+
+
 # PDF 3p 제한 경고를 검증합니다.
 def test_document_pdf_page_limit_warning(client, app, db_session, make_user_and_token):
     """PDF 3p 초과 시 경고가 기록되는지 확인합니다."""
@@ -217,3 +335,79 @@ def test_document_pdf_page_limit_warning(client, app, db_session, make_user_and_
     finally:
         app.dependency_overrides.pop(documents.get_ocr_client, None)
         app.dependency_overrides.pop(documents.get_llm_extractor, None)
+
+
+# Job 조회가 ETag 재검증을 지원하는지 확인합니다.
+def test_job_conditional_get(client, db_session, make_user_and_token):
+    """상태가 바뀌지 않았으면 304, 바뀌면 200을 반환하는지 확인합니다."""
+    auth = make_user_and_token()
+    job = DocumentProcessingJob(user_id=auth["user"]["id"], status="processing")
+    db_session.add(job)
+    db_session.commit()
+    db_session.refresh(job)
+
+    first = client.get(f"/jobs/{job.id}", headers=auth["headers"])
+    etag = first.headers["etag"]
+
+    cached = client.get(f"/jobs/{job.id}", headers={**auth["headers"], "If-None-Match": etag})
+    assert cached.status_code == status.HTTP_304_NOT_MODIFIED
+
+    job.status = "completed"
+    db_session.add(job)
+    db_session.commit()
+
+    changed = client.get(f"/jobs/{job.id}", headers={**auth["headers"], "If-None-Match": etag})
+    assert changed.status_code == status.HTTP_200_OK
+    assert changed.json()["status"] == "completed"
+
+
+# 롱폴링이 상태 변화가 없으면 대기 후 304를 반환하는지 확인합니다.
+def test_job_long_poll_times_out_with_not_modified(client, db_session, make_user_and_token):
+    """wait 동안 상태가 그대로면 304, 이미 완료된 Job이면 즉시 200을 반환합니다."""
+    auth = make_user_and_token()
+    job = DocumentProcessingJob(user_id=auth["user"]["id"], status="processing")
+    db_session.add(job)
+    db_session.commit()
+    db_session.refresh(job)
+
+    etag = client.get(f"/jobs/{job.id}", headers=auth["headers"]).headers["etag"]
+    waited = client.get(
+        f"/jobs/{job.id}",
+        params={"wait": 1},
+        headers={**auth["headers"], "If-None-Match": etag},
+    )
+    assert waited.status_code == status.HTTP_304_NOT_MODIFIED
+
+    job.status = "completed"
+    db_session.add(job)
+    db_session.commit()
+
+    done = client.get(f"/jobs/{job.id}", params={"wait": 30}, headers=auth["headers"])
+    assert done.status_code == status.HTTP_200_OK
+    assert done.json()["status"] == "completed"
+
+
+# SSE 스트림이 현재 상태를 보내고 종료 상태에서 닫히는지 확인합니다.
+def test_job_events_stream(client, db_session, make_user_and_token):
+    """완료된 Job의 SSE 스트림은 status 이벤트 1개를 보내고 종료됩니다."""
+    auth = make_user_and_token()
+    job = DocumentProcessingJob(
+        user_id=auth["user"]["id"],
+        status="failed",
+        error="승인번호: 99887766",
+    )
+    db_session.add(job)
+    db_session.commit()
+    db_session.refresh(job)
+
+    with client.stream("GET", f"/jobs/{job.id}/events", headers=auth["headers"]) as resp:
+        assert resp.status_code == 200
+        assert resp.headers["content-type"].startswith("text/event-stream")
+        body = "".join(resp.iter_text())
+
+    assert body.count("event: status") == 1
+    assert '"status": "failed"' in body
+    assert "99887766" not in body
+
+    missing = client.get("/jobs/999999/events", headers=auth["headers"])
+    assert missing.status_code == status.HTTP_404_NOT_FOUND
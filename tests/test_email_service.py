@@ -0,0 +1,108 @@
+"""SMTP 커넥션 풀 동작을 검증합니다."""
+
+from aiosmtplib import SMTPRecipientRefused, SMTPRecipientsRefused, SMTPResponseException
+import pytest
+
+from app.core.config import AppSettings
+from app.services.email_service import SMTPConnectionPool, send_email
+
+
+# 연결/로그인/전송 호출을 기록하는 가짜 SMTP 클라이언트입니다.
+class FakeSMTP:
+    instances: list["FakeSMTP"] = []
+    fail_next_send: Exception | None = None
+
+    def __init__(self, **kwargs) -> None:
+        self.kwargs = kwargs
+        self.logins = 0
+        self.sent: list[tuple[str, list[str]]] = []
+        self.closed = False
+        FakeSMTP.instances.append(self)
+
+    async def connect(self) -> None:
+        return None
+
+    async def login(self, username: str, password: str) -> None:
+        self.logins += 1
+
+    async def sendmail(self, sender: str, recipients: list[str], message: str) -> None:
+        if FakeSMTP.fail_next_send is not None:
+            exc, FakeSMTP.fail_next_send = FakeSMTP.fail_next_send, None
+            raise exc
+        self.sent.append((sender, recipients))
+
+    async def quit(self) -> None:
+        self.closed = True
+
+    def close(self) -> None:
+        self.closed = True
+
+
+@pytest.fixture
+def fake_smtp():
+    FakeSMTP.instances = []
+    FakeSMTP.fail_next_send = None
+    return FakeSMTP
+
+
+def _settings() -> AppSettings:
+    return AppSettings(
+        SECRET_KEY="x",
+        SMTP_HOST="smtp.example.com",
+        SMTP_PORT=587,
+        SMTP_USERNAME="bot@example.com",
+        SMTP_PASSWORD="pw",
+    )
+
+
+@pytest.mark.anyio
+# 한 연결로 여러 통을 보내고, 연결당 상한에 도달하면 새 연결을 여는지 확인합니다.
+async def test_pool_reuses_connection_up_to_cap(fake_smtp) -> None:
+    pool = SMTPConnectionPool(
+        _settings(), max_connections=1, max_messages_per_connection=3, smtp_factory=fake_smtp
+    )
+    for index in range(5):
+        await send_email([f"user{index}@example.com"], "subject", "body", pool=pool)
+    await pool.close()
+
+    assert [len(client.sent) for client in fake_smtp.instances] == [3, 2]
+    assert all(client.logins == 1 for client in fake_smtp.instances)
+    assert all(client.closed for client in fake_smtp.instances)
+
+
+@pytest.mark.anyio
+# 전송 중 연결이 끊기면 새 연결로 재시도하는지 확인합니다.
+async def test_pool_reconnects_after_failure(fake_smtp) -> None:
+    pool = SMTPConnectionPool(_settings(), max_connections=1, smtp_factory=fake_smtp)
+    await send_email(["a@example.com"], "subject", "body", pool=pool)
+    fake_smtp.fail_next_send = ConnectionError("server disconnected")
+    await send_email(["b@example.com"], "subject", "body", pool=pool)
+    await pool.close()
+
+    assert len(fake_smtp.instances) == 2
+    assert fake_smtp.instances[0].closed
+    assert fake_smtp.instances[1].sent == [("bot@example.com", ["b@example.com"])]
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize(
+    ("error", "retried"),
+    [
+        (SMTPResponseException(421, "try again later"), True),
+        (SMTPResponseException(554, "message rejected"), False),
+        (SMTPRecipientRefused(550, "no such user", "a@example.com"), False),
+        (SMTPRecipientsRefused([]), False),
+    ],
+)
+# 4xx 응답만 새 연결로 재시도하고, 5xx/수신자 거부는 바로 실패시키는지 확인합니다.
+async def test_pool_retries_only_transient_errors(fake_smtp, error, retried) -> None:
+    pool = SMTPConnectionPool(_settings(), max_connections=1, smtp_factory=fake_smtp)
+    fake_smtp.fail_next_send = error
+    if retried:
+        await send_email(["a@example.com"], "subject", "body", pool=pool)
+    else:
+        with pytest.raises(type(error)):
+            await send_email(["a@example.com"], "subject", "body", pool=pool)
+    await pool.close()
+
+    assert len(fake_smtp.instances) == (2 if retried else 1)
@@ -1,5 +1,7 @@
 """헬스체크 엔드포인트 테스트."""
 
+from app.core.config import get_settings
+
 
 # 헬스 체크 JSON 응답을 검증합니다.
 def test_health_check(client):
@@ -10,6 +12,20 @@ def test_health_check(client):
     data = resp.json()
     assert data["status"] == "ok"
     assert "db" in data
+    # 커넥션 풀 같은 내부 용량 정보는 공개 헬스 체크에 노출하지 않습니다.
+    assert "db_pool" not in data
+
+
+# 풀 사용 현황은 cron 시크릿이 있어야 조회되는지 확인합니다.
+def test_health_db_pool_requires_cron_secret(client, monkeypatch):
+    """시크릿이 없으면 403, 맞으면 API 풀 사용률을 반환합니다."""
+    monkeypatch.setenv("CRON_SECRET", "pool-secret")
+    get_settings.cache_clear()
+
+    assert client.get("/health/db-pool").status_code == 403
+    resp = client.get("/health/db-pool", headers={"X-CRON-SECRET": "pool-secret"})
+    assert resp.status_code == 200
+    assert "utilization" in resp.json()["db_pool"]["api"]
 
 
 # 텍스트 응답이 미들웨어에 의해 변형되지 않는지 확인합니다.
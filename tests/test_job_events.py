@@ -0,0 +1,35 @@
+"""Job 이벤트 버스 동작을 검증합니다."""
+
+import asyncio
+import threading
+
+import pytest
+
+from app.core.job_events import JobEventBus
+
+
+# 이벤트 버스는 asyncio 루프 전용이므로 asyncio 백엔드만 사용합니다.
+@pytest.fixture
+def anyio_backend() -> str:
+    return "asyncio"
+
+
+@pytest.mark.anyio
+# 다른 스레드에서 publish하면 구독자가 깨어나는지 확인합니다.
+async def test_publish_from_thread_wakes_subscriber() -> None:
+    bus = JobEventBus()
+    with bus.subscribe(1) as changed:
+        threading.Timer(0.05, bus.publish, args=(1,)).start()
+        await asyncio.wait_for(changed.wait(), timeout=2)
+        assert changed.is_set()
+
+
+@pytest.mark.anyio
+# 다른 job_id의 publish에는 깨어나지 않고, 구독 해제 후 정리되는지 확인합니다.
+async def test_publish_is_scoped_to_job_id() -> None:
+    bus = JobEventBus()
+    with bus.subscribe(1) as changed:
+        bus.publish(2)
+        await asyncio.sleep(0.05)
+        assert not changed.is_set()
+    assert bus._subscribers == {}
@@ -0,0 +1,125 @@
+"""버전 기반 DB 마이그레이션 러너를 검증합니다."""
+
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from sqlalchemy import inspect
+from sqlalchemy.dialects import postgresql
+from sqlmodel import Session, SQLModel, create_engine
+
+from app.cli import main as cli_main
+from app.core.config import AppSettings
+from app.core.migrations import (
+    LATEST_VERSION,
+    create_index_sql,
+    current_version,
+    ensure_schema_current,
+    migrate,
+)
+from app.models.product import Product
+from app.models.user import User
+from app.services.search_index import search_product_ids
+
+
+# 빈 SQLite 파일 DB 엔진을 만듭니다.
+@pytest.fixture
+def empty_engine(tmp_path):
+    return create_engine(f"sqlite:///{tmp_path / 'migrate.db'}")
+
+
+# 빈 DB에 모든 마이그레이션이 적용되고, 다시 실행하면 아무것도 하지 않는지 확인합니다.
+def test_migrate_fresh_database(empty_engine) -> None:
+    assert current_version(empty_engine) == 0
+
+    applied = migrate(empty_engine)
+    assert applied == list(range(1, LATEST_VERSION + 1))
+    assert current_version(empty_engine) == LATEST_VERSION
+    assert "ix_product_user_updated_id" in {index["name"] for index in inspect(empty_engine).get_indexes("product")}
+    assert migrate(empty_engine) == []
+
+
+# 여러 워커가 동시에 시작해도 한 프로세스만 적용하고 나머지는 건너뛰는지 확인합니다.
+def test_migrate_concurrent_workers(tmp_path) -> None:
+    url = f"sqlite:///{tmp_path / 'concurrent.db'}"
+    engines = [create_engine(url) for _ in range(4)]
+
+    with ThreadPoolExecutor(max_workers=len(engines)) as executor:
+        results = list(executor.map(migrate, engines))
+
+    assert sorted(results, key=len) == [[], [], [], list(range(1, LATEST_VERSION + 1))]
+    assert current_version(engines[0]) == LATEST_VERSION
+
+
+# 버전 기록이 없는 예전 DB에 빠진 컬럼/인덱스를 추가하는지 확인합니다.
+def test_migrate_upgrades_legacy_database(empty_engine) -> None:
+    SQLModel.metadata.create_all(empty_engine)
+    with empty_engine.begin() as connection:
+        connection.exec_driver_sql("DROP INDEX ix_document_user_content_hash")
+        connection.exec_driver_sql("DROP INDEX ix_product_user_warranty_end")
+        connection.exec_driver_sql("ALTER TABLE document DROP COLUMN content_hash")
+        connection.exec_driver_sql("ALTER TABLE user DROP COLUMN token_version")
+        connection.exec_driver_sql("INSERT INTO user (email, password_hash, created_at) VALUES ('a@b.c', 'x', '2024-01-01')")
+
+    migrate(empty_engine)
+
+    inspector = inspect(empty_engine)
+    assert "content_hash" in {column["name"] for column in inspector.get_columns("document")}
+    assert "ix_product_user_warranty_end" in {index["name"] for index in inspector.get_indexes("product")}
+    assert "ix_document_user_content_hash" in {index["name"] for index in inspector.get_indexes("document")}
+    with empty_engine.connect() as connection:
+        assert connection.exec_driver_sql("SELECT token_version FROM user").scalar() == 0
+
+
+# 예전 FTS5 검색 테이블(user_id UNINDEXED)을 owner 토큰 테이블로 바꾸고 다시 인덱싱하는지 확인합니다.
+def test_migrate_recreates_search_table(empty_engine) -> None:
+    migrate(empty_engine, target=6)
+    with Session(empty_engine) as session:
+        user = User(email="search@example.com", password_hash="x")
+        session.add(user)
+        session.commit()
+        product = Product(user_id=user.id, title="무선이어폰")
+        session.add(product)
+        session.commit()
+        user_id, product_id = user.id, product.id
+    with empty_engine.begin() as connection:
+        connection.exec_driver_sql("DROP TABLE product_search")
+        connection.exec_driver_sql(
+            "CREATE VIRTUAL TABLE product_search USING fts5(body, user_id UNINDEXED, tokenize='unicode61')"
+        )
+
+    assert migrate(empty_engine) == list(range(7, LATEST_VERSION + 1))
+
+    with Session(empty_engine) as session:
+        assert search_product_ids(session, user_id, "이어폰") == [product_id]
+        assert search_product_ids(session, user_id + 1, "이어폰") == []
+
+
+# target까지만 적용하고, 시작 시 확인이 자동 적용 설정을 따르는지 확인합니다.
+def test_ensure_schema_current_respects_auto_migrate(empty_engine) -> None:
+    assert migrate(empty_engine, target=2) == [1, 2]
+
+    with pytest.raises(RuntimeError):
+        ensure_schema_current(empty_engine, AppSettings(SECRET_KEY="test", DB_AUTO_MIGRATE=False))
+    assert current_version(empty_engine) == 2
+
+    ensure_schema_current(empty_engine, AppSettings(SECRET_KEY="test", DB_AUTO_MIGRATE=True))
+    assert current_version(empty_engine) == LATEST_VERSION
+
+
+# PostgreSQL에서는 쓰기를 막지 않도록 CONCURRENTLY로 인덱스를 만드는지 확인합니다.
+def test_create_index_sql_uses_concurrently_on_postgres() -> None:
+    index = next(
+        index for index in SQLModel.metadata.tables["product"].indexes if index.name == "ix_product_user_updated_id"
+    )
+    sql = create_index_sql(index, postgresql.dialect())
+    assert sql.startswith("CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_product_user_updated_id")
+
+
+# migrate 명령의 --check와 적용 동작을 확인합니다.
+def test_migrate_cli(empty_engine, monkeypatch, capsys) -> None:
+    monkeypatch.setattr("app.core.db.engine", empty_engine)
+
+    assert cli_main(["migrate", "--check"]) == 1
+    assert cli_main(["migrate"]) == 0
+    assert f"schema version {LATEST_VERSION}/{LATEST_VERSION}" in capsys.readouterr().out
+    assert cli_main(["migrate", "--check"]) == 0
@@ -1,11 +1,31 @@
 """일일 알림 발송 로직을 검증합니다."""
 
-from datetime import date
+from datetime import date, timedelta
+import time
 
+import anyio
 import pytest
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
 
 from app.core.config import AppSettings
-from app.services.notification_service import DailyAlert, DailyAlertItem, send_daily_alerts
+from app.core.rate_limit import AsyncTokenBucket
+from app.models.alert_run import AlertDelivery, AlertRun
+from app.models.alert_schedule import AlertSchedule
+from app.models.notification import NotificationSettings
+from app.models.product import Product
+from app.models.telegram_account import TelegramAccount
+from app.models.user import User
+from app.services.alert_schedule import rebuild_alert_schedule
+from app.services.notification_offsets import backfill_notification_offsets
+from app.services.notification_service import (
+    DailyAlert,
+    DailyAlertItem,
+    generate_daily_alerts,
+    run_daily_alerts,
+    send_daily_alerts,
+)
+from app.services.telegram_service import TelegramRateLimitError
 
 
 # 테스트용 알림 데이터를 구성하는 헬퍼입니다.
@@ -107,3 +127,317 @@ async def test_send_daily_alerts_sends_telegram(monkeypatch) -> None:
     assert summary.telegram_sent == 1
     assert len(calls) == 1
     assert summary.skipped["telegram"] is False
+
+
+@pytest.mark.anyio
+# 사용자별 D-N 기준에 맞는 제품만 알림 대상으로 선택하는지 확인합니다.
+async def test_generate_daily_alerts_selects_only_due_products(db_session) -> None:
+    today = date(2024, 1, 1)
+
+    alice = User(email="alice@example.com", password_hash="x")
+    bob = User(email="bob@example.com", password_hash="x")
+    db_session.add_all([alice, bob])
+    db_session.commit()
+
+    db_session.add_all(
+        [
+            NotificationSettings(user_id=alice.id, warranty_days_before="[7]", refund_days_before="[3]"),
+            NotificationSettings(
+                user_id=bob.id,
+                email_enabled=False,
+                telegram_enabled=True,
+                warranty_days_before="[30]",
+                refund_days_before="[]",
+            ),
+            TelegramAccount(user_id=bob.id, chat_id="555"),
+            # alice: 보증 D-7, 환불 D-3은 대상 / D-30은 bob 기준이라 대상 아님
+            Product(user_id=alice.id, title="보증임박", warranty_end_date=today + timedelta(days=7)),
+            Product(user_id=alice.id, title="환불임박", refund_deadline=today + timedelta(days=3)),
+            Product(user_id=alice.id, title="다른기준", warranty_end_date=today + timedelta(days=30)),
+            # bob: 보증 D-30만 대상, 환불 기준이 비어 있어 D-3 환불은 대상 아님
+            Product(user_id=bob.id, title="밥보증", warranty_end_date=today + timedelta(days=30)),
+            Product(user_id=bob.id, title="밥환불", refund_deadline=today + timedelta(days=3)),
+        ]
+    )
+    db_session.commit()
+    assert backfill_notification_offsets(db_session) == 2
+    assert rebuild_alert_schedule(db_session) == 4
+
+    alerts = await generate_daily_alerts(db_session, today=today)
+    by_user = {alert.user_id: alert for alert in alerts}
+
+    assert sorted(item.title for item in by_user[alice.id].items) == ["보증임박", "환불임박"]
+    assert by_user[alice.id].email == "alice@example.com"
+    assert by_user[alice.id].telegram_chat_id is None
+
+    assert [item.title for item in by_user[bob.id].items] == ["밥보증"]
+    assert by_user[bob.id].email is None
+    assert by_user[bob.id].telegram_chat_id == "555"
+
+
+@pytest.mark.anyio
+# 이메일 전송이 동시성 한도 안에서 병렬로 진행되는지 확인합니다.
+async def test_send_daily_alerts_email_concurrency_limit(monkeypatch) -> None:
+    settings = AppSettings(
+        SECRET_KEY="test",
+        SMTP_HOST="smtp.example.com",
+        SMTP_PORT=587,
+        SMTP_USERNAME="user",
+        SMTP_PASSWORD="pass",
+        SMTP_FROM="noreply@example.com",
+        ALERT_EMAIL_CONCURRENCY=3,
+    )
+
+    in_flight = 0
+    peak = 0
+
+    async def slow_send_email(*_args, **_kwargs):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await anyio.sleep(0.01)
+        in_flight -= 1
+
+    monkeypatch.setattr("app.services.notification_service.send_email", slow_send_email)
+
+    alerts = [_build_alert(email=f"user{i}@example.com", telegram_chat_id=None) for i in range(10)]
+    summary = await send_daily_alerts(alerts, today=date(2024, 1, 1), settings=settings)
+
+    assert summary.email_sent == 10
+    assert summary.errors == []
+    assert peak == 3
+
+
+@pytest.mark.anyio
+# 텔레그램 429 응답 시 retry_after 이후 재시도해 집계가 정확한지 확인합니다.
+async def test_send_daily_alerts_telegram_retry_after(monkeypatch) -> None:
+    settings = AppSettings(
+        SECRET_KEY="test",
+        TELEGRAM_BOT_TOKEN="test-token",
+        TELEGRAM_PER_CHAT_INTERVAL_SECONDS=0.001,
+    )
+
+    attempts: dict[int, int] = {}
+
+    async def flaky_send_telegram(chat_id, _text, **_kwargs):
+        attempts[chat_id] = attempts.get(chat_id, 0) + 1
+        if attempts[chat_id] == 1:
+            raise TelegramRateLimitError(retry_after=0.01)
+
+    monkeypatch.setattr("app.services.notification_service.send_telegram_message", flaky_send_telegram)
+
+    alerts = [_build_alert(email=None, telegram_chat_id=str(100 + i)) for i in range(3)]
+    alerts.append(_build_alert(email=None, telegram_chat_id="not-a-number"))
+    summary = await send_daily_alerts(alerts, today=date(2024, 1, 1), settings=settings)
+
+    assert summary.telegram_targets == 4
+    assert summary.telegram_sent == 3
+    assert attempts == {100: 2, 101: 2, 102: 2}
+    assert summary.errors == ["telegram_invalid_chat_id_user_1"]
+
+
+@pytest.mark.anyio
+# 토큰 버킷이 초당 전송량을 제한하는지 확인합니다.
+async def test_token_bucket_limits_rate() -> None:
+    bucket = AsyncTokenBucket(rate=100, capacity=1)
+    started = time.monotonic()
+    for _ in range(6):
+        await bucket.acquire()
+    # 첫 토큰 이후 5개는 각각 약 10ms씩 기다려야 합니다.
+    assert time.monotonic() - started >= 0.04
+
+
+@pytest.mark.anyio
+# chunk 단위로 이어서 처리하고, 같은 날 재실행해도 이미 보낸 채널은 다시 보내지 않는지 확인합니다.
+async def test_run_daily_alerts_resumes_from_cursor_and_is_idempotent(db_session, monkeypatch) -> None:
+    today = date(2024, 1, 1)
+    settings = AppSettings(
+        SECRET_KEY="test",
+        SMTP_HOST="smtp.example.com",
+        SMTP_PORT=587,
+        SMTP_USERNAME="user",
+        SMTP_PASSWORD="pass",
+        SMTP_FROM="noreply@example.com",
+        TELEGRAM_BOT_TOKEN=None,
+    )
+    sent_to: list[str] = []
+
+    async def fake_send_email(to_addresses, *_args, **_kwargs):
+        sent_to.extend(to_addresses)
+
+    monkeypatch.setattr("app.services.notification_service.get_settings", lambda: settings)
+    monkeypatch.setattr("app.services.notification_service.send_email", fake_send_email)
+
+    users = [User(email=f"user{index}@example.com", password_hash="x") for index in range(3)]
+    db_session.add_all(users)
+    db_session.commit()
+    for user in users:
+        db_session.add(NotificationSettings(user_id=user.id, warranty_days_before="[7]", refund_days_before="[]"))
+        db_session.add(Product(user_id=user.id, title="보증임박", warranty_end_date=today + timedelta(days=7)))
+    db_session.commit()
+    backfill_notification_offsets(db_session)
+    rebuild_alert_schedule(db_session)
+    # 지난 발송일의 일정은 실행이 끝날 때 정리됩니다.
+    product_id = db_session.exec(select(Product.id)).first()
+    db_session.add(
+        AlertSchedule(user_id=users[0].id, product_id=product_id, fire_date=today - timedelta(days=1), kind="warranty")
+    )
+    db_session.commit()
+
+    first = await run_daily_alerts(db_session, today=today, chunk_size=2)
+    assert (first.processed, first.done, first.cursor) == (2, False, users[1].id)
+
+    second = await run_daily_alerts(db_session, today=today, chunk_size=2)
+    assert (second.processed, second.done) == (1, True)
+    assert db_session.exec(select(AlertSchedule).where(AlertSchedule.fire_date < today)).first() is None
+
+    finished = await run_daily_alerts(db_session, today=today, chunk_size=2)
+    assert (finished.processed, finished.done) == (0, True)
+    assert sorted(sent_to) == sorted(user.email for user in users)
+
+    # 실행 기록을 처음으로 되돌려도 전송 기록 덕분에 중복 발송되지 않습니다.
+    run = db_session.exec(select(AlertRun)).one()
+    run.cursor_user_id, run.done = 0, False
+    db_session.add(run)
+    db_session.commit()
+    again = await run_daily_alerts(db_session, today=today, chunk_size=10)
+    assert again.done is True
+    assert again.email_sent == 0
+    assert len(sent_to) == 3
+
+
+@pytest.mark.anyio
+# join에서 빠지는 사용자가 있어도 chunk 끝 여부/커서를 발송 일정 기준으로 계산하는지 확인합니다.
+async def test_run_daily_alerts_done_counts_scheduled_users(db_session, monkeypatch) -> None:
+    today = date(2024, 1, 1)
+    settings = AppSettings(
+        SECRET_KEY="test",
+        SMTP_HOST="smtp.example.com",
+        SMTP_PORT=587,
+        SMTP_USERNAME="user",
+        SMTP_PASSWORD="pass",
+        SMTP_FROM="noreply@example.com",
+        TELEGRAM_BOT_TOKEN=None,
+    )
+    sent_to: list[str] = []
+
+    async def fake_send_email(to_addresses, *_args, **_kwargs):
+        sent_to.extend(to_addresses)
+
+    monkeypatch.setattr("app.services.notification_service.get_settings", lambda: settings)
+    monkeypatch.setattr("app.services.notification_service.send_email", fake_send_email)
+
+    users = [User(email=f"user{index}@example.com", password_hash="x") for index in range(3)]
+    db_session.add_all(users)
+    db_session.commit()
+    for user in users:
+        db_session.add(NotificationSettings(user_id=user.id, warranty_days_before="[7]", refund_days_before="[]"))
+        db_session.add(Product(user_id=user.id, title="보증임박", warranty_end_date=today + timedelta(days=7)))
+    db_session.commit()
+    backfill_notification_offsets(db_session)
+    rebuild_alert_schedule(db_session)
+    # 첫 사용자는 일정은 남아 있지만 알림 설정 행이 없어 조회 join에서 빠집니다.
+    first_settings = db_session.exec(
+        select(NotificationSettings).where(NotificationSettings.user_id == users[0].id)
+    ).one()
+    db_session.delete(first_settings)
+    db_session.commit()
+
+    first = await run_daily_alerts(db_session, today=today, chunk_size=2)
+    assert (first.processed, first.done, first.cursor) == (1, False, users[1].id)
+
+    second = await run_daily_alerts(db_session, today=today, chunk_size=2)
+    assert (second.processed, second.done, second.cursor) == (1, True, users[2].id)
+    assert sorted(sent_to) == sorted(user.email for user in users[1:])
+
+
+@pytest.mark.anyio
+# 실패한 전송은 마지막 사용자까지 처리한 뒤 그 채널로만 다시 보내고, 시도 횟수 한도에서 멈추는지 확인합니다.
+async def test_run_daily_alerts_retries_failed_deliveries(db_session, monkeypatch) -> None:
+    today = date(2024, 1, 1)
+    settings = AppSettings(
+        SECRET_KEY="test",
+        SMTP_HOST="smtp.example.com",
+        SMTP_PORT=587,
+        SMTP_USERNAME="user",
+        SMTP_PASSWORD="pass",
+        SMTP_FROM="noreply@example.com",
+        TELEGRAM_BOT_TOKEN=None,
+        ALERT_DELIVERY_MAX_ATTEMPTS=3,
+    )
+    attempts: dict[str, int] = {}
+
+    async def flaky_send_email(to_addresses, *_args, **_kwargs):
+        address = to_addresses[0]
+        attempts[address] = attempts.get(address, 0) + 1
+        # flaky는 두 번째 시도에 성공하고, broken은 항상 실패합니다.
+        if address == "broken@example.com" or (address == "flaky@example.com" and attempts[address] == 1):
+            raise RuntimeError("smtp down")
+
+    monkeypatch.setattr("app.services.notification_service.get_settings", lambda: settings)
+    monkeypatch.setattr("app.services.notification_service.send_email", flaky_send_email)
+
+    users = [User(email=f"{name}@example.com", password_hash="x") for name in ("ok", "flaky", "broken")]
+    db_session.add_all(users)
+    db_session.commit()
+    for user in users:
+        db_session.add(NotificationSettings(user_id=user.id, warranty_days_before="[7]", refund_days_before="[]"))
+        db_session.add(Product(user_id=user.id, title="보증임박", warranty_end_date=today + timedelta(days=7)))
+    db_session.commit()
+    backfill_notification_offsets(db_session)
+    rebuild_alert_schedule(db_session)
+
+    first = await run_daily_alerts(db_session, today=today, chunk_size=10)
+    assert (first.processed, first.done) == (3, False)
+
+    calls = 1
+    while not (await run_daily_alerts(db_session, today=today, chunk_size=10)).done:
+        calls += 1
+        assert calls < 10
+
+    assert attempts == {"ok@example.com": 1, "flaky@example.com": 2, "broken@example.com": 3}
+    deliveries = {row.user_id: row for row in db_session.exec(select(AlertDelivery)).all()}
+    assert (deliveries[users[1].id].status, deliveries[users[1].id].attempts) == ("sent", 2)
+    assert (deliveries[users[2].id].status, deliveries[users[2].id].attempts) == ("failed", 3)
+
+
+# aiosqlite는 asyncio 루프에서만 동작하므로 asyncio 백엔드로만 실행합니다.
+@pytest.mark.anyio
+@pytest.mark.parametrize("anyio_backend", ["asyncio"])
+# cron 라우트처럼 AsyncSession을 넘겨도 같은 방식으로 처리/기록되는지 확인합니다.
+async def test_run_daily_alerts_with_async_session(db_session, test_async_engine, monkeypatch) -> None:
+    today = date(2024, 1, 1)
+    settings = AppSettings(
+        SECRET_KEY="test",
+        SMTP_HOST="smtp.example.com",
+        SMTP_PORT=587,
+        SMTP_USERNAME="user",
+        SMTP_PASSWORD="pass",
+        SMTP_FROM="noreply@example.com",
+        TELEGRAM_BOT_TOKEN=None,
+    )
+    sent_to: list[str] = []
+
+    async def fake_send_email(to_addresses, *_args, **_kwargs):
+        sent_to.extend(to_addresses)
+
+    monkeypatch.setattr("app.services.notification_service.get_settings", lambda: settings)
+    monkeypatch.setattr("app.services.notification_service.send_email", fake_send_email)
+
+    user = User(email="async@example.com", password_hash="x")
+    db_session.add(user)
+    db_session.commit()
+    db_session.add(NotificationSettings(user_id=user.id, warranty_days_before="[7]", refund_days_before="[]"))
+    db_session.add(Product(user_id=user.id, title="보증임박", warranty_end_date=today + timedelta(days=7)))
+    db_session.commit()
+    backfill_notification_offsets(db_session)
+    rebuild_alert_schedule(db_session)
+
+    async with AsyncSession(test_async_engine, expire_on_commit=False) as session:
+        summary = await run_daily_alerts(session, today=today, chunk_size=10)
+        repeated = await run_daily_alerts(session, today=today, chunk_size=10)
+    await test_async_engine.dispose()
+
+    assert (summary.processed, summary.done, summary.email_sent) == (1, True, 1)
+    assert (repeated.processed, repeated.done, repeated.cursor) == (0, True, user.id)
+    assert sent_to == ["async@example.com"]
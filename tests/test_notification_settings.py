@@ -1,6 +1,9 @@
 """NotificationSettings 관련 테스트."""
 
 from fastapi import status
+from sqlmodel import select
+
+from app.models.notification import NotificationOffset
 
 
 def _auth(client, email="notify@example.com", password="pw1234"):
@@ -49,3 +52,19 @@ def test_notification_settings_requires_auth(client):
 
     resp = client.get("/notification-settings")
     assert resp.status_code == status.HTTP_401_UNAUTHORIZED
+
+
+def test_notification_settings_sync_offsets_table(client, db_session):
+    """가입/수정 시 정규화된 notification_offset 행이 함께 갱신되는지 확인합니다."""
+
+    headers = _auth(client, email="notify3@example.com")
+    user_id = client.get("/notification-settings", headers=headers).json()["user_id"]
+
+    def _offsets():
+        rows = db_session.exec(select(NotificationOffset).where(NotificationOffset.user_id == user_id)).all()
+        return sorted((row.kind, row.days) for row in rows)
+
+    assert _offsets() == [("refund", 3), ("warranty", 3), ("warranty", 7), ("warranty", 30)]
+
+    client.put("/notification-settings", json={"warranty_days_before": [14, 14, 1]}, headers=headers)
+    assert _offsets() == [("refund", 3), ("warranty", 1), ("warranty", 14)]
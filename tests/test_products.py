@@ -4,6 +4,8 @@ from datetime import datetime
 
 from fastapi import status
 
+from app.models.product import Product
+
 
 def _auth(client, email="prod@example.com", password="pw1234"):
     client.post("/auth/register", json={"email": email, "password": password})
@@ -64,3 +66,203 @@ def test_product_requires_auth(client):
 
     resp = client.get("/products")
     assert resp.status_code == status.HTTP_401_UNAUTHORIZED
+
+
+def test_product_list_keyset_pagination(client):
+    """limit/cursor로 중복·누락 없이 전체 목록을 순회할 수 있는지 확인합니다."""
+
+    headers = _auth(client, email="page@example.com")
+    created_ids = [
+        client.post("/products", json={"title": f"상품{i}"}, headers=headers).json()["id"] for i in range(5)
+    ]
+
+    seen: list[int] = []
+    cursor = None
+    for _ in range(10):
+        params = {"limit": 2}
+        if cursor:
+            params["cursor"] = cursor
+        resp = client.get("/products", params=params, headers=headers)
+        assert resp.status_code == status.HTTP_200_OK
+        page = resp.json()
+        assert len(page) <= 2
+        seen.extend(p["id"] for p in page)
+        cursor = resp.headers.get("X-Next-Cursor")
+        if not cursor:
+            break
+
+    assert sorted(seen) == sorted(created_ids)
+    assert len(seen) == len(set(seen))
+
+
+def test_product_list_without_limit_returns_everything(client, monkeypatch):
+    """limit/cursor를 생략한 기존 클라이언트는 잘리지 않은 전체 목록을 받는지 확인합니다."""
+
+    from app.api.routes import products as products_route
+
+    monkeypatch.setattr(products_route, "DEFAULT_PAGE_LIMIT", 2)
+    headers = _auth(client, email="unbounded@example.com")
+    for i in range(3):
+        client.post("/products", json={"title": f"상품{i}"}, headers=headers)
+
+    everything = client.get("/products", headers=headers)
+    assert len(everything.json()) == 3
+    assert "X-Next-Cursor" not in everything.headers
+
+    first = client.get("/products", params={"limit": 2}, headers=headers)
+    rest = client.get("/products", params={"cursor": first.headers["X-Next-Cursor"]}, headers=headers)
+    assert len(rest.json()) == 1
+
+
+def test_product_list_filters_and_sort(client):
+    """인덱스 컬럼 필터와 정렬 옵션이 적용되는지 확인합니다."""
+
+    headers = _auth(client, email="filter@example.com")
+    client.post(
+        "/products",
+        json={"title": "A", "store": "상점1", "warranty_end_date": "2025-01-10"},
+        headers=headers,
+    )
+    client.post(
+        "/products",
+        json={"title": "B", "store": "상점2", "warranty_end_date": "2025-06-10"},
+        headers=headers,
+    )
+    client.post("/products", json={"title": "C", "store": "상점1"}, headers=headers)
+
+    by_store = client.get("/products", params={"store": "상점1"}, headers=headers).json()
+    assert sorted(p["title"] for p in by_store) == ["A", "C"]
+
+    by_range = client.get(
+        "/products",
+        params={"warranty_end_from": "2025-05-01", "warranty_end_to": "2025-12-31"},
+        headers=headers,
+    ).json()
+    assert [p["title"] for p in by_range] == ["B"]
+
+    ascending = client.get("/products", params={"sort": "created_at", "order": "asc"}, headers=headers).json()
+    assert [p["title"] for p in ascending] == ["A", "B", "C"]
+
+
+def test_product_list_invalid_cursor(client):
+    """해석할 수 없는 커서는 400을 반환하는지 확인합니다."""
+
+    headers = _auth(client, email="cursor@example.com")
+    resp = client.get("/products", params={"cursor": "not-a-cursor"}, headers=headers)
+    assert resp.status_code == status.HTTP_400_BAD_REQUEST
+
+
+def test_product_list_summary_and_fields_projection(client):
+    """view=summary/fields 파라미터가 raw_text 없이 필요한 필드만 반환하는지 확인합니다."""
+
+    headers = _auth(client, email="projection@example.com")
+    client.post(
+        "/products",
+        json={"title": "요약상품", "store": "상점", "raw_text": "긴 OCR 원문", "image_path": "uploads/a.jpg"},
+        headers=headers,
+    )
+
+    summary = client.get("/products", params={"view": "summary"}, headers=headers)
+    assert summary.status_code == status.HTTP_200_OK
+    item = summary.json()[0]
+    assert item["title"] == "요약상품"
+    assert "raw_text" not in item
+    assert "image_path" not in item
+
+    projected = client.get("/products", params={"fields": "title,store"}, headers=headers)
+    assert projected.status_code == status.HTTP_200_OK
+    assert projected.json() == [{"id": item["id"], "title": "요약상품", "store": "상점"}]
+
+    unknown = client.get("/products", params={"fields": "title,password_hash"}, headers=headers)
+    assert unknown.status_code == status.HTTP_400_BAD_REQUEST
+
+
+def test_product_search_ngram(client):
+    """n-gram 전문 검색이 부분 단어/다른 필드/소유자 범위를 지키는지 확인합니다."""
+
+    headers = _auth(client, email="search@example.com")
+    other = _auth(client, email="search-other@example.com")
+
+    earphone = client.post(
+        "/products", json={"title": "무선이어폰 프로", "store": "전자랜드"}, headers=headers
+    ).json()
+    laptop = client.post(
+        "/products",
+        json={"title": "노트북", "raw_text": "주문번호 A-1 카드번호: 1234-5678-9012-3456"},
+        headers=headers,
+    ).json()
+    client.post("/products", json={"title": "무선이어폰"}, headers=other)
+
+    found = client.get("/products/search", params={"q": "이어폰"}, headers=headers)
+    assert found.status_code == status.HTTP_200_OK
+    assert [p["id"] for p in found.json()] == [earphone["id"]]
+    assert "raw_text" not in found.json()[0]
+
+    by_store = client.get("/products/search", params={"q": "전자"}, headers=headers).json()
+    assert [p["id"] for p in by_store] == [earphone["id"]]
+
+    by_raw_text = client.get("/products/search", params={"q": "주문번호"}, headers=headers).json()
+    assert [p["id"] for p in by_raw_text] == [laptop["id"]]
+
+    # 마스킹된 원문만 인덱싱되므로 카드번호 원문으로는 검색되지 않습니다.
+    by_card = client.get("/products/search", params={"q": "5678"}, headers=headers).json()
+    assert by_card == []
+
+    # 수정/삭제가 인덱스에 반영되는지 확인합니다.
+    client.put(f"/products/{laptop['id']}", json={"title": "태블릿"}, headers=headers)
+    assert [p["id"] for p in client.get("/products/search", params={"q": "태블릿"}, headers=headers).json()] == [
+        laptop["id"]
+    ]
+    client.delete(f"/products/{earphone['id']}", headers=headers)
+    assert client.get("/products/search", params={"q": "이어폰"}, headers=headers).json() == []
+
+
+def test_product_conditional_get(client):
+    """ETag로 재검증하면 변경이 없을 때 304, 변경 후에는 200을 반환하는지 확인합니다."""
+
+    headers = _auth(client, email="etag@example.com")
+    pid = client.post("/products", json={"title": "캐시상품"}, headers=headers).json()["id"]
+
+    first = client.get(f"/products/{pid}", headers=headers)
+    etag = first.headers["etag"]
+    assert first.headers["last-modified"]
+
+    cached = client.get(f"/products/{pid}", headers={**headers, "If-None-Match": etag})
+    assert cached.status_code == status.HTTP_304_NOT_MODIFIED
+    assert cached.content == b""
+
+    client.put(f"/products/{pid}", json={"store": "변경"}, headers=headers)
+    changed = client.get(f"/products/{pid}", headers={**headers, "If-None-Match": etag})
+    assert changed.status_code == status.HTTP_200_OK
+    assert changed.headers["etag"] != etag
+
+    listed = client.get("/products", headers=headers)
+    list_etag = listed.headers["etag"]
+    not_modified = client.get("/products", headers={**headers, "If-None-Match": list_etag})
+    assert not_modified.status_code == status.HTTP_304_NOT_MODIFIED
+
+    client.delete(f"/products/{pid}", headers=headers)
+    after_delete = client.get("/products", headers={**headers, "If-None-Match": list_etag})
+    assert after_delete.status_code == status.HTTP_200_OK
+    assert after_delete.json() == []
+
+
+def test_product_list_etag_tracks_ids_and_checks_cursor(client, db_session):
+    """삭제 후 같은 개수/수정 시각으로 다시 만들어도 ETag가 바뀌고, 잘못된 커서는 304 대신 400인지 확인합니다."""
+
+    headers = _auth(client, email="list-etag@example.com")
+    pid = client.post("/products", json={"title": "원래상품"}, headers=headers).json()["id"]
+    listed = client.get("/products", headers=headers)
+    list_etag = listed.headers["etag"]
+
+    invalid = client.get("/products", params={"cursor": "not-a-cursor"}, headers={**headers, "If-None-Match": "*"})
+    assert invalid.status_code == status.HTTP_400_BAD_REQUEST
+
+    original = db_session.get(Product, pid)
+    db_session.add(Product(user_id=original.user_id, title="새상품", updated_at=original.updated_at))
+    db_session.delete(original)
+    db_session.commit()
+
+    replaced = client.get("/products", headers={**headers, "If-None-Match": list_etag})
+    assert replaced.status_code == status.HTTP_200_OK
+    assert [p["title"] for p in replaced.json()] == ["새상품"]
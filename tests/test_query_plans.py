@@ -0,0 +1,59 @@
+"""실제 조회 패턴이 복합 인덱스를 사용하는지 SQLite 실행 계획으로 검증합니다."""
+
+from datetime import date
+
+from sqlmodel import select
+
+from app.models.document import Document
+from app.models.job import DocumentProcessingJob
+from app.models.product import Product
+
+
+# 문장을 EXPLAIN QUERY PLAN으로 실행해 계획 설명을 한 문자열로 반환합니다.
+def _query_plan(engine, statement) -> str:
+    sql = str(statement.compile(engine, compile_kwargs={"literal_binds": True}))
+    with engine.connect() as connection:
+        rows = connection.exec_driver_sql(f"EXPLAIN QUERY PLAN {sql}").all()
+    return " | ".join(row[-1] for row in rows)
+
+
+# 사용자별 보증/환불 기한 범위 조회가 (user_id, 날짜) 인덱스를 쓰는지 확인합니다.
+def test_product_deadline_filters_use_composite_indexes(test_engine) -> None:
+    warranty = select(Product).where(
+        Product.user_id == 1,
+        Product.warranty_end_date >= date(2024, 1, 1),
+        Product.warranty_end_date <= date(2024, 12, 31),
+    )
+    assert "ix_product_user_warranty_end" in _query_plan(test_engine, warranty)
+
+    refund = select(Product).where(Product.user_id == 1, Product.refund_deadline <= date(2024, 1, 31))
+    assert "ix_product_user_refund_deadline" in _query_plan(test_engine, refund)
+
+
+# 목록 키셋 페이지가 인덱스 순서대로 읽혀 별도 정렬이 없는지 확인합니다.
+def test_product_list_page_is_sorted_by_index(test_engine) -> None:
+    statement = (
+        select(Product)
+        .where(Product.user_id == 1)
+        .order_by(Product.updated_at.desc(), Product.id.desc())
+        .limit(51)
+    )
+    plan = _query_plan(test_engine, statement)
+    assert "ix_product_user_updated_id" in plan
+    assert "TEMP B-TREE" not in plan
+
+
+# 문서 해시 조회와 Job 상태 조회가 각 복합 인덱스를 쓰는지 확인합니다.
+def test_document_hash_and_job_status_use_composite_indexes(test_engine) -> None:
+    duplicate = select(Document.id).where(Document.user_id == 1, Document.content_hash == "a" * 64)
+    assert "ix_document_user_content_hash" in _query_plan(test_engine, duplicate)
+
+    stale = (
+        select(DocumentProcessingJob.id)
+        .where(DocumentProcessingJob.status == "pending")
+        .order_by(DocumentProcessingJob.updated_at)
+    )
+    plan = _query_plan(test_engine, stale)
+    assert "ix_job_status_updated" in plan
+    assert "TEMP B-TREE" not in plan
+
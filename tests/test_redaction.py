@@ -1,6 +1,6 @@
 """민감정보 마스킹 유틸 테스트 모듈입니다."""
 
-from app.core.redaction import redact_text
+from app.core.redaction import iter_redact, redact_file, redact_text
 
 
 # 카드번호 마스킹을 확인합니다.
@@ -98,3 +98,29 @@ def test_redact_strict_luhn_fail():
     text = "코드 4111111111111112"
     redacted = redact_text(text, strict=True)
     assert "4111111111111112" in redacted
+
+
+# 스트리밍 마스킹이 개행을 보존하는지 확인합니다.
+def test_iter_redact_preserves_line_endings():
+    """iter_redact는 줄 단위로 마스킹하고 각 줄의 개행을 유지합니다."""
+    lines = iter(["전화: 01012345678\r\n", "금액 1,600\n", "승인번호: 99887766"])
+    redacted = list(iter_redact(lines))
+    assert len(redacted) == 3
+    assert redacted[0].endswith("5678\r\n")
+    assert "01012345678" not in redacted[0]
+    assert redacted[1] == "금액 1,600\n"
+    assert "99887766" not in redacted[2]
+
+
+# 파일 간 마스킹 결과가 redact_text와 같은지 확인합니다.
+def test_redact_file_matches_redact_text(tmp_path):
+    """redact_file은 파일을 줄 단위로 마스킹해 대상 파일에 기록합니다."""
+    text = "카드번호: 1234-5678-9012-3456\n문의: user@example.com\n"
+    source = tmp_path / "source.log"
+    destination = tmp_path / "redacted.log"
+    source.write_text(text, encoding="utf-8")
+
+    count = redact_file(source, destination)
+
+    assert count == 2
+    assert destination.read_text(encoding="utf-8") == redact_text(text) + "\n"
@@ -0,0 +1,108 @@
+"""앱 내장 스케줄러와 리더 잠금 동작을 검증합니다."""
+
+from datetime import date, timedelta
+
+import pytest
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.core.config import AppSettings
+from app.core.time import utc_now
+from app.models.scheduler_lock import SchedulerLock
+from app.services.notification_service import DailyAlertsSummary
+from app.services.scheduler import (
+    DAILY_ALERTS_JOB,
+    acquire_leader_lock,
+    create_scheduler,
+    release_leader_lock,
+    run_scheduled_daily_alerts,
+)
+
+
+# 스케줄러는 AsyncIOScheduler(asyncio 루프)에서만 실행되므로 asyncio 백엔드만 사용합니다.
+@pytest.fixture
+def anyio_backend() -> str:
+    return "asyncio"
+
+
+def _settings(**overrides) -> AppSettings:
+    return AppSettings(SECRET_KEY="test", **overrides)
+
+
+def _summary(processed: int, done: bool) -> DailyAlertsSummary:
+    return DailyAlertsSummary(
+        date=date(2024, 1, 1),
+        processed=processed,
+        email_targets=0,
+        telegram_targets=0,
+        email_sent=0,
+        telegram_sent=0,
+        skipped={"email": False, "telegram": False, "reason": None},
+        errors=[],
+        done=done,
+    )
+
+
+# 한 프로세스가 잠금을 가진 동안 다른 프로세스는 잡을 수 없고, 해제/만료 후에는 잡을 수 있는지 확인합니다.
+def test_leader_lock_allows_single_owner(db_session) -> None:
+    assert acquire_leader_lock(db_session, "job", "a", ttl_seconds=60) is True
+    assert acquire_leader_lock(db_session, "job", "b", ttl_seconds=60) is False
+    # 이미 가진 프로세스는 연장할 수 있습니다.
+    assert acquire_leader_lock(db_session, "job", "a", ttl_seconds=60) is True
+
+    release_leader_lock(db_session, "job", "a")
+    assert acquire_leader_lock(db_session, "job", "b", ttl_seconds=60) is True
+
+    lock = db_session.get(SchedulerLock, "job")
+    lock.locked_until = utc_now() - timedelta(seconds=1)
+    db_session.add(lock)
+    db_session.commit()
+    assert acquire_leader_lock(db_session, "job", "a", ttl_seconds=60) is True
+
+
+@pytest.mark.anyio
+# 리더가 되면 done이 될 때까지 chunk를 반복 실행하고 잠금을 해제하는지 확인합니다.
+async def test_scheduled_run_processes_all_chunks(db_session, test_async_engine, monkeypatch) -> None:
+    monkeypatch.setattr("app.core.db.get_async_engine", lambda: test_async_engine)
+    results = iter([_summary(2, False), _summary(1, True)])
+    calls = []
+
+    async def fake_run_daily_alerts(session, **kwargs):
+        # 이벤트 루프를 막지 않도록 비동기 세션으로 실행되어야 합니다.
+        assert isinstance(session, AsyncSession)
+        calls.append(kwargs)
+        return next(results)
+
+    monkeypatch.setattr("app.services.scheduler.run_daily_alerts", fake_run_daily_alerts)
+
+    processed = await run_scheduled_daily_alerts(_settings(), owner="leader")
+    assert processed == 3
+    assert len(calls) == 2
+
+    lock = db_session.get(SchedulerLock, DAILY_ALERTS_JOB)
+    assert lock.owner == "leader"
+    assert lock.locked_until is None
+
+
+@pytest.mark.anyio
+# 다른 프로세스가 잠금을 가진 경우 실행하지 않는지 확인합니다.
+async def test_scheduled_run_skips_without_lock(db_session, test_async_engine, monkeypatch) -> None:
+    monkeypatch.setattr("app.core.db.get_async_engine", lambda: test_async_engine)
+    assert acquire_leader_lock(db_session, DAILY_ALERTS_JOB, "other", ttl_seconds=60)
+
+    async def fail_run_daily_alerts(*_args, **_kwargs):
+        raise AssertionError("잠금이 없으면 실행되면 안 됩니다.")
+
+    monkeypatch.setattr("app.services.scheduler.run_daily_alerts", fail_run_daily_alerts)
+    assert await run_scheduled_daily_alerts(_settings(), owner="follower") == 0
+
+
+# 설정한 시각/시간대로 작업이 등록되는지 확인합니다.
+def test_create_scheduler_registers_daily_job() -> None:
+    scheduler = create_scheduler(_settings(DAILY_ALERTS_TIME="08:30", SCHEDULER_TIMEZONE="Asia/Seoul"))
+    job = scheduler.get_job(DAILY_ALERTS_JOB)
+    assert job is not None
+    assert str(job.trigger) == "cron[hour='8', minute='30']"
+    assert str(job.trigger.timezone) == "Asia/Seoul"
+
+    with pytest.raises(ValueError):
+        create_scheduler(_settings(DAILY_ALERTS_TIME="25:00"))
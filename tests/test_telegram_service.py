@@ -0,0 +1,46 @@
+"""텔레그램 발송기 동작을 검증합니다."""
+
+import httpx
+import pytest
+
+from app.services.telegram_service import TelegramRateLimitError, TelegramSender
+
+
+@pytest.mark.anyio
+# 여러 메시지를 보내도 같은 클라이언트(커넥션 풀)를 재사용하는지 확인합니다.
+async def test_sender_reuses_client() -> None:
+    requests: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(200, json={"ok": True})
+
+    sender = TelegramSender("token", transport=httpx.MockTransport(handler))
+    await sender.send_message(1, "a")
+    client = sender._client
+    await sender.send_message(2, "b", parse_mode="MarkdownV2")
+
+    assert sender._client is client
+    assert [request.url.path for request in requests] == ["/bottoken/sendMessage"] * 2
+    assert b'"parse_mode":"MarkdownV2"' in requests[1].content.replace(b" ", b"")
+
+    await sender.close()
+    assert sender._client is None
+
+
+@pytest.mark.anyio
+# 429 응답은 retry_after를 담은 예외로, 그 밖의 오류는 HTTP 예외로 알리는지 확인합니다.
+async def test_sender_raises_on_error_responses() -> None:
+    def handler(request: httpx.Request) -> httpx.Response:
+        if b'"chat_id": 1' in request.content or b'"chat_id":1' in request.content:
+            return httpx.Response(429, json={"ok": False, "parameters": {"retry_after": 5}})
+        return httpx.Response(400, json={"ok": False})
+
+    sender = TelegramSender("token", transport=httpx.MockTransport(handler))
+    with pytest.raises(TelegramRateLimitError) as exc_info:
+        await sender.send_message(1, "a")
+    assert exc_info.value.retry_after == 5
+
+    with pytest.raises(httpx.HTTPStatusError):
+        await sender.send_message(2, "b")
+    await sender.close()